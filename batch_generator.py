@@ -0,0 +1,529 @@
+import argparse
+import csv
+import json
+import os
+import re
+import time
+import traceback
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+
+import openpyxl
+
+from excel_generator import (
+    create_advanced_business_trip_report_bytes,
+    create_business_trip_application_bytes,
+    fill_advanced_business_trip_report,
+    fill_trip_summary_sheet
+)
+
+# 출장 단위로 공통 적용되는 필드 (직원별 값이 없으면 출장 값 사용)
+TRIP_LEVEL_FIELDS = [
+    'project_manager', 'project_name', 'destination',
+    'start_date', 'start_time', 'end_date', 'end_time', 'trip_purpose',
+    'holiday_days', 'special_days', 'dangerous_days'
+]
+
+# 자동 계산으로 채워지는 비용 필드
+EXPENSE_FIELDS = [
+    'position', 'trip_days', 'daily_allowance_per_day', 'meal_cost_per_day',
+    'daily_allowance_total', 'meal_cost_total'
+]
+
+# 시트 이름에 사용할 수 없는 문자
+INVALID_SHEET_CHARS = re.compile(r'[\[\]\:\*\?\/\\]')
+
+def parse_date(value):
+    """'YYYY-MM-DD' 또는 'YYYY.MM.DD' 문자열을 date 객체로 변환"""
+    if hasattr(value, 'strftime'):
+        return value
+    text = str(value).strip().replace('.', '-').replace('/', '-')
+    return datetime.strptime(text, '%Y-%m-%d').date()
+
+def parse_time(value):
+    """'HH:MM' 또는 'HH:MM:SS' 문자열을 time 객체로 변환"""
+    if hasattr(value, 'strftime'):
+        return value
+    text = str(value).strip()
+    for fmt in ('%H:%M', '%H:%M:%S'):
+        try:
+            return datetime.strptime(text, fmt).time()
+        except ValueError:
+            continue
+    raise ValueError(f"시간 형식 오류: {value}")
+
+def normalize_employee(employee, trip):
+    """직원 데이터에 출장 공통 정보를 채우고 비용 항목을 자동 계산"""
+    if isinstance(employee, str):
+        employee = {'employee_name': employee}
+
+    emp_data = {field: trip.get(field) for field in TRIP_LEVEL_FIELDS if field in trip}
+    emp_data.update({key: value for key, value in employee.items() if value not in (None, '')})
+
+    emp_data.setdefault('start_time', '09:00')
+    emp_data.setdefault('end_time', '18:00')
+    emp_data['start_date'] = parse_date(emp_data['start_date'])
+    emp_data['end_date'] = parse_date(emp_data.get('end_date', emp_data['start_date']))
+    emp_data['start_time'] = parse_time(emp_data['start_time'])
+    emp_data['end_time'] = parse_time(emp_data['end_time'])
+
+    for field in ('project_manager', 'project_name', 'destination', 'trip_purpose'):
+        emp_data.setdefault(field, '')
+    for field in ('holiday_days', 'special_days', 'dangerous_days'):
+        emp_data[field] = int(emp_data.get(field) or 0)
+
+    # 비용 항목이 빠져 있으면 직급별 출장비로 자동 계산
+    if any(field not in emp_data for field in EXPENSE_FIELDS):
+        from employee_manager import employee_manager
+
+        expenses = employee_manager.calculate_trip_expenses(
+            emp_data['employee_name'],
+            emp_data['start_date'], emp_data['start_time'],
+            emp_data['end_date'], emp_data['end_time']
+        )
+        if not expenses:
+            raise ValueError(f"직원 정보를 찾을 수 없습니다: {emp_data['employee_name']}")
+
+        emp_data.setdefault('position', expenses['employee_info']['position'])
+        emp_data.setdefault('trip_days', expenses['trip_days'])
+        emp_data.setdefault('daily_allowance_per_day', expenses['daily_allowance_per_day'])
+        emp_data.setdefault('meal_cost_per_day', expenses['meal_cost_per_day'])
+        emp_data.setdefault('daily_allowance_total', expenses['daily_allowance_total'])
+        emp_data.setdefault('meal_cost_total', expenses['meal_cost_total'])
+
+    for field in EXPENSE_FIELDS[1:]:
+        emp_data[field] = int(emp_data[field])
+
+    return emp_data
+
+def normalize_trip(trip, index=0):
+    """
+    출장 1건의 입력 데이터를 create_advanced_business_trip_report 형식으로 변환
+
+    Args:
+        trip: {'employees': [...], 'additional_costs': [...], 'filename': ...} 형태의 딕셔너리
+              (project_name, destination 등 공통 필드는 출장 단위로 지정 가능)
+        index: 파일명 자동 생성용 순번
+
+    Returns:
+        dict: {'name', 'filename', 'employees_data', 'additional_costs'}
+    """
+    employees = trip.get('employees', [])
+    if not employees:
+        raise ValueError(f"{index + 1}번째 출장에 출장자가 없습니다.")
+
+    employees_data = [normalize_employee(employee, trip) for employee in employees]
+    additional_costs = [
+        {
+            'item': cost['item'],
+            'payment_method': cost.get('payment_method', ''),
+            'amount': int(cost['amount'])
+        }
+        for cost in trip.get('additional_costs', [])
+    ]
+
+    first_emp = employees_data[0]
+    name = trip.get('name') or f"{first_emp['destination']}_{first_emp['start_date'].strftime('%Y%m%d')}"
+    filename = trip.get('filename') or f"출장복명서_{name}_{index + 1:03d}.xlsx"
+
+    return {
+        'name': name,
+        'filename': filename,
+        'employees_data': employees_data,
+        'additional_costs': additional_costs
+    }
+
+def load_trips_from_json(path):
+    """JSON 파일에서 출장 목록 로드 (리스트 또는 {'trips': [...]} 형태)"""
+    with open(path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+
+    if isinstance(data, dict):
+        data = data.get('trips', [])
+    return data
+
+def load_trips_from_csv(path, encoding='utf-8-sig'):
+    """
+    CSV 파일에서 출장 목록 로드
+
+    한 행이 출장자 1명이며 trip_id 컬럼으로 같은 출장을 묶는다.
+    cost_item 컬럼이 채워진 행은 추가 비용 행으로 처리한다
+    (cost_item, cost_payment_method, cost_amount).
+    """
+    trips = {}
+
+    with open(path, 'r', encoding=encoding, newline='') as f:
+        for row in csv.DictReader(f):
+            row = {key.strip(): (value or '').strip() for key, value in row.items() if key}
+            trip_id = row.get('trip_id') or str(len(trips) + 1)
+
+            if trip_id not in trips:
+                trips[trip_id] = {'name': row.get('trip_name', ''), 'employees': [], 'additional_costs': []}
+            trip = trips[trip_id]
+
+            # 출장 공통 정보는 처음 나온 값을 사용
+            for field in TRIP_LEVEL_FIELDS:
+                if row.get(field) and field not in trip:
+                    trip[field] = row[field]
+
+            if row.get('cost_item'):
+                trip['additional_costs'].append({
+                    'item': row['cost_item'],
+                    'payment_method': row.get('cost_payment_method', ''),
+                    'amount': row.get('cost_amount') or 0
+                })
+            elif row.get('employee_name'):
+                employee = {'employee_name': row['employee_name']}
+                for field in EXPENSE_FIELDS:
+                    if row.get(field):
+                        employee[field] = row[field]
+                trip['employees'].append(employee)
+
+    return list(trips.values())
+
+def load_trips(path, encoding='utf-8-sig'):
+    """확장자에 따라 CSV 또는 JSON 출장 목록 로드"""
+    if path.lower().endswith('.csv'):
+        return load_trips_from_csv(path, encoding)
+    return load_trips_from_json(path)
+
+# 다중 시트 워크북의 요약 시트 이름 (출장 시트 이름과 겹치지 않도록 예약)
+SUMMARY_SHEET_TITLE = '요약'
+
+def make_sheet_title(name, used_titles):
+    """엑셀 시트 이름 규칙(31자, 특수문자 금지, 중복 금지)에 맞는 이름 생성"""
+    base = INVALID_SHEET_CHARS.sub('_', str(name)).strip() or "출장복명서"
+    base = base[:31]
+    title = base
+    suffix = 2
+    while title in used_titles:
+        tail = f"_{suffix}"
+        title = base[:31 - len(tail)] + tail
+        suffix += 1
+    used_titles.add(title)
+    return title
+
+def render_document(job):
+    """
+    문서 1건을 렌더링하여 xlsx 바이트로 반환
+
+    Args:
+        job: {'type': 'report', 'trip': {...}, 'index': n} 또는
+             {'type': 'application', 'application_data': {...}, 'filename': ...}
+             ('format': 'pdf'이면 PDF로 생성)
+
+    Returns:
+        tuple: (파일명, 출장자 수, 문서 바이트)
+    """
+    index = job.get('index', 0)
+
+    if job.get('format') == 'pdf':
+        from pdf_export import create_advanced_business_trip_report_pdf, create_business_trip_application_pdf
+
+    if job.get('type', 'report') == 'application':
+        application_data = job['application_data']
+        if job.get('format') == 'pdf':
+            content = create_business_trip_application_pdf(application_data)
+        elif job.get('engine') == 'template':
+            from template_engine import render_application_from_template
+            content = render_application_from_template(application_data)
+        elif job.get('engine') == 'direct':
+            from xlsx_writer import create_business_trip_application_direct
+            content = create_business_trip_application_direct(application_data)
+        else:
+            content = create_business_trip_application_bytes(application_data)
+        filename = job.get('filename') or f"출장신청서_{application_data.get('destination', '')}_{index + 1:03d}.xlsx"
+        travelers = len(application_data.get('travelers', []))
+    else:
+        report = normalize_trip(job['trip'], index)
+        if job.get('format') == 'pdf':
+            content = create_advanced_business_trip_report_pdf(report['employees_data'], report['additional_costs'])
+        elif job.get('engine') == 'direct':
+            from xlsx_writer import create_advanced_business_trip_report_direct
+            content = create_advanced_business_trip_report_direct(report['employees_data'], report['additional_costs'])
+        else:
+            content = create_advanced_business_trip_report_bytes(report['employees_data'], report['additional_costs'])
+        filename = report['filename']
+        travelers = len(report['employees_data'])
+
+    if job.get('format') == 'pdf':
+        filename = f"{os.path.splitext(filename)[0]}.pdf"
+    return filename, travelers, content
+
+def render_document_safe(job):
+    """render_document 실행 결과와 소요시간, 오류(와 traceback)를 딕셔너리로 반환 (워커 프로세스용)"""
+    doc_start = time.perf_counter()
+    try:
+        filename, travelers, content = render_document(job)
+        return {
+            'index': job.get('index', 0),
+            'name': filename,
+            'travelers': travelers,
+            'content': content,
+            'error': None,
+            'traceback': None,
+            'seconds': time.perf_counter() - doc_start,
+            'worker_pid': os.getpid()
+        }
+    except Exception as e:
+        return {
+            'index': job.get('index', 0),
+            'name': None,
+            'travelers': 0,
+            'content': None,
+            'error': f"{type(e).__name__}: {e}",
+            'traceback': traceback.format_exc(),
+            'seconds': time.perf_counter() - doc_start,
+            'worker_pid': os.getpid()
+        }
+
+def render_documents_parallel(jobs, max_workers=None, chunksize=1):
+    """
+    ProcessPoolExecutor로 여러 문서를 병렬 렌더링
+
+    결과는 입력 순서와 같은 순서로 반환되며, 문서별 오류는 예외 대신
+    결과의 'error' 항목에 기록된다.
+
+    Args:
+        jobs: render_document 작업 리스트
+        max_workers: 워커 프로세스 수 (None이면 CPU 수, 1이면 현재 프로세스에서 순차 실행)
+        chunksize: 워커에 한 번에 전달할 작업 수
+
+    Returns:
+        list: render_document_safe 결과 리스트
+    """
+    jobs = [dict(job, index=job.get('index', i)) for i, job in enumerate(jobs)]
+
+    if max_workers == 1 or len(jobs) <= 1:
+        return [render_document_safe(job) for job in jobs]
+
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(render_document_safe, jobs, chunksize=chunksize))
+
+def generate_reports_batch(trips, output_path, mode='zip', workers=1, engine='code', output_format='xlsx'):
+    """
+    여러 출장의 출장복명서를 한 번에 생성
+
+    Args:
+        trips: 출장 데이터 리스트 (normalize_trip 입력 형식)
+        output_path: 출력 파일 경로 (.zip 또는 .xlsx)
+        mode: 'zip' (출장별 xlsx 파일을 ZIP으로 묶음) 또는 'sheets' (한 워크북에 시트별로 작성)
+        workers: zip 모드의 워커 프로세스 수 (1이면 순차 실행, None이면 CPU 수)
+        engine: 렌더링 방식 ('code' 또는 'direct': xlsx_writer로 직접 저장)
+        output_format: zip 모드의 문서 형식 ('xlsx' 또는 'pdf')
+
+    Returns:
+        dict: 출력 경로, 문서별 소요시간, 전체 처리량 정보
+    """
+    jobs = [
+        {'type': 'report', 'trip': trip, 'index': i, 'engine': engine, 'format': output_format}
+        for i, trip in enumerate(trips)
+    ]
+    return generate_documents_batch(jobs, output_path, mode, workers, engine)
+
+def summarize_report(report, sheet_title):
+    """요약 시트에 들어갈 출장 1건의 요약 (시트 이름, 출장지, 기간, 금액 합계)"""
+    employees_data = report['employees_data']
+    first_emp = employees_data[0]
+    return {
+        'sheet_title': sheet_title,
+        'project_name': first_emp['project_name'],
+        'destination': first_emp['destination'],
+        'start_date': min(emp['start_date'] for emp in employees_data),
+        'end_date': max(emp['end_date'] for emp in employees_data),
+        'travelers': len(employees_data),
+        'employee_total': sum(emp['daily_allowance_total'] + emp['meal_cost_total'] for emp in employees_data),
+        'additional_total': sum(cost['amount'] for cost in report['additional_costs'])
+    }
+
+def write_reports_workbook(jobs, output_path, engine='code'):
+    """
+    출장복명서 여러 건을 출장별 시트 + 요약 시트로 된 워크북 하나로 저장
+
+    engine이 'direct'이면 xlsx_writer 워크북에 작성하여 모든 시트가 스타일 테이블 하나를
+    공유하고, 파일은 마지막에 한 번만 직렬화한다.
+
+    Returns:
+        list: 문서별 결과 (generate_documents_batch의 documents 형식)
+    """
+    if engine == 'direct':
+        from xlsx_writer import GridWorkbook
+        wb = GridWorkbook()
+    else:
+        wb = openpyxl.Workbook()
+        wb.remove(wb.active)
+    used_titles = {SUMMARY_SHEET_TITLE}
+    documents = []
+    summaries = []
+
+    for job in jobs:
+        doc_start = time.perf_counter()
+        ws = None
+        try:
+            report = normalize_trip(job['trip'], job['index'])
+            ws = wb.create_sheet(make_sheet_title(report['name'], used_titles))
+            fill_advanced_business_trip_report(ws, report['employees_data'], report['additional_costs'])
+            summaries.append(summarize_report(report, ws.title))
+            name, travelers, error, error_traceback = ws.title, len(report['employees_data']), None, None
+        except Exception as e:
+            # 작성 중 실패한 시트는 워크북에서 제거
+            if ws is not None:
+                wb.remove(ws)
+            name, travelers, error, error_traceback = None, 0, f"{type(e).__name__}: {e}", traceback.format_exc()
+
+        documents.append({
+            'name': name,
+            'travelers': travelers,
+            'seconds': time.perf_counter() - doc_start,
+            'bytes': None,
+            'error': error,
+            'traceback': error_traceback,
+            'worker_pid': os.getpid()
+        })
+
+    fill_trip_summary_sheet(wb.create_sheet(SUMMARY_SHEET_TITLE, 0), summaries)
+
+    # 시트 작성 이후 한 번만 저장
+    if engine == 'direct':
+        from xlsx_writer import write_xlsx
+        with open(output_path, 'wb') as f:
+            f.write(write_xlsx(wb))
+    else:
+        wb.save(output_path)
+    return documents
+
+def generate_applications_batch(applications, output_path, workers=1, engine='code', output_format='xlsx'):
+    """
+    여러 출장신청서를 한 번에 생성하여 ZIP으로 묶음
+
+    engine이 'template'이면 템플릿 워크북을 복제하여 데이터 셀만 채우고,
+    'direct'이면 openpyxl 워크북 없이 xlsx_writer로 직접 저장한다.
+    output_format이 'pdf'이면 engine과 관계없이 PDF로 생성한다.
+    """
+    jobs = [
+        {
+            'type': 'application',
+            'application_data': application,
+            'filename': application.get('filename'),
+            'engine': engine,
+            'format': output_format,
+            'index': i
+        }
+        for i, application in enumerate(applications)
+    ]
+    return generate_documents_batch(jobs, output_path, 'zip', workers)
+
+def generate_documents_batch(jobs, output_path, mode='zip', workers=1, engine='code'):
+    """문서 작업 리스트를 ZIP 또는 다중 시트 워크북으로 생성 (engine은 sheets 모드의 워크북 작성 방식)"""
+    if mode not in ('zip', 'sheets'):
+        raise ValueError(f"지원하지 않는 모드입니다: {mode}")
+
+    batch_start = time.perf_counter()
+    documents = []
+
+    if mode == 'zip':
+        results = render_documents_parallel(jobs, max_workers=workers)
+
+        with zipfile.ZipFile(output_path, 'w', compression=zipfile.ZIP_DEFLATED) as zf:
+            used_names = set()
+            for result in results:
+                if result['error'] is None:
+                    # 같은 파일명이 있으면 순번을 붙여 구분
+                    arcname = result['name']
+                    if arcname in used_names:
+                        root, ext = os.path.splitext(arcname)
+                        arcname = f"{root}_{result['index'] + 1}{ext}"
+                    used_names.add(arcname)
+                    zf.writestr(arcname, result['content'])
+                    result['name'] = arcname
+
+                documents.append({
+                    'name': result['name'],
+                    'travelers': result['travelers'],
+                    'seconds': result['seconds'],
+                    'bytes': len(result['content']) if result['content'] is not None else None,
+                    'error': result['error'],
+                    'traceback': result['traceback'],
+                    'worker_pid': result['worker_pid']
+                })
+    else:
+        documents = write_reports_workbook(jobs, output_path, engine)
+
+    total_seconds = time.perf_counter() - batch_start
+    succeeded = [doc for doc in documents if doc['error'] is None]
+
+    return {
+        'output_path': os.path.abspath(output_path),
+        'mode': mode,
+        'documents': documents,
+        'failed': len(documents) - len(succeeded),
+        'total_seconds': total_seconds,
+        'documents_per_second': len(succeeded) / total_seconds if total_seconds > 0 else 0.0
+    }
+
+def print_batch_summary(result, verbose=False):
+    """배치 생성 결과 (문서별 소요시간, 처리량) 출력 (verbose이면 실패한 문서의 traceback 포함)"""
+    for index, doc in enumerate(result['documents']):
+        if doc['error']:
+            print(f"  - [{index + 1}] 생성 실패: {doc['error']}")
+            if verbose and doc.get('traceback'):
+                print(doc['traceback'].rstrip())
+            continue
+        size_text = f", {doc['bytes']:,} bytes" if doc['bytes'] is not None else ''
+        print(f"  - {doc['name']}: 출장자 {doc['travelers']}명, {doc['seconds'] * 1000:.1f} ms{size_text}")
+
+    succeeded = len(result['documents']) - result['failed']
+    print(f"총 {succeeded}건 생성 (실패 {result['failed']}건): {result['total_seconds']:.2f}초 "
+          f"({result['documents_per_second']:.1f}건/초)")
+    print(f"출력 파일: {result['output_path']}")
+
+def main(argv=None):
+    """출장복명서/출장신청서 일괄 생성 CLI"""
+    parser = argparse.ArgumentParser(description="출장복명서/출장신청서 일괄 생성")
+    parser.add_argument('input', help="출장 목록 파일 (.json 또는 .csv)")
+    parser.add_argument('--type', choices=['report', 'application'], default='report',
+                        help="report: 출장복명서, application: 출장신청서 (JSON 입력)")
+    parser.add_argument('-o', '--output', help="출력 파일 경로 (.zip 또는 .xlsx)")
+    parser.add_argument('--mode', choices=['zip', 'sheets'], default='zip',
+                        help="zip: 출장별 파일 ZIP 묶음, sheets: 한 워크북에 출장별 시트 + 요약 시트 작성")
+    parser.add_argument('--encoding', default='utf-8-sig', help="CSV 파일 인코딩")
+    parser.add_argument('-j', '--workers', type=int, default=1,
+                        help="병렬 렌더링 워커 프로세스 수 (0이면 CPU 수, zip 모드에서만 사용)")
+    parser.add_argument('--engine', choices=['code', 'template', 'direct'], default='code',
+                        help="렌더링 방식 (code: 코드로 생성, template: 템플릿 복제 (출장신청서만), "
+                             "direct: xlsx 직접 작성)")
+    parser.add_argument('-f', '--format', choices=['xlsx', 'pdf'], default='xlsx',
+                        help="문서 형식 (pdf는 reportlab 필요, zip 모드에서만 사용)")
+    parser.add_argument('-v', '--verbose', action='store_true', help="실패한 문서의 traceback 출력")
+    args = parser.parse_args(argv)
+    workers = args.workers or None
+
+    if args.type == 'application' and args.mode != 'zip':
+        parser.error("출장신청서는 zip 모드만 지원합니다.")
+    if args.format == 'pdf' and args.mode != 'zip':
+        parser.error("PDF는 zip 모드만 지원합니다.")
+    if args.type == 'report' and args.engine == 'template':
+        parser.error("template 방식은 출장신청서만 지원합니다.")
+    if args.format == 'pdf' and args.engine != 'code':
+        parser.error(f"{args.engine} 방식은 xlsx 형식에서만 사용할 수 있습니다 (PDF는 항상 같은 방식으로 생성).")
+
+    output = args.output
+    if not output:
+        current_date = datetime.now().strftime('%Y%m%d')
+        ext = 'zip' if args.mode == 'zip' else 'xlsx'
+        prefix = '출장신청서' if args.type == 'application' else '출장복명서'
+        output = f"{prefix}_일괄_{current_date}.{ext}"
+
+    if args.type == 'application':
+        applications = load_trips_from_json(args.input)
+        result = generate_applications_batch(applications, output, workers, args.engine, args.format)
+    else:
+        trips = load_trips(args.input, args.encoding)
+        result = generate_reports_batch(trips, output, args.mode, workers, args.engine, args.format)
+
+    print_batch_summary(result, args.verbose)
+    return 1 if result['failed'] else 0
+
+if __name__ == '__main__':
+    raise SystemExit(main())
@@ -0,0 +1,455 @@
+import argparse
+import gc
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+from datetime import date, datetime, time as dt_time, timedelta
+
+import openpyxl
+
+import excel_generator
+from instrumentation import percentile
+
+# 기본 시나리오: (출장자 수, 추가 비용 항목 수)
+DEFAULT_SCENARIOS = [
+    (1, 0), (10, 0), (10, 50), (100, 0), (100, 500), (1000, 0), (1000, 500)
+]
+QUICK_SCENARIOS = [(1, 0), (10, 50), (100, 500)]
+
+# 기준값 대비 이 비율 이상 느려지면 회귀로 판단
+DEFAULT_REGRESSION_THRESHOLD = 0.20
+
+# 시나리오별 측정 횟수와 측정 전 예열 실행 횟수
+DEFAULT_REPEAT = 10
+DEFAULT_WARMUP = 2
+
+# 기준값 비교 시 최소 측정 횟수/라운드 수 (이보다 적으면 이 값으로 늘림)
+MIN_COMPARE_REPEAT = 10
+MIN_COMPARE_ROUNDS = 3
+
+# 지연시간 회귀 임계값에 더하는 기준값 측정 잡음의 상한
+# (기준값 파일의 잡음이 이보다 크면 저장/비교하지 않음)
+MAX_NOISE_ALLOWANCE = 0.10
+
+# 지연시간 회귀로 보이는 시나리오를 다시 측정하는 횟수 (전체 측정의 중앙값으로 판단)
+CONFIRM_RUNS = 2
+
+SYNTHETIC_POSITIONS = ['연구원', '주임연구원', '선임연구원', '책임연구원']
+SYNTHETIC_COST_ITEMS = ['교통비', '숙박비', '회의비', '유류비', '주차비']
+SYNTHETIC_PAYMENT_METHODS = ['법인카드', '개인카드', '현금']
+
+def make_synthetic_trip(travelers, cost_items, seed_date=date(2026, 3, 2)):
+    """
+    벤치마크용 출장 데이터 생성 (입력이 같으면 항상 같은 결과)
+
+    Returns:
+        tuple: (employees_data, additional_costs)
+    """
+    employees_data = []
+    for i in range(travelers):
+        trip_days = 1 + i % 4
+        start_date = seed_date + timedelta(days=i % 7)
+        daily_allowance = 40000 + (i % 4) * 5000
+        meal_cost = 15000 + (i % 4) * 2500
+        employees_data.append({
+            'employee_name': f"직원{i + 1:04d}",
+            'position': SYNTHETIC_POSITIONS[i % len(SYNTHETIC_POSITIONS)],
+            'project_manager': '김철수',
+            'project_name': '벤치마크 연구과제',
+            'destination': '대전',
+            'trip_purpose': '성능 측정용 출장',
+            'start_date': start_date,
+            'start_time': dt_time(9, 0),
+            'end_date': start_date + timedelta(days=trip_days - 1),
+            'end_time': dt_time(18, 0),
+            'trip_days': trip_days,
+            'daily_allowance_per_day': daily_allowance,
+            'meal_cost_per_day': meal_cost,
+            'daily_allowance_total': daily_allowance * trip_days,
+            'meal_cost_total': meal_cost * trip_days,
+            'holiday_days': i % 2,
+            'special_days': 0,
+            'dangerous_days': 0
+        })
+
+    additional_costs = [
+        {
+            'item': SYNTHETIC_COST_ITEMS[i % len(SYNTHETIC_COST_ITEMS)],
+            'payment_method': SYNTHETIC_PAYMENT_METHODS[i % len(SYNTHETIC_PAYMENT_METHODS)],
+            'amount': 10000 + (i % 10) * 1000
+        }
+        for i in range(cost_items)
+    ]
+    return employees_data, additional_costs
+
+def make_synthetic_application(travelers):
+    """벤치마크용 출장신청서 데이터 생성"""
+    return {
+        'project_manager': '김철수',
+        'project_name': '벤치마크 연구과제',
+        'trip_period': '2026.03.02 ~ 03.05(3박 4일)',
+        'destination': '대전',
+        'trip_purpose': '성능 측정용 출장',
+        'company_car': '',
+        'public_transport': 'KTX',
+        'travelers': [
+            {
+                'position': SYNTHETIC_POSITIONS[i % len(SYNTHETIC_POSITIONS)],
+                'name': f"직원{i + 1:04d}",
+                'account': f"110-{i:03d}-000000",
+                'note': ''
+            }
+            for i in range(travelers)
+        ]
+    }
+
+class StageTimer:
+    """excel_generator 모듈 함수를 감싸 호출 시간을 누적 (벤치마크 중에만 교체)"""
+
+    def __init__(self, names):
+        self.names = names
+        self.originals = {}
+        self.seconds = {}
+
+    def __enter__(self):
+        for name in self.names:
+            original = getattr(excel_generator, name)
+            self.originals[name] = original
+
+            def timed(*args, _name=name, _original=original, **kwargs):
+                start = time.perf_counter()
+                try:
+                    return _original(*args, **kwargs)
+                finally:
+                    self.seconds[_name] = self.seconds.get(_name, 0.0) + time.perf_counter() - start
+
+            setattr(excel_generator, name, timed)
+        return self
+
+    def __exit__(self, exc_type, exc_value, tb):
+        for name, original in self.originals.items():
+            setattr(excel_generator, name, original)
+        return False
+
+def run_report_once(employees_data, additional_costs):
+    """출장복명서 1회 생성: (단계별 시간, 출력 바이트 수)"""
+    with StageTimer(['apply_advanced_styles', 'setup_page_settings_advanced']) as timer:
+        start = time.perf_counter()
+        wb = excel_generator.build_advanced_business_trip_report_workbook(employees_data, additional_costs)
+        build_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    content = excel_generator.workbook_to_bytes(wb)
+    save_seconds = time.perf_counter() - start
+
+    stages = {
+        'styles': timer.seconds.get('apply_advanced_styles', 0.0),
+        'page_setup': timer.seconds.get('setup_page_settings_advanced', 0.0),
+        'save': save_seconds
+    }
+    stages['populate'] = build_seconds - stages['styles'] - stages['page_setup']
+    stages['total'] = build_seconds + save_seconds
+    return stages, len(content)
+
+def run_application_once(application_data):
+    """출장신청서 1회 생성: (단계별 시간, 출력 바이트 수)"""
+    with StageTimer(['apply_application_styles', 'setup_application_page_settings']) as timer:
+        start = time.perf_counter()
+        wb = excel_generator.build_business_trip_application_workbook(application_data)
+        build_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    content = excel_generator.workbook_to_bytes(wb)
+    save_seconds = time.perf_counter() - start
+
+    stages = {
+        'styles': timer.seconds.get('apply_application_styles', 0.0),
+        'page_setup': timer.seconds.get('setup_application_page_settings', 0.0),
+        'save': save_seconds
+    }
+    stages['populate'] = build_seconds - stages['styles'] - stages['page_setup']
+    stages['total'] = build_seconds + save_seconds
+    return stages, len(content)
+
+def summarize(samples):
+    """초 단위 측정값 리스트를 ms 단위 백분위수로 요약 (mad: 중앙값 절대 편차, 측정 잡음 지표)"""
+    ordered = sorted(samples)
+    median = statistics.median(ordered)
+    return {
+        'p50': round(percentile(ordered, 0.50) * 1000, 3),
+        'p90': round(percentile(ordered, 0.90) * 1000, 3),
+        'p99': round(percentile(ordered, 0.99) * 1000, 3),
+        'mean': round(statistics.fmean(ordered) * 1000, 3),
+        'min': round(ordered[0] * 1000, 3),
+        'mad': round(statistics.median(abs(value - median) for value in ordered) * 1000, 3)
+    }
+
+def measure(run_once, repeat):
+    """
+    run_once를 repeat회 측정: (단계별 초 단위 측정값, 출력 바이트 수)
+
+    매 측정 전에 gc를 실행하여 이전 실행의 쓰레기 수집이 측정에 섞이지 않게 한다.
+    """
+    stage_samples = {}
+    output_bytes = 0
+    for _ in range(repeat):
+        gc.collect()
+        stages, output_bytes = run_once()
+        for stage, seconds in stages.items():
+            stage_samples.setdefault(stage, []).append(seconds)
+    return stage_samples, output_bytes
+
+def measure_peak_memory(run_once):
+    """tracemalloc으로 1회 실행의 최대 메모리(bytes) 측정 (실행이 느려지므로 시간 측정과 분리)"""
+    tracemalloc.start()
+    try:
+        run_once()
+        _, peak_bytes = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak_bytes
+
+def build_result(name, round_samples, output_bytes, peak_bytes):
+    """
+    라운드별 측정값을 합쳐 시나리오 결과 생성
+
+    round_spread는 라운드별 중앙값의 상대 중앙값 절대 편차 (MAD / 중앙값)로,
+    라운드 사이에 머신 부하가 달라진 정도(측정 잡음)를 나타낸다. 최대-최소 편차와 달리
+    라운드 수를 늘려도 커지지 않으므로, 라운드를 늘려 잡음이 적은 기준값을 기록할 수 있다.
+    """
+    stage_samples = {}
+    for samples in round_samples:
+        for stage, values in samples.items():
+            stage_samples.setdefault(stage, []).extend(values)
+
+    latency = summarize(stage_samples['total'])
+    round_medians = [statistics.median(samples['total']) for samples in round_samples]
+    if len(round_medians) > 1:
+        center = statistics.median(round_medians)
+        deviation = statistics.median(abs(value - center) for value in round_medians)
+        latency['round_spread'] = round(deviation / center, 4)
+
+    return {
+        'name': name,
+        'repeat': len(stage_samples['total']),
+        'rounds': len(round_samples),
+        'latency_ms': latency,
+        'stages_ms': {stage: summarize(samples)['p50'] for stage, samples in stage_samples.items() if stage != 'total'},
+        'peak_memory_kb': round(peak_bytes / 1024, 1),
+        'output_bytes': output_bytes
+    }
+
+def get_suite_cases(scenarios=None, include_application=True):
+    """(시나리오 이름, run_once) 리스트"""
+    cases = []
+    for travelers, cost_items in scenarios or DEFAULT_SCENARIOS:
+        employees_data, additional_costs = make_synthetic_trip(travelers, cost_items)
+        cases.append((
+            f"report/t{travelers}/c{cost_items}",
+            lambda employees_data=employees_data, additional_costs=additional_costs:
+                run_report_once(employees_data, additional_costs)
+        ))
+
+    if include_application:
+        for travelers in sorted({travelers for travelers, _ in scenarios or DEFAULT_SCENARIOS}):
+            application_data = make_synthetic_application(travelers)
+            cases.append((
+                f"application/t{travelers}",
+                lambda application_data=application_data: run_application_once(application_data)
+            ))
+    return cases
+
+def run_suite(scenarios=None, repeat=DEFAULT_REPEAT, include_application=True, warmup=DEFAULT_WARMUP, rounds=1,
+              names=None):
+    """
+    전체 시나리오(names를 지정하면 해당 시나리오만) 실행 결과 리스트 반환
+
+    각 라운드에서 시나리오를 1회씩 번갈아 repeat번 측정하여, 일시적인 머신 부하가 한 시나리오의
+    측정값에만 몰리지 않고 라운드 전체에 고르게 섞이게 한다.
+    """
+    cases = get_suite_cases(scenarios, include_application)
+    if names is not None:
+        cases = [(name, run_once) for name, run_once in cases if name in names]
+    for _, run_once in cases:
+        for _ in range(warmup):
+            run_once()
+
+    round_samples = {name: [] for name, _ in cases}
+    output_bytes = {}
+    for _ in range(rounds):
+        stage_samples = {name: {} for name, _ in cases}
+        for _ in range(repeat):
+            for name, run_once in cases:
+                samples, output_bytes[name] = measure(run_once, 1)
+                for stage, values in samples.items():
+                    stage_samples[name].setdefault(stage, []).extend(values)
+        for name, _ in cases:
+            round_samples[name].append(stage_samples[name])
+
+    return [
+        build_result(name, round_samples[name], output_bytes[name], measure_peak_memory(run_once))
+        for name, run_once in cases
+    ]
+
+def build_baseline(results):
+    """기준값 파일 내용 (실행 환경 정보 포함)"""
+    return {
+        'created_at': datetime.now().isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'openpyxl': openpyxl.__version__,
+        'platform': platform.platform(),
+        'template_version': excel_generator.TEMPLATE_VERSION,
+        'results': {result['name']: result for result in results}
+    }
+
+def relative_spread(latency):
+    """
+    지연시간 요약의 상대 잡음
+
+    여러 라운드로 측정했으면 라운드별 중앙값의 상대 MAD, 아니면 MAD / p50
+    (이전 기준값 파일처럼 둘 다 없으면 0)
+    """
+    if 'round_spread' in latency:
+        return latency['round_spread']
+    return latency.get('mad', 0.0) / latency['p50'] if latency['p50'] else 0.0
+
+def get_noisy_results(baseline):
+    """상대 잡음이 MAX_NOISE_ALLOWANCE를 넘는 기준값 시나리오 이름 리스트 (이런 기준값은 사용하지 않음)"""
+    return [
+        name for name, result in baseline['results'].items()
+        if relative_spread(result['latency_ms']) > MAX_NOISE_ALLOWANCE
+    ]
+
+def compare_with_baseline(results, baseline, threshold=DEFAULT_REGRESSION_THRESHOLD):
+    """
+    기준값과 중앙값(p50) 지연시간/최대 메모리/출력 크기 비교
+
+    지연시간 임계값에는 기준값의 상대 잡음(relative_spread)만 더하며, MAX_NOISE_ALLOWANCE를 넘지 않는다.
+    비교 대상인 현재 측정의 잡음은 반영하지 않아 부하가 큰 머신에서도 허용 범위가 넓어지지 않는다.
+    메모리와 출력 크기는 결정적이므로 threshold를 그대로 사용한다.
+
+    Returns:
+        list: (시나리오, 지표, 기준값, 현재값, 변화율, 적용 임계값, 회귀 여부) 튜플 리스트
+    """
+    rows = []
+    for result in results:
+        base = baseline['results'].get(result['name'])
+        if base is None:
+            continue
+        noise = min(relative_spread(base['latency_ms']), MAX_NOISE_ALLOWANCE)
+        for metric, current, previous, limit in (
+            ('p50_ms', result['latency_ms']['p50'], base['latency_ms']['p50'], threshold + noise),
+            ('peak_kb', result['peak_memory_kb'], base['peak_memory_kb'], threshold),
+            ('bytes', result['output_bytes'], base['output_bytes'], threshold)
+        ):
+            change = (current - previous) / previous if previous else 0.0
+            rows.append((result['name'], metric, previous, current, change, limit, change > limit))
+    return rows
+
+def confirm_regressions(results, baseline, threshold, scenarios, repeat, include_application, warmup, rounds):
+    """
+    지연시간 회귀로 보이는 시나리오를 CONFIRM_RUNS회 다시 측정하여 p50이 중앙값인 측정으로 교체
+
+    가장 빠른 재측정이 아니라 전체 측정(최초 + 재측정)의 중앙값으로 판단하므로, 일시적인 부하로
+    한 번 느리게 측정된 시나리오는 회귀에서 빠지고 과반이 느린 시나리오는 회귀로 남는다.
+
+    Returns:
+        list: 재측정을 반영한 compare_with_baseline 결과
+    """
+    rows = compare_with_baseline(results, baseline, threshold)
+    suspects = {row[0] for row in rows if row[1] == 'p50_ms' and row[6]}
+    if not suspects:
+        return rows
+
+    print(f"회귀 의심 시나리오 재측정: {', '.join(sorted(suspects))}", file=sys.stderr)
+    candidates = {result['name']: [result] for result in results if result['name'] in suspects}
+    for _ in range(CONFIRM_RUNS):
+        for result in run_suite(scenarios, repeat, include_application, warmup, rounds, suspects):
+            candidates[result['name']].append(result)
+
+    medians = {
+        name: sorted(runs, key=lambda result: result['latency_ms']['p50'])[len(runs) // 2]
+        for name, runs in candidates.items()
+    }
+    results = [medians.get(result['name'], result) for result in results]
+    return compare_with_baseline(results, baseline, threshold)
+
+def print_results(results):
+    print(f"{'시나리오':<24}{'min':>10}{'p50':>10}{'p90':>10}{'p99':>10}{'채우기':>10}{'스타일':>10}{'저장':>10}{'메모리KB':>12}{'bytes':>10}")
+    for result in results:
+        latency = result['latency_ms']
+        stages = result['stages_ms']
+        print(f"{result['name']:<24}{latency['min']:>10.1f}{latency['p50']:>10.1f}{latency['p90']:>10.1f}{latency['p99']:>10.1f}"
+              f"{stages['populate']:>10.1f}{stages['styles']:>10.1f}{stages['save']:>10.1f}"
+              f"{result['peak_memory_kb']:>12.1f}{result['output_bytes']:>10,}")
+
+def main(argv=None):
+    """excel_generator 벤치마크 CLI (기준값 저장/비교, 회귀 시 종료 코드 1)"""
+    parser = argparse.ArgumentParser(description="출장복명서/출장신청서 생성 벤치마크")
+    parser.add_argument('-n', '--repeat', type=int, default=DEFAULT_REPEAT,
+                        help=f"시나리오별 측정 횟수 (--compare 시 최소 {MIN_COMPARE_REPEAT})")
+    parser.add_argument('--warmup', type=int, default=DEFAULT_WARMUP, help="시나리오별 예열 실행 횟수")
+    parser.add_argument('--rounds', type=int, default=1,
+                        help=f"전체 시나리오를 번갈아 측정할 라운드 수 (--compare 시 최소 {MIN_COMPARE_ROUNDS})")
+    parser.add_argument('--quick', action='store_true', help="작은 시나리오만 실행")
+    parser.add_argument('--no-application', action='store_true', help="출장신청서 시나리오 제외")
+    parser.add_argument('--save-baseline', metavar='PATH', help=f"결과를 기준값 JSON으로 저장 (측정 잡음이 {MAX_NOISE_ALLOWANCE:.0%}%를 넘으면 저장하지 않음)")
+    parser.add_argument('--compare', metavar='PATH', help="기준값 JSON과 비교")
+    parser.add_argument('--threshold', type=float, default=DEFAULT_REGRESSION_THRESHOLD,
+                        help="회귀 판단 비율 (기본값 0.2 = 20%%)")
+    parser.add_argument('--json', action='store_true', help="결과를 JSON으로 출력")
+    args = parser.parse_args(argv)
+
+    repeat, rounds = args.repeat, args.rounds
+    if args.compare and (repeat < MIN_COMPARE_REPEAT or rounds < MIN_COMPARE_ROUNDS):
+        repeat, rounds = max(repeat, MIN_COMPARE_REPEAT), max(rounds, MIN_COMPARE_ROUNDS)
+        print(f"기준값 비교를 위해 {rounds}라운드 x {repeat}회로 측정합니다.", file=sys.stderr)
+
+    scenarios = QUICK_SCENARIOS if args.quick else DEFAULT_SCENARIOS
+    results = run_suite(scenarios, repeat, not args.no_application, args.warmup, rounds)
+
+    if args.json:
+        json.dump(build_baseline(results), sys.stdout, ensure_ascii=False, indent=2)
+        print()
+    else:
+        print_results(results)
+
+    if args.save_baseline:
+        baseline = build_baseline(results)
+        noisy = get_noisy_results(baseline)
+        if noisy:
+            print(f"측정 잡음이 {MAX_NOISE_ALLOWANCE:.0%}를 넘어 기준값을 저장하지 않습니다: {', '.join(noisy)}\n"
+                  f"부하가 없는 상태에서 --rounds를 늘려 다시 측정하세요.", file=sys.stderr)
+            return 1
+        with open(args.save_baseline, 'w', encoding='utf-8') as f:
+            json.dump(baseline, f, ensure_ascii=False, indent=2)
+        print(f"기준값 저장: {os.path.abspath(args.save_baseline)}")
+
+    if args.compare:
+        with open(args.compare, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+        noisy = get_noisy_results(baseline)
+        if noisy:
+            print(f"기준값의 측정 잡음이 {MAX_NOISE_ALLOWANCE:.0%}를 넘어 비교할 수 없습니다: {', '.join(noisy)}\n"
+                  f"기준값을 다시 기록하세요.", file=sys.stderr)
+            return 1
+        rows = confirm_regressions(results, baseline, args.threshold, scenarios, repeat,
+                                   not args.no_application, args.warmup, rounds)
+        regressions = [row for row in rows if row[6]]
+
+        print(f"\n기준값 비교 ({baseline.get('created_at', '')}, 임계값 {args.threshold:.0%} + 기준값 잡음 최대 {MAX_NOISE_ALLOWANCE:.0%})")
+        for name, metric, previous, current, change, limit, regressed in rows:
+            mark = "회귀" if regressed else ""
+            print(f"{name:<24}{metric:>10}{previous:>12,.1f}{current:>12,.1f}{change:>+9.1%}{limit:>9.1%}  {mark}")
+        if regressions:
+            print(f"\n{len(regressions)}개 지표가 기준값보다 임계값 이상 나빠졌습니다.")
+            return 1
+
+    return 0
+
+if __name__ == '__main__':
+    raise SystemExit(main())
@@ -1,6 +1,6 @@
-import json
 import os
-import pandas as pd
+from instrumentation import stage
+from storage_backend import create_storage, copy_data
 
 # 기본 데이터 파일 경로
 DATA_FILE = "business_trip_data.json"
@@ -28,12 +28,22 @@ DEFAULT_PROJECT_NAMES = [
     "해양안전 기술 개발"
 ]
 
+# 저장소 (TRIP_DATA_BACKEND 환경변수로 json/sqlite 선택, 처음 사용할 때 생성)
+_storage = None
+
+def get_storage():
+    """데이터 저장소 반환"""
+    global _storage
+    if _storage is None:
+        _storage = create_storage(DATA_FILE)
+    return _storage
+
 def load_data():
     """데이터 파일에서 데이터를 로드하거나 기본 데이터를 반환"""
     try:
-        if os.path.exists(DATA_FILE):
-            with open(DATA_FILE, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+        storage = get_storage()
+        if storage.exists():
+            data = storage.load()
             
             # 기본 데이터에 없는 키가 있으면 추가
             for key in DEFAULT_DATA:
@@ -44,48 +54,55 @@ def load_data():
         else:
             # 파일이 없으면 기본 데이터로 파일 생성
             save_data(DEFAULT_DATA)
-            return DEFAULT_DATA.copy()
+            return copy_data(DEFAULT_DATA)
             
     except Exception as e:
         print(f"데이터 로드 오류: {e}")
-        return DEFAULT_DATA.copy()
+        return copy_data(DEFAULT_DATA)
 
 def save_data(data):
-    """데이터를 파일에 저장"""
+    """데이터 전체를 저장소에 저장"""
     try:
-        with open(DATA_FILE, 'w', encoding='utf-8') as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
+        get_storage().save(data)
         return True
     except Exception as e:
         print(f"데이터 저장 오류: {e}")
         return False
 
 def add_new_data(data_type, value, data=None):
-    """새로운 데이터 추가"""
+    """새로운 데이터 추가 (저장소에는 해당 값 하나만 추가)"""
     if data is None:
         data = load_data()
     
     if data_type in data and value not in data[data_type]:
+        try:
+            added = get_storage().add_value(data_type, value)
+        except Exception as e:
+            print(f"데이터 저장 오류: {e}")
+            return False
         data[data_type].append(value)
-        save_data(data)
-        return True
+        return added
     return False
 
 def remove_data(data_type, value, data=None):
-    """데이터 제거"""
+    """데이터 제거 (저장소에서는 해당 값 하나만 삭제)"""
     if data is None:
         data = load_data()
     
     if data_type in data and value in data[data_type]:
+        try:
+            removed = get_storage().remove_value(data_type, value)
+        except Exception as e:
+            print(f"데이터 저장 오류: {e}")
+            return False
         data[data_type].remove(value)
-        save_data(data)
-        return True
+        return removed
     return False
 
 def reset_to_default():
     """기본 데이터로 초기화"""
     save_data(DEFAULT_DATA)
-    return DEFAULT_DATA.copy()
+    return copy_data(DEFAULT_DATA)
 
 # 데이터 검증 함수들
 def validate_data(data):
@@ -120,6 +137,8 @@ def load_project_names():
     """연구과제명.csv 파일에서 연구과제명 목록을 로드"""
     try:
         if os.path.exists(PROJECT_NAMES_FILE):
+            import pandas as pd
+            
             df = pd.read_csv(PROJECT_NAMES_FILE, encoding='utf-8')
             # 첫 번째 열의 데이터를 리스트로 반환 (NaN 값 제외)
             project_names = df.iloc[:, 0].dropna().tolist()
@@ -131,12 +150,26 @@ def load_project_names():
         print(f"연구과제명 로드 오류: {e}. 기본 연구과제명을 사용합니다.")
         return DEFAULT_PROJECT_NAMES.copy()
 
+def get_data_signature():
+    """저장소 변경 시그니처와 연구과제명 파일 수정시각 (캐시 무효화 판단용)"""
+    try:
+        project_names_mtime = os.stat(PROJECT_NAMES_FILE).st_mtime_ns
+    except OSError:
+        project_names_mtime = None
+    return (get_storage().get_signature(), project_names_mtime)
+
 def get_all_data():
     """모든 데이터를 통합하여 반환 (기본 데이터 + 연구과제명)"""
-    data = load_data()
-    project_names = load_project_names()
-    
-    # 연구과제명 추가
-    data["project_names"] = project_names
+    with stage('get_all_data'):
+        data = load_data()
+        project_names = load_project_names()
+        
+        # 사이드바에서 추가한 연구과제명도 함께 표시
+        for name in data.get("project_names", []):
+            if name not in project_names:
+                project_names.append(name)
+        
+        # 연구과제명 추가
+        data["project_names"] = project_names
     
     return data
@@ -0,0 +1,133 @@
+import argparse
+import json
+import os
+import sys
+import time
+from datetime import datetime
+
+from batch_generator import normalize_trip
+from excel_generator import (
+    create_advanced_business_trip_report_bytes,
+    create_business_trip_application_bytes
+)
+from instrumentation import request
+from render_cache import RENDER_CACHE_DIR, RenderCache, make_render_key
+
+# 지원하는 문서 종류
+DOCUMENT_TYPES = ['application', 'report']
+
+# 지원하는 출력 형식 (pdf는 reportlab 필요)
+OUTPUT_FORMATS = ['xlsx', 'pdf']
+
+def get_renderer(document_type, output_format):
+    """문서 종류/출력 형식별 생성 함수"""
+    if output_format == 'pdf':
+        from pdf_export import create_advanced_business_trip_report_pdf, create_business_trip_application_pdf
+        return create_business_trip_application_pdf if document_type == 'application' else create_advanced_business_trip_report_pdf
+    if output_format == 'xlsx':
+        return create_business_trip_application_bytes if document_type == 'application' else create_advanced_business_trip_report_bytes
+    raise ValueError(f"지원하지 않는 출력 형식입니다: {output_format}")
+
+def generate_application(application_data, cache=None, output_format='xlsx'):
+    """
+    출장신청서 생성 (Streamlit 없이 호출 가능한 서비스 API)
+
+    Args:
+        application_data: 출장신청서 데이터 딕셔너리
+                          (project_manager, project_name, trip_period, destination, trip_purpose,
+                           company_car, public_transport, travelers: [{position, name, account, note}])
+        cache: RenderCache (지정하면 같은 입력의 결과를 재사용)
+        output_format: 'xlsx' 또는 'pdf'
+
+    Returns:
+        tuple: (기본 파일명, 문서 바이트)
+    """
+    renderer = get_renderer('application', output_format)
+    current_date = datetime.now().strftime('%Y%m%d')
+    safe_destination = str(application_data.get('destination', '')).replace(' ', '_').replace('/', '_')
+    filename = f"출장신청서_{safe_destination}_{current_date}.{output_format}"
+
+    if cache is None:
+        return filename, renderer(application_data)
+    key = make_render_key('application', application_data, output_format=output_format)
+    return filename, cache.get_or_render(key, renderer, application_data)
+
+def generate_report(trip, cache=None, output_format='xlsx'):
+    """
+    출장복명서 생성 (Streamlit 없이 호출 가능한 서비스 API)
+
+    Args:
+        trip: batch_generator 입력 형식의 출장 1건
+              ({'employees': [...], 'additional_costs': [...], project_name 등 공통 필드})
+              비용 항목이 빠진 직원만 직급별 출장비로 자동 계산한다.
+        cache: RenderCache (지정하면 같은 입력의 결과를 재사용)
+        output_format: 'xlsx' 또는 'pdf'
+
+    Returns:
+        tuple: (기본 파일명, 문서 바이트)
+    """
+    renderer = get_renderer('report', output_format)
+    report = normalize_trip(trip)
+    first_emp = report['employees_data'][0]
+    filename = trip.get('filename') or f"출장복명서_{first_emp['destination']}_{first_emp['start_date'].strftime('%Y%m%d')}.xlsx"
+    if output_format != 'xlsx':
+        filename = f"{os.path.splitext(filename)[0]}.{output_format}"
+    args = (report['employees_data'], report['additional_costs'])
+
+    if cache is None:
+        return filename, renderer(*args)
+    key = make_render_key('report', *args, output_format=output_format)
+    return filename, cache.get_or_render(key, renderer, *args)
+
+def generate_document(document_type, payload, cache=None, output_format='xlsx'):
+    """문서 종류에 따라 출장신청서/출장복명서 생성"""
+    with request(f"document_service/{document_type}", output_format=output_format):
+        if document_type == 'application':
+            return generate_application(payload, cache, output_format)
+        if document_type == 'report':
+            return generate_report(payload, cache, output_format)
+        raise ValueError(f"지원하지 않는 문서 종류입니다: {document_type}")
+
+def read_payload(source):
+    """JSON 입력 읽기 ('-'이면 표준입력)"""
+    if source == '-':
+        return json.load(sys.stdin)
+    with open(source, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+def main(argv=None):
+    """출장신청서/출장복명서 단건 생성 CLI"""
+    parser = argparse.ArgumentParser(description="JSON 입력으로 출장신청서/출장복명서 생성 (Streamlit 불필요)")
+    parser.add_argument('type', choices=DOCUMENT_TYPES, help="문서 종류")
+    parser.add_argument('input', nargs='?', default='-', help="입력 JSON 파일 (기본값: 표준입력)")
+    parser.add_argument('-o', '--output', help="출력 파일 경로 ('-'이면 표준출력으로 문서 바이트 출력)")
+    parser.add_argument('-f', '--format', choices=OUTPUT_FORMATS, default='xlsx',
+                        help="출력 형식 (pdf는 reportlab 필요)")
+    parser.add_argument('--cache-dir', nargs='?', const=RENDER_CACHE_DIR,
+                        help=f"렌더 결과 디스크 캐시 폴더 (같은 입력은 다시 생성하지 않음, 기본값: {RENDER_CACHE_DIR})")
+    args = parser.parse_args(argv)
+
+    cache = RenderCache(cache_dir=args.cache_dir) if args.cache_dir else None
+
+    start = time.perf_counter()
+    try:
+        filename, content = generate_document(args.type, read_payload(args.input), cache, args.format)
+    except (OSError, ValueError, KeyError, ImportError) as e:
+        print(f"생성 실패: {type(e).__name__}: {e}", file=sys.stderr)
+        return 1
+
+    if args.output == '-':
+        sys.stdout.buffer.write(content)
+        sys.stdout.buffer.flush()
+        return 0
+
+    output_path = args.output or filename
+    with open(output_path, 'wb') as f:
+        f.write(content)
+
+    print(f"생성 완료: {os.path.abspath(output_path)} ({len(content):,} bytes, {time.perf_counter() - start:.3f}초)",
+          file=sys.stderr)
+    return 0
+
+if __name__ == '__main__':
+    raise SystemExit(main())
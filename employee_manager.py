@@ -1,7 +1,13 @@
-import pandas as pd
+import hashlib
+import io
+import json
 import os
+import threading
+import time
 from datetime import datetime, date
 
+from instrumentation import stage
+
 # 기본 직원 데이터 (CSV 파일이 없을 때 사용)
 DEFAULT_EMPLOYEE_DATA = [
     {"이름": "김철수", "직급": "선임연구원", "일비": 50000, "식비": 20000},
@@ -11,54 +17,266 @@ DEFAULT_EMPLOYEE_DATA = [
     {"이름": "정현우", "직급": "선임연구원", "일비": 50000, "식비": 20000}
 ]
 
+class EmployeeRecord:
+    """이름 인덱스에 저장되는 직원 1명의 정보 (메모리 절약을 위해 slots 사용)"""
+    
+    __slots__ = ('name', 'position', 'daily_allowance', 'meal_cost')
+    
+    def __init__(self, name, position, daily_allowance, meal_cost):
+        self.name = name
+        self.position = position
+        self.daily_allowance = daily_allowance
+        self.meal_cost = meal_cost
+    
+    def to_dict(self):
+        """get_employee_info 반환 형식의 딕셔너리로 변환"""
+        return {
+            'name': self.name,
+            'position': self.position,
+            'daily_allowance': self.daily_allowance,
+            'meal_cost': self.meal_cost
+        }
+
+# 전처리된 출장비 표를 저장하는 캐시 폴더
+RATE_CACHE_DIR = ".cache"
+
+# 파일 변경 여부를 확인하는 최소 간격 (초)
+RATE_CHECK_INTERVAL = 1.0
+
+# 보관할 전처리 캐시 파일 수 (오래 사용하지 않은 것부터 삭제)
+RATE_CACHE_LIMIT = 4
+
+def get_file_signature(path):
+    """파일 수정시각(ns)과 크기로 변경 여부 판별용 시그니처 생성"""
+    stat = os.stat(path)
+    return (stat.st_mtime_ns, stat.st_size)
+
+def parse_rate_table(content, encoding='cp949'):
+    """직급별 출장비 CSV 내용(bytes)을 정리된 DataFrame으로 변환"""
+    import pandas as pd
+    
+    df = pd.read_csv(io.BytesIO(content), encoding=encoding, dtype=str)
+    
+    # 공백 제거 및 컬럼명 정리
+    df.columns = df.columns.str.strip()
+    for column in df.columns:
+        df[column] = df[column].str.strip()
+    
+    # 일비, 식비에서 쉼표 제거하고 숫자로 변환
+    df['일비'] = df['일비'].str.replace(',', '').str.replace(' ', '').astype(int)
+    df['식비'] = df['식비'].str.replace(',', '').str.replace(' ', '').astype(int)
+    
+    return df
+
+def get_rate_cache_path(content_hash):
+    """내용 해시별 전처리 캐시 파일 경로"""
+    return os.path.join(RATE_CACHE_DIR, f"employee_rates_{content_hash}.json")
+
+def read_rate_cache(content_hash):
+    """전처리 캐시가 있으면 DataFrame으로 반환, 없으면 None"""
+    cache_path = get_rate_cache_path(content_hash)
+    if not os.path.exists(cache_path):
+        return None
+    
+    try:
+        import pandas as pd
+        
+        with open(cache_path, 'r', encoding='utf-8') as f:
+            cached = json.load(f)
+        df = pd.DataFrame(cached['data'], columns=cached['columns'])
+    except Exception as e:
+        print(f"출장비 캐시 로드 오류: {e}")
+        return None
+    
+    # 최근 사용 시각 갱신 (정리 시 오래 사용하지 않은 캐시부터 삭제)
+    try:
+        os.utime(cache_path)
+    except OSError:
+        pass
+    return df
+
+def write_rate_cache(content_hash, df):
+    """전처리된 DataFrame을 컬럼/행 리스트 형태의 JSON 캐시로 저장"""
+    try:
+        os.makedirs(RATE_CACHE_DIR, exist_ok=True)
+        cache_path = get_rate_cache_path(content_hash)
+        tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'columns': df.columns.tolist(), 'data': df.values.tolist()}, f, ensure_ascii=False, default=int)
+        os.replace(tmp_path, cache_path)
+        prune_rate_cache()
+    except Exception as e:
+        print(f"출장비 캐시 저장 오류: {e}")
+
+def prune_rate_cache(limit=None):
+    """전처리 캐시 파일이 limit개(기본 RATE_CACHE_LIMIT)를 넘으면 최근에 사용하지 않은 것부터 삭제"""
+    if limit is None:
+        limit = RATE_CACHE_LIMIT
+    entries = []
+    for entry in os.scandir(RATE_CACHE_DIR):
+        if entry.name.startswith("employee_rates_") and entry.name.endswith(".json"):
+            try:
+                entries.append((entry.stat().st_mtime_ns, entry.path))
+            except OSError:
+                continue
+    
+    entries.sort(reverse=True)
+    for _, path in entries[limit:]:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
 class EmployeeManager:
     """직원 정보 및 출장비 관리 클래스"""
     
-    def __init__(self, csv_file="직급별 출장비.csv"):
+    def __init__(self, csv_file="직급별 출장비.csv", check_interval=RATE_CHECK_INTERVAL):
         self.csv_file = csv_file
+        self.check_interval = check_interval
+        self.source_signature = None
+        self.source_hash = None
+        # 파싱에 실패한 파일의 (수정시각, 크기) - 파일이 바뀌기 전까지 다시 읽지 않음
+        self.failed_signature = None
+        self.last_checked = 0.0
+        self.reload_lock = threading.Lock()
+        self.employee_data = None
         self.employee_data = self.load_employee_data()
+        self.build_index()
+    
+    def build_index(self):
+        """로드된 DataFrame으로 이름 -> EmployeeRecord 인덱스 생성 (동명이인은 첫 번째 행 사용)"""
+        employee_index = {}
+        employee_names = []
+        
+        if not self.employee_data.empty:
+            columns = zip(
+                self.employee_data['이름'].tolist(),
+                self.employee_data['직급'].tolist(),
+                self.employee_data['일비'].tolist(),
+                self.employee_data['식비'].tolist()
+            )
+            for name, position, daily_allowance, meal_cost in columns:
+                employee_names.append(name)
+                if name not in employee_index:
+                    employee_index[name] = EmployeeRecord(name, position, int(daily_allowance), int(meal_cost))
+        
+        # 조회 중인 다른 스레드를 위해 완성된 인덱스로 한 번에 교체
+        self.employee_index = employee_index
+        self.employee_names = employee_names
     
     def load_employee_data(self):
-        """CSV 파일에서 직원 데이터 로드 또는 기본 데이터 사용"""
+        """
+        CSV 파일에서 직원 데이터 로드 (내용 해시별 전처리 캐시 사용)
+        
+        파일이 없거나 읽지 못하면 최초 로드에서만 기본 데이터를 사용하고,
+        다시 로드할 때는 이전에 로드한 출장비 표(self.employee_data)를 그대로 반환한다.
+        """
+        with stage('load_employee_data'):
+            return self._load_employee_data()
+    
+    def _load_employee_data(self):
+        import pandas as pd
+        
+        signature = None
         try:
             if os.path.exists(self.csv_file):
-                df = pd.read_csv(self.csv_file, encoding='cp949')
-                # 공백 제거 및 컬럼명 정리
-                df.columns = df.columns.str.strip()
-                df = df.applymap(lambda x: x.strip() if isinstance(x, str) else x)
+                signature = get_file_signature(self.csv_file)
+                with open(self.csv_file, 'rb') as f:
+                    content = f.read()
+                content_hash = hashlib.sha1(content).hexdigest()
                 
-                # 일비, 식비에서 쉼표 제거하고 숫자로 변환
-                df['일비'] = df['일비'].str.replace(',', '').str.replace(' ', '').astype(int)
-                df['식비'] = df['식비'].str.replace(',', '').str.replace(' ', '').astype(int)
+                df = read_rate_cache(content_hash)
+                if df is None:
+                    df = parse_rate_table(content)
+                    write_rate_cache(content_hash, df)
                 
+                self.source_signature = signature
+                self.source_hash = content_hash
+                self.failed_signature = None
                 return df
             else:
-                print(f"파일을 찾을 수 없습니다: {self.csv_file}. 기본 직원 데이터를 사용합니다.")
-                # 기본 데이터로 DataFrame 생성
-                return pd.DataFrame(DEFAULT_EMPLOYEE_DATA)
+                print(f"파일을 찾을 수 없습니다: {self.csv_file}.")
+                self.failed_signature = None
         except Exception as e:
-            print(f"데이터 로드 오류: {e}. 기본 직원 데이터를 사용합니다.")
-            return pd.DataFrame(DEFAULT_EMPLOYEE_DATA)
+            print(f"데이터 로드 오류: {e}.")
+            self.failed_signature = signature
+        
+        if self.employee_data is not None:
+            print("이전 출장비 표를 계속 사용합니다.")
+            return self.employee_data
+        
+        print("기본 직원 데이터를 사용합니다.")
+        # 기본 데이터는 파일 내용과 무관하므로 해시를 비워 같은 내용으로 복구되어도 다시 로드되게 함
+        self.source_signature = None
+        self.source_hash = None
+        return pd.DataFrame(DEFAULT_EMPLOYEE_DATA)
+    
+    def reload_if_changed(self, force=False):
+        """
+        CSV 파일이 바뀌었으면 다시 로드
+        
+        수정시각/크기가 같으면 파일을 읽지 않으며, 달라져도 내용 해시가 같으면 다시 파싱하지 않는다.
+        파싱에 실패한 파일은 수정시각/크기가 다시 바뀔 때까지 건너뛰며, 이전 출장비 표를 유지한다.
+        
+        Returns:
+            bool: 다시 로드했으면 True (로드에 실패해 이전 표를 유지하면 False)
+        """
+        now = time.monotonic()
+        if not force and now - self.last_checked < self.check_interval:
+            return False
+        
+        with self.reload_lock:
+            self.last_checked = now
+            
+            try:
+                signature = get_file_signature(self.csv_file) if os.path.exists(self.csv_file) else None
+            except OSError:
+                return False
+            
+            if not force and signature in (self.source_signature, self.failed_signature):
+                return False
+            
+            if signature is not None and not force:
+                with open(self.csv_file, 'rb') as f:
+                    content_hash = hashlib.sha1(f.read()).hexdigest()
+                if content_hash == self.source_hash:
+                    # 내용은 그대로이고 수정시각만 바뀐 경우 (잘못 저장했다가 되돌린 경우 포함)
+                    self.source_signature = signature
+                    self.failed_signature = None
+                    return False
+            
+            employee_data = self.load_employee_data()
+            if employee_data is self.employee_data:
+                return False
+            
+            self.employee_data = employee_data
+            self.build_index()
+            return True
     
     def get_employee_names(self):
         """전체 직원 이름 리스트 반환"""
-        if not self.employee_data.empty:
-            return self.employee_data['이름'].tolist()
-        return []
+        self.reload_if_changed()
+        return list(self.employee_names)
+    
+    def get_employee_record(self, name):
+        """특정 직원의 EmployeeRecord 반환 (없으면 None)"""
+        self.reload_if_changed()
+        return self.employee_index.get(name)
     
     def get_employee_info(self, name):
         """특정 직원의 정보 반환"""
-        if not self.employee_data.empty:
-            employee = self.employee_data[self.employee_data['이름'] == name]
-            if not employee.empty:
-                return {
-                    'name': employee.iloc[0]['이름'],
-                    'position': employee.iloc[0]['직급'],
-                    'daily_allowance': employee.iloc[0]['일비'],
-                    'meal_cost': employee.iloc[0]['식비']
-                }
+        self.reload_if_changed()
+        record = self.employee_index.get(name)
+        if record:
+            return record.to_dict()
         return None
     
+    def get_employee_infos(self, names):
+        """여러 직원의 정보를 이름 순서대로 반환 (없는 직원은 None)"""
+        self.reload_if_changed()
+        index = self.employee_index
+        return [index[name].to_dict() if name in index else None for name in names]
+    
     def calculate_trip_days(self, start_date, start_time, end_date, end_time):
         """출장일수 계산"""
         try:
@@ -100,6 +318,72 @@ class EmployeeManager:
             'meal_cost_total': meal_cost_total,
             'total_cost': total_cost
         }
+    
+    def calculate_trip_expenses_bulk(self, trips, employee_names=None, start_dates=None, end_dates=None):
+        """
+        여러 출장의 출장일수 및 비용을 한 번에 계산 (벡터 연산)
+        
+        출장일수는 calculate_trip_days와 같이 날짜 차이 + 1일(최소 1일)이며,
+        출발/도착 시간은 일수에 영향을 주지 않으므로 사용하지 않는다.
+        
+        Args:
+            trips: 'employee_name', 'start_date', 'end_date' 컬럼을 가진 DataFrame
+                   (None이면 employee_names, start_dates, end_dates 배열 사용)
+        
+        Returns:
+            DataFrame: 입력 컬럼에 position, trip_days, daily_allowance_per_day, meal_cost_per_day,
+                       daily_allowance_total, meal_cost_total, total_cost, found 컬럼 추가
+                       (직원 정보가 없는 행은 found=False, 금액 0)
+        """
+        import numpy as np
+        import pandas as pd
+        
+        self.reload_if_changed()
+        if trips is None:
+            trips = pd.DataFrame({
+                'employee_name': employee_names,
+                'start_date': start_dates,
+                'end_date': end_dates
+            })
+        result = trips.copy()
+        
+        names = result['employee_name']
+        index = self.employee_index
+        result['found'] = names.isin(index.keys()).to_numpy()
+        result['position'] = names.map({name: record.position for name, record in index.items()})
+        daily_rates = names.map({name: record.daily_allowance for name, record in index.items()}).fillna(0).to_numpy(dtype=np.int64)
+        meal_rates = names.map({name: record.meal_cost for name, record in index.items()}).fillna(0).to_numpy(dtype=np.int64)
+        
+        # 날짜 차이 계산 (잘못된 날짜는 1일로 처리)
+        start = pd.to_datetime(result['start_date'], errors='coerce').to_numpy(dtype='datetime64[D]')
+        end = pd.to_datetime(result['end_date'], errors='coerce').to_numpy(dtype='datetime64[D]')
+        days_diff = (end - start).astype('timedelta64[D]').astype(np.float64)
+        trip_days = np.maximum(1, np.nan_to_num(days_diff, nan=0.0) + 1).astype(np.int64)
+        
+        result['trip_days'] = trip_days
+        result['daily_allowance_per_day'] = daily_rates
+        result['meal_cost_per_day'] = meal_rates
+        result['daily_allowance_total'] = trip_days * daily_rates
+        result['meal_cost_total'] = trip_days * meal_rates
+        result['total_cost'] = result['daily_allowance_total'] + result['meal_cost_total']
+        
+        return result
+
+# 전역 인스턴스 (처음 사용할 때 생성하여 import만으로는 pandas 로드/CSV 읽기를 하지 않음)
+_employee_manager = None
+_employee_manager_lock = threading.Lock()
+
+def get_employee_manager():
+    """전역 EmployeeManager 인스턴스 반환 (최초 호출 시 생성)"""
+    global _employee_manager
+    if _employee_manager is None:
+        with _employee_manager_lock:
+            if _employee_manager is None:
+                _employee_manager = EmployeeManager()
+    return _employee_manager
 
-# 전역 인스턴스 생성
-employee_manager = EmployeeManager() 
\ No newline at end of file
+def __getattr__(name):
+    """기존 `from employee_manager import employee_manager` 사용처 호환"""
+    if name == 'employee_manager':
+        return get_employee_manager()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}") 
\ No newline at end of file
@@ -1,11 +1,21 @@
 import openpyxl
 from openpyxl.styles import Font, Alignment, Border, Side, PatternFill
+from openpyxl.styles.cell_style import StyleArray
 from openpyxl.utils import range_boundaries
+from openpyxl.worksheet.cell_range import CellRange
+from openpyxl.worksheet.merge import MergedCellRange
 from openpyxl.worksheet.page import PageMargins
 from openpyxl.worksheet.pagebreak import Break
 from datetime import datetime
+from functools import lru_cache
+import io
+import math
 import os
-from employee_manager import employee_manager
+
+from instrumentation import stage
+
+# 문서 레이아웃 버전 (셀 배치나 서식이 바뀌면 올려서 렌더 캐시를 무효화)
+TEMPLATE_VERSION = "4"
 
 def parse_range(range_str):
     """셀 범위 문자열을 파싱하여 시작과 끝 좌표를 반환"""
@@ -15,6 +25,29 @@ def parse_range(range_str):
     except:
         return None, None, None, None
 
+def column_width_points(width):
+    """엑셀 열 너비(문자 수)를 pt로 변환 (기본 글꼴 숫자 폭 7px 기준)"""
+    return int(width * 7 + 5) * 0.75
+
+def merge_new_cells(ws, start_row, start_column, end_row, end_column):
+    """
+    기존 병합 범위와 겹치지 않는 새 범위를 병합
+    
+    openpyxl의 merge_cells는 병합할 때마다 기존 병합 범위 전체와 겹침 검사를 하므로
+    출장자 행처럼 행마다 반복되는 병합은 전체 시간이 행 수의 제곱에 비례한다.
+    새로 만드는 행의 병합은 겹칠 수 없으므로 검사 없이 바로 등록한다.
+    """
+    clean_merge_range = getattr(ws, '_clean_merge_range', None)
+    if clean_merge_range is None:
+        # openpyxl 워크시트가 아니면 (xlsx_writer 등) 기본 병합 사용
+        ws.merge_cells(start_row=start_row, start_column=start_column, end_row=end_row, end_column=end_column)
+        return
+    
+    cell_range = CellRange(min_col=start_column, min_row=start_row, max_col=end_column, max_row=end_row)
+    merged_range = MergedCellRange(ws, cell_range.coord)
+    ws.merged_cells.ranges.add(merged_range)
+    clean_merge_range(merged_range)
+
 def calculate_auto_dimensions(total_rows=50, total_cols=12, margin_inches=0.65):
     """A4 용지 크기에 맞춰 자동으로 행 높이와 열 너비 계산"""
     
@@ -60,10 +93,60 @@ def create_advanced_business_trip_report(employees_data, additional_costs, filen
         str: 생성된 파일의 전체 경로
     """
     
-    # 새 워크북 생성
+    # 워크북 생성
+    wb = build_advanced_business_trip_report_workbook(employees_data, additional_costs)
+    
+    # 출력 파일 경로
+    output_path = os.path.join(os.getcwd(), filename)
+    
+    # 엑셀 파일 저장
+    with stage('save'):
+        wb.save(output_path)
+    
+    return output_path
+
+def create_advanced_business_trip_report_bytes(employees_data, additional_costs):
+    """
+    출장복명서를 파일로 저장하지 않고 메모리에서 생성
+    
+    Args:
+        employees_data: 직원별 출장 데이터 리스트
+        additional_costs: 추가 비용 데이터 리스트
+    
+    Returns:
+        bytes: xlsx 파일 내용
+    """
+    wb = build_advanced_business_trip_report_workbook(employees_data, additional_costs)
+    return workbook_to_bytes(wb)
+
+def build_advanced_business_trip_report_workbook(employees_data, additional_costs):
+    """출장복명서 워크북 객체 생성 (저장하지 않음)"""
     wb = openpyxl.Workbook()
     ws = wb.active
     ws.title = "출장복명서"
+    with stage('populate'):
+        fill_advanced_business_trip_report(ws, employees_data, additional_costs)
+    return wb
+
+def workbook_to_bytes(wb):
+    """워크북을 디스크를 거치지 않고 xlsx 바이트로 변환"""
+    buffer = io.BytesIO()
+    with stage('save'):
+        wb.save(buffer)
+    return buffer.getvalue()
+
+def fill_advanced_business_trip_report(ws, employees_data, additional_costs):
+    """
+    주어진 워크시트에 출장복명서 내용, 스타일, 페이지 설정을 작성
+    
+    Args:
+        ws: 대상 워크시트 (새로 만든 빈 시트)
+        employees_data: 직원별 출장 데이터 리스트
+        additional_costs: 추가 비용 데이터 리스트
+    
+    Returns:
+        int: 페이지 나누기 행 번호
+    """
     
     # 기본 헤더 정보 설정
     current_date = datetime.now().strftime('%Y년 %m월 %d일')
@@ -281,6 +364,12 @@ def create_advanced_business_trip_report(employees_data, additional_costs, filen
     # 자동 크기 계산
     auto_dimensions = calculate_auto_dimensions(total_rows=50, total_cols=12, margin_inches=0.65)
     
+    # A4 페이지 단위 행 배분
+    pagination = get_advanced_report_pagination(
+        current_row, auto_dimensions['row_height'], auto_dimensions['col_width'],
+        auto_dimensions['usable_width_inch'], auto_dimensions['usable_height_inch']
+    )
+    
     # 추가수당 섹션 아래 페이지 나누기 행 계산
     bottom_row = current_row + 2  # "위와 같이..." 시작 행
     extra_row = bottom_row + 4     # 추가수당 시작 행
@@ -294,18 +383,14 @@ def create_advanced_business_trip_report(employees_data, additional_costs, filen
         ws.cell(row=second_page_start, column=1, value='* 2페이지에 선박 승선 증빙 사진 첨부')
     
     # 스타일 적용
-    apply_advanced_styles(ws, auto_dimensions, current_row)
+    with stage('styles'):
+        apply_advanced_styles(ws, auto_dimensions, current_row, pagination['last_row'])
     
     # 페이지 설정 적용 (동적 페이지 나누기 포함)
-    setup_page_settings_advanced(ws, page_break_row)
+    with stage('page_setup'):
+        setup_page_settings_advanced(ws, pagination)
     
-    # 출력 파일 경로
-    output_path = os.path.join(os.getcwd(), filename)
-    
-    # 엑셀 파일 저장
-    wb.save(output_path)
-    
-    return output_path
+    return page_break_row
 
 def create_business_trip_report(data, filename="출장보고서.xlsx"):
     """
@@ -535,8 +620,8 @@ def setup_page_settings(ws):
     ws.sheet_view.view = 'pageBreakPreview'
     ws.sheet_view.zoomScale = 100
 
-def setup_page_settings_advanced(ws, page_break_row):
-    """페이지 설정 및 인쇄 영역 설정 (동적 페이지 나누기)"""
+def setup_page_settings_advanced(ws, pagination):
+    """페이지 설정 및 인쇄 영역 설정 (get_advanced_report_pagination 결과로 페이지 나누기)"""
     
     # 페이지 방향 설정 (세로)
     ws.page_setup.orientation = ws.ORIENTATION_PORTRAIT
@@ -550,16 +635,21 @@ def setup_page_settings_advanced(ws, page_break_row):
         header=0.3, footer=0.3
     )
     
-    # 페이지에 맞춤 설정
+    # 페이지에 맞춤 설정 (세로는 행 수에 따라 페이지 추가, 축소하지 않음)
     ws.page_setup.fitToPage = True
-    ws.page_setup.fitToHeight = 2  # 정확히 2페이지
+    ws.page_setup.fitToHeight = 0
     ws.page_setup.fitToWidth = 1   # 가로 1페이지
     
     # 인쇄영역 설정
-    ws.print_area = 'A1:L50'
+    ws.print_area = pagination['print_area']
     
-    # 동적 페이지 나누기 (추가수당 섹션 아래)
-    ws.row_breaks.append(Break(id=page_break_row))
+    # 연속 페이지에 지급신청 헤더 반복
+    if pagination['print_title_rows']:
+        ws.print_title_rows = pagination['print_title_rows']
+    
+    # 동적 페이지 나누기 (지급신청 표 중간, 추가수당 섹션 아래)
+    for row in pagination['row_breaks']:
+        ws.row_breaks.append(Break(id=row))
     
     # 격자선 인쇄 설정
     ws.print_options.gridLines = False
@@ -573,123 +663,480 @@ def setup_page_settings_advanced(ws, page_break_row):
     ws.sheet_view.view = 'pageBreakPreview'
     ws.sheet_view.zoomScale = 100
 
-def apply_advanced_styles(ws, auto_dimensions, data_end_row):
-    """스타일 적용"""
+# 복명서 연속 페이지마다 반복할 지급신청 헤더 행 (시작, 끝)
+ADVANCED_REPORT_TITLE_ROWS = (10, 12)
+
+# 복명서 공용 스타일 객체 (모듈 로드 시 한 번만 생성하여 모든 문서가 공유)
+THIN_SIDE = Side(style='thin', color='000000')
+THICK_SIDE = Side(style='thick', color='000000')
+
+ADVANCED_REPORT_STYLES = {
+    'default_font': Font(name='맑은 고딕', size=10),
+    'title_font': Font(name='맑은 고딕', size=24, bold=True),        # 1행 제목
+    'unit_font': Font(name='맑은 고딕', size=8),                     # 9행 (단위:원)
+    'bottom_bold_font': Font(name='맑은 고딕', size=16, bold=True),  # 하단 텍스트들
+    'no_border': Border(),
+    'black_border': Border(left=THIN_SIDE, right=THIN_SIDE, top=THIN_SIDE, bottom=THIN_SIDE),
+    'page_break_border': Border(left=THIN_SIDE, right=THIN_SIDE, top=THIN_SIDE, bottom=THICK_SIDE),  # 하단만 굵게
+    'center': Alignment(horizontal='center', vertical='center', wrap_text=True),
+    'right': Alignment(horizontal='right', vertical='center', wrap_text=True),
+}
+
+@lru_cache(maxsize=128)
+def get_advanced_report_row_heights(data_end_row, default_row_height):
+    """
+    복명서 1행부터 추가수당 섹션 끝(page_break_row)까지의 행 높이
     
-    # 다양한 폰트 설정
-    default_font = Font(name='맑은 고딕', size=10)
-    title_font = Font(name='맑은 고딕', size=24, bold=True)  # 1행 제목
-    unit_font = Font(name='맑은 고딕', size=8)  # 9행 (단위:원)
+    Returns:
+        tuple: ((행, 높이), ...)
+    """
+    bottom_row = data_end_row + 2  # "위와 같이..." 시작 행
+    extra_row = bottom_row + 4     # 추가수당 시작 행
+    page_break_row = extra_row + 3 # 추가수당 섹션 끝
+    
+    # 행별 높이 세밀 조정
+    row_heights = {
+        1: 40,    # 1행: 출장복명서 - 크게
+        2: 18,    # 2행: 간격 줄임
+        3: 50,    # 3행: 간격 늘림
+        4: 18,    # 4행: 기본
+        5: 25,    # 5행: 기본
+        6: 18,    # 6행: 간격 많이 줄임
+        7: 18,    # 7행: 간격 많이 줄임
+        8: 60,    # 8행: 출장결과 - 4-5줄 여유있게
+        9: 15,    # 9행: (단위:원) - 많이 줄임
+        10: 20,   # 10행: 지급신청
+        11: 18,   # 11행: 헤더 - 절반으로 줄임
+        12: 18,   # 12행: 헤더 - 절반으로 줄임
+    }
+    
+    # 13행부터 데이터 끝까지, 합계 행까지 20pt
+    for row_num in range(13, data_end_row + 2):
+        row_heights[row_num] = 20
+    
+    # 하단 문구들 간격 조정
+    row_heights[bottom_row] = 22      # "위와 같이 출장 복명서를 제출합니다" 
+    row_heights[bottom_row + 1] = 22  # 날짜
+    row_heights[bottom_row + 2] = 22  # "주식회사 엔이비"
+    
+    return tuple((row_num, row_heights.get(row_num, default_row_height)) for row_num in range(1, page_break_row + 1))
+
+# 페이지당 남겨 둘 여유 높이 (인쇄 pt). Excel의 픽셀 반올림으로 계산보다 조금 더 길어져도
+# 자동 페이지 나누기가 생기지 않도록 함
+PAGE_HEADROOM_POINTS = 12
+
+def fit_scale_percent(available_points, content_points):
+    """내용을 가용 영역에 맞추는 인쇄 배율 (%). Excel처럼 정수로 내림하고 10~100% 범위로 제한"""
+    return max(10, min(100, int(available_points * 100 / content_points)))
 
-    bottom_bold_font = Font(name='맑은 고딕', size=16, bold=True)  # 하단 텍스트들
+def get_scaled_page_height(usable_height_points, scale_percent):
+    """배율 적용 후 한 페이지에 들어가는 행 높이 합계 (pt, 여유 높이 제외)"""
+    return (usable_height_points - PAGE_HEADROOM_POINTS) * 100 / scale_percent
+
+def pixel_row_height(height):
+    """Excel이 화면/인쇄에 쓰는 높이 (96dpi 픽셀 단위로 올림, 1px = 0.75pt)"""
+    return math.ceil(height / 0.75) * 0.75
+
+def paginate_rows(row_heights, page_height, title_height=0, keep_together=()):
+    """
+    행 높이 합계가 페이지 높이를 넘지 않도록 페이지 나누기 위치 계산
     
-    # 테두리 스타일 (검은색)
-    black_border = Border(
-        left=Side(style='thin', color='000000'),
-        right=Side(style='thin', color='000000'),
-        top=Side(style='thin', color='000000'),
-        bottom=Side(style='thin', color='000000')
-    )
+    Args:
+        row_heights: ((행, 높이), ...) 순서대로
+        page_height: 페이지당 인쇄 가능한 높이 (pt, 배율 반영)
+        title_height: 2페이지부터 반복되는 인쇄 제목 행 높이 합계
+        keep_together: 같은 페이지에 둘 (시작 행, 끝 행) 범위들
+    
+    Returns:
+        list: 페이지 나누기 행 번호 (해당 행 아래에서 나눔)
+    """
+    # 같은 페이지에 둘 행들을 하나의 블록으로 묶음
+    blocks = []
+    for row, height in row_heights:
+        group = next(((start, end) for start, end in keep_together if start <= row <= end), None)
+        if blocks and group is not None and blocks[-1][2] == group:
+            blocks[-1][1] = row
+            blocks[-1][3] += height
+        else:
+            blocks.append([row, row, group, height])
+    
+    breaks = []
+    used = 0
+    for start, end, _, height in blocks:
+        if used > 0 and used + height > page_height:
+            breaks.append(start - 1)
+            used = title_height
+        used += height
+    return breaks
+
+@lru_cache(maxsize=128)
+def get_advanced_report_pagination(data_end_row, default_row_height, col_width, usable_width_inch, usable_height_inch):
+    """
+    calculate_auto_dimensions의 A4 인쇄 가능 영역 기준으로 복명서 페이지 나누기 계산
+    
+    지급신청 표가 한 페이지를 넘으면 표 중간에서 나누고 연속 페이지마다 지급신청 헤더
+    (ADVANCED_REPORT_TITLE_ROWS)를 반복한다. 합계~추가수당 섹션은 한 페이지에 둔다.
+    추가수당 섹션 아래는 증빙 사진 첨부용 한 페이지를 둔다.
+    
+    Returns:
+        dict: 'row_breaks', 'page_break_row', 'last_row', 'print_area', 'print_title_rows', 'pages'
+    """
+    row_heights = tuple((row, pixel_row_height(height))
+                        for row, height in get_advanced_report_row_heights(data_end_row, default_row_height))
+    page_break_row = row_heights[-1][0]
+    heights = dict(row_heights)
+    
+    # 가로 1페이지 맞춤 배율(정수 %)만큼 세로로 더 많은 행이 들어감
+    table_width = column_width_points(col_width) * 12
+    scale = fit_scale_percent(usable_width_inch * 72, table_width)
+    page_height = get_scaled_page_height(usable_height_inch * 72, scale)
+    
+    title_start, title_end = ADVANCED_REPORT_TITLE_ROWS
+    title_height = sum(heights[row] for row in range(title_start, title_end + 1))
+    
+    breaks = paginate_rows(row_heights, page_height, title_height, keep_together=((data_end_row + 1, page_break_row),))
+    print_title_rows = f"{title_start}:{title_end}" if breaks else None
+    
+    # 첨부 페이지: 남은 높이를 기본 행 높이로 채움
+    attachment_height = page_height - (title_height if print_title_rows else 0)
+    last_row = page_break_row + max(1, int(attachment_height // pixel_row_height(default_row_height)))
+    
+    return {
+        'row_breaks': tuple(breaks) + (page_break_row,),
+        'page_break_row': page_break_row,
+        'last_row': last_row,
+        'print_area': f"A1:L{last_row}",
+        'print_title_rows': print_title_rows,
+        'pages': len(breaks) + 2,
+    }
+
+@lru_cache(maxsize=128)
+def get_advanced_report_layout(data_end_row, default_row_height, col_width, last_row):
+    """
+    복명서 스타일 레이아웃을 data_end_row별로 미리 계산하여 캐시
+    
+    Args:
+        data_end_row: 마지막 데이터 행 번호
+        default_row_height: 별도 지정이 없는 행의 높이
+        col_width: 열 너비
+        last_row: 인쇄 영역 마지막 행 (첨부 페이지 포함)
+    
+    Returns:
+        dict: 'styles' (font, border, alignment 조합 튜플),
+              'cells' ((행, 열, 스타일 번호) 튜플), 'row_heights', 'col_width'
+    """
+    styles = ADVANCED_REPORT_STYLES
     
     # 추가수당 섹션 아래 굵은 밑줄을 위한 행 계산
     bottom_row = data_end_row + 2  # "위와 같이..." 시작 행
     extra_row = bottom_row + 4     # 추가수당 시작 행
     page_break_row = extra_row + 3 # 추가수당 섹션 끝 (3행에 걸쳐 있음)
     
-    # 표 영역에 모든 셀에 테두리 적용 (A1부터 L50까지)
-    for row in range(1, 51):  # 1행부터 50행까지
-        for col in range(1, 13):  # A열부터 L열까지
-            cell = ws.cell(row=row, column=col)
-            
+    # 하단 문구 ("위와 같이...", 날짜, "주식회사 엔이비")는 A열에만 값이 있음
+    bottom_text_cells = {(bottom_row, 1), (bottom_row + 1, 1), (bottom_row + 2, 1)}
+    
+    style_combos = []
+    style_index = {}
+    cells = []
+    
+    # 표 영역 (A1부터 첨부 페이지 첫 행까지, 그 아래 빈 행은 기본 스타일 유지)
+    for row in range(1, page_break_row + 2):
+        for col in range(1, 13):
             # A1:L1, A2:F2, A3:F3는 테두리 없음
             if (row == 1) or (row == 2 and col <= 6) or (row == 3 and col <= 6):
-                cell.border = None
+                border = styles['no_border']
             # 데이터 영역 (13행부터 data_end_row까지)는 모든 테두리 적용
             elif 13 <= row <= data_end_row:
-                cell.border = black_border
+                border = styles['black_border']
             # 추가수당 섹션 아래에 굵은 테두리 적용 (동적 페이지 구분선)
             elif row == page_break_row:
-                cell.border = Border(
-                    left=Side(style='thin', color='000000'),
-                    right=Side(style='thin', color='000000'),
-                    top=Side(style='thin', color='000000'),
-                    bottom=Side(style='thick', color='000000')  # 하단만 굵게
-                )
+                border = styles['page_break_border']
             # 밑줄 아래(2페이지)는 테두리 없음
             elif row > page_break_row:
-                cell.border = None
+                border = styles['no_border']
             else:
-                cell.border = black_border
-                
-            # 정렬 설정
+                border = styles['black_border']
+            
+            # 정렬 및 폰트 설정
             if row == 9:  # A9:L9 (단위:원)는 오른쪽 정렬
-                cell.alignment = Alignment(horizontal='right', vertical='center', wrap_text=True)
-                cell.font = unit_font
-            elif 13 <= row <= data_end_row:  # 데이터 행들은 중앙 정렬
-                cell.alignment = Alignment(horizontal='center', vertical='center', wrap_text=True)
-                cell.font = default_font
+                alignment = styles['right']
+                font = styles['unit_font']
             else:
-                cell.alignment = Alignment(horizontal='center', vertical='center', wrap_text=True)
-                cell.font = default_font
-    
-    # 특별한 셀들의 폰트 설정
-    if ws['A1'].value:  # 1행 제목
-        ws['A1'].font = title_font
-    
-    # 6-7행 출발/도착 시간은 기본 폰트 사용 (별도 설정 불필요)
+                alignment = styles['center']
+                font = styles['default_font']
+            
+            if row == 1 and col == 1:
+                font = styles['title_font']
+            elif (row, col) in bottom_text_cells:
+                font = styles['bottom_bold_font']
+            
+            combo = (font, border, alignment)
+            if combo not in style_index:
+                style_index[combo] = len(style_combos)
+                style_combos.append(combo)
+            cells.append((row, col, style_index[combo]))
     
-    # 하단 텍스트들 찾아서 bold 22pt 적용 (6-7행 제외)
-    for row in range(1, 51):
-        for col in range(1, 13):
-            cell = ws.cell(row=row, column=col)
-            if cell.value and isinstance(cell.value, str):
-                # 6-7행은 제외하고 적용
-                if row not in [6, 7]:
-                    if ('위와 같이 출장 복명서를 제출합니다' in cell.value or 
-                        '년' in cell.value and '월' in cell.value and '일' in cell.value or
-                        '주 식 회 사 엔 이 비' in cell.value):
-                        cell.font = bottom_bold_font
+    row_heights = dict(get_advanced_report_row_heights(data_end_row, default_row_height))
     
-    # 행별 높이 세밀 조정
-    row_heights = {
-        1: 40,    # 1행: 출장복명서 - 크게
-        2: 18,    # 2행: 간격 줄임
-        3: 50,    # 3행: 간격 늘림
-        4: 18,    # 4행: 기본
-        5: 25,    # 5행: 기본
-        6: 18,    # 6행: 간격 많이 줄임
-        7: 18,    # 7행: 간격 많이 줄임
-        8: 60,    # 8행: 출장결과 - 4-5줄 여유있게
-        9: 15,    # 9행: (단위:원) - 많이 줄임
-        10: 20,   # 10행: 지급신청
-        11: 18,   # 11행: 헤더 - 절반으로 줄임
-        12: 18,   # 12행: 헤더 - 절반으로 줄임
+    return {
+        'styles': tuple(style_combos),
+        'cells': tuple(cells),
+        'row_heights': tuple((row_num, row_heights.get(row_num, default_row_height)) for row_num in range(1, last_row + 1)),
+        'col_width': col_width,
     }
+
+def register_cell_styles(wb, style_combos):
+    """(font, border, alignment) 조합을 워크북 스타일 테이블에 한 번만 등록하고 StyleArray 반환"""
+    style_arrays = []
+    for font, border, alignment in style_combos:
+        style = StyleArray()
+        style.fontId = wb._fonts.add(font)
+        style.borderId = wb._borders.add(border)
+        style.alignmentId = wb._alignments.add(alignment)
+        style_arrays.append(style)
+    return style_arrays
+
+def apply_advanced_styles(ws, auto_dimensions, data_end_row, last_row):
+    """미리 계산된 레이아웃으로 스타일 적용 (실제 사용하는 행까지만)"""
     
-    # 13행부터 데이터 끝까지 18pt로 설정
-    for row_num in range(13, data_end_row + 1):
-        row_heights[row_num] = 20  # 데이터 행들 모두 18pt
-    
-    # 합계 행도 18pt
-    row_heights[data_end_row + 1] = 20
+    layout = get_advanced_report_layout(data_end_row, auto_dimensions['row_height'], auto_dimensions['col_width'], last_row)
     
-    # 하단 문구들 간격 조정
-    bottom_start_row = data_end_row + 2  # "위와 같이 출장 복명서를 제출합니다" 시작 행
-    row_heights[bottom_start_row] = 22      # "위와 같이 출장 복명서를 제출합니다" 
-    row_heights[bottom_start_row + 1] = 22  # 날짜
-    row_heights[bottom_start_row + 2] = 22  # "주식회사 엔이비"
+    # 조합별 스타일은 워크북당 한 번만 등록하고 셀에는 복사본만 지정
+    style_arrays = register_cell_styles(ws.parent, layout['styles'])
+    for row, col, style_idx in layout['cells']:
+        ws.cell(row=row, column=col)._style = StyleArray(style_arrays[style_idx])
     
     # 행 높이 적용
-    for row_num in range(1, 51):
-        if row_num in row_heights:
-            ws.row_dimensions[row_num].height = row_heights[row_num]
-        else:
-            ws.row_dimensions[row_num].height = auto_dimensions['row_height']
+    for row_num, height in layout['row_heights']:
+        ws.row_dimensions[row_num].height = height
     
     # 자동 계산된 열 너비 적용
     for col in range(1, 13):  # A~L열
         col_letter = openpyxl.utils.get_column_letter(col)
-        ws.column_dimensions[col_letter].width = auto_dimensions['col_width']
+        ws.column_dimensions[col_letter].width = layout['col_width']
+
+# 다중 출장 워크북 요약 시트 스타일 (모든 요약 셀이 공유)
+TRIP_SUMMARY_STYLES = {
+    'title_font': Font(name='맑은 고딕', size=16, bold=True),
+    'info_font': Font(name='맑은 고딕', size=9),
+    'header_font': Font(name='맑은 고딕', size=10, bold=True),
+    'default_font': Font(name='맑은 고딕', size=10),
+    'no_border': Border(),
+    'black_border': Border(left=THIN_SIDE, right=THIN_SIDE, top=THIN_SIDE, bottom=THIN_SIDE),
+    'center': Alignment(horizontal='center', vertical='center', wrap_text=True),
+    'right': Alignment(horizontal='right', vertical='center', wrap_text=True),
+}
+
+# 요약 시트 열: (제목, 너비)
+TRIP_SUMMARY_COLUMNS = [
+    ('No', 6),
+    ('시트', 24),
+    ('연구과제명', 28),
+    ('출장지', 14),
+    ('출장기간', 24),
+    ('출장자 수', 10),
+    ('일비·식비', 14),
+    ('추가비용', 14),
+    ('합계', 14),
+]
+
+# 요약 시트 표 헤더 행 (여러 페이지면 반복 인쇄)
+TRIP_SUMMARY_HEADER_ROW = 3
+
+def fill_trip_summary_sheet(ws, summaries):
+    """
+    다중 출장 워크북의 요약 시트 작성
+    
+    Args:
+        ws: 대상 워크시트 (새로 만든 빈 시트)
+        summaries: 출장별 요약 딕셔너리 리스트
+                   (sheet_title, project_name, destination, start_date, end_date,
+                    travelers, employee_total, additional_total)
+    """
+    styles = TRIP_SUMMARY_STYLES
+    last_col = len(TRIP_SUMMARY_COLUMNS)
+    header_row = TRIP_SUMMARY_HEADER_ROW
+    first_data_row = header_row + 1
+    total_row = first_data_row + len(summaries)
+    
+    # 제목, 작성일
+    ws.merge_cells(start_row=1, start_column=1, end_row=1, end_column=last_col)
+    title_cell = ws.cell(row=1, column=1, value='출장복명서 요약')
+    title_cell.font = styles['title_font']
+    title_cell.alignment = styles['center']
+    title_cell.border = styles['no_border']
+    
+    ws.merge_cells(start_row=2, start_column=1, end_row=2, end_column=last_col)
+    info_cell = ws.cell(row=2, column=1, value=f"작성일: {datetime.now().strftime('%Y년 %m월 %d일')}  /  출장 {len(summaries)}건")
+    info_cell.font = styles['info_font']
+    info_cell.alignment = styles['right']
+    info_cell.border = styles['no_border']
+    
+    # 표 헤더
+    for col, (title, width) in enumerate(TRIP_SUMMARY_COLUMNS, start=1):
+        cell = ws.cell(row=header_row, column=col, value=title)
+        cell.font = styles['header_font']
+        cell.border = styles['black_border']
+        cell.alignment = styles['center']
+        ws.column_dimensions[openpyxl.utils.get_column_letter(col)].width = width
+    
+    # 출장별 행
+    for index, summary in enumerate(summaries):
+        row = first_data_row + index
+        period = f"{summary['start_date'].strftime('%Y.%m.%d')} ~ {summary['end_date'].strftime('%Y.%m.%d')}"
+        values = [
+            index + 1,
+            summary['sheet_title'],
+            summary['project_name'],
+            summary['destination'],
+            period,
+            summary['travelers'],
+            summary['employee_total'],
+            summary['additional_total'],
+            f"=G{row}+H{row}",
+        ]
+        for col, value in enumerate(values, start=1):
+            cell = ws.cell(row=row, column=col, value=value)
+            cell.font = styles['default_font']
+            cell.border = styles['black_border']
+            cell.alignment = styles['right'] if col >= 7 else styles['center']
+    
+    # 합계 행
+    ws.merge_cells(start_row=total_row, start_column=1, end_row=total_row, end_column=5)
+    ws.cell(row=total_row, column=1, value='합계')
+    last_data_row = total_row - 1
+    for col in range(6, last_col + 1):
+        col_letter = openpyxl.utils.get_column_letter(col)
+        value = f"=SUM({col_letter}{first_data_row}:{col_letter}{last_data_row})" if summaries else 0
+        ws.cell(row=total_row, column=col, value=value)
+    for col in range(1, last_col + 1):
+        cell = ws.cell(row=total_row, column=col)
+        cell.font = styles['header_font']
+        cell.border = styles['black_border']
+        cell.alignment = styles['right'] if col >= 6 else styles['center']
+    
+    # 행 높이
+    ws.row_dimensions[1].height = 30
+    ws.row_dimensions[2].height = 18
+    for row in range(header_row, total_row + 1):
+        ws.row_dimensions[row].height = 20
+    
+    # 페이지 설정 (A4 가로, 가로 1페이지 맞춤, 표 헤더 반복)
+    ws.page_setup.orientation = ws.ORIENTATION_LANDSCAPE
+    ws.page_setup.paperSize = ws.PAPERSIZE_A4
+    ws.page_margins = PageMargins(left=0.5, right=0.5, top=0.65, bottom=0.65, header=0.3, footer=0.3)
+    ws.page_setup.fitToPage = True
+    ws.page_setup.fitToHeight = 0
+    ws.page_setup.fitToWidth = 1
+    ws.print_area = f"A1:{openpyxl.utils.get_column_letter(last_col)}{total_row}"
+    ws.print_title_rows = f"{header_row}:{header_row}"
+    ws.print_options.horizontalCentered = True
+
+# 출장신청서 출장자 행 (12행부터 최소 8행, 출장자가 더 많으면 행을 늘림)
+APPLICATION_TRAVELER_START_ROW = 12
+APPLICATION_MIN_TRAVELER_ROWS = 8
+
+# 출장자가 많아 여러 페이지가 될 때 연속 페이지마다 반복할 출장자 표 헤더 행 (시작, 끝)
+APPLICATION_TITLE_ROWS = (10, 11)
+
+# 출장신청서 여백 (인치)
+APPLICATION_MARGIN_X_INCH = 0.7
+APPLICATION_MARGIN_Y_INCH = 0.8
+
+# 출장신청서 열 너비
+APPLICATION_COLUMN_WIDTHS = {
+    'A': 15,  # 직급/라벨
+    'B': 15,  # 병합용
+    'C': 15,  # 병합용
+    'D': 15,  # 성명/값 (18→15로 줄임)
+    'E': 19,  # 계좌번호/라벨 (동일 간격)
+    'F': 19,  # 병합용 (동일 간격)
+    'G': 19,  # 비고 (동일 간격)
+}
+
+# 출장신청서 공용 스타일 객체 (복명서와 마찬가지로 모듈 로드 시 한 번만 생성)
+APPLICATION_STYLES = {
+    'default_font': Font(name='맑은 고딕', size=11),
+    'title_font': Font(name='맑은 고딕', size=20, bold=True),           # 제목 크게
+    'header_font': Font(name='맑은 고딕', size=10, bold=True),          # 헤더
+    'section_header_font': Font(name='맑은 고딕', size=13, bold=True),  # 섹션 헤더 (출장자용)
+    'bottom_font': Font(name='맑은 고딕', size=14, bold=True),          # 하단 문구
+    'black_border': Border(left=THIN_SIDE, right=THIN_SIDE, top=THIN_SIDE, bottom=THIN_SIDE),
+    'center': Alignment(horizontal='center', vertical='center', wrap_text=True),
+}
+
+def get_application_footer_row(traveler_rows):
+    """'위와 같이 출장을 신청합니다.' 행 번호 (출장자 행 바로 아래, 날짜/회사명이 이어짐)"""
+    return APPLICATION_TRAVELER_START_ROW + traveler_rows
+
+@lru_cache(maxsize=128)
+def get_application_row_heights(traveler_rows):
+    """
+    출장신청서 행 높이
+    
+    Returns:
+        tuple: ((행, 높이), ...) 1행부터 회사명 행까지
+    """
+    footer_row = get_application_footer_row(traveler_rows)
+    
+    # 행 높이 세밀 조정
+    row_heights = {
+        1: 60,   # 제목 - 살짝 늘림
+        2: 30,   # 결재란
+        3: 90,   # 결재란 - 더 늘림 (60→70)
+        4: 40,   # 소속/과제책임자
+        5: 40,   # 연구과제명
+        6: 120,   # 출장기간/출장지
+        7: 160,   # 출장목적 (긴 텍스트)
+        8: 40,   # 교통비 헤더
+        9: 40,   # 교통비 상세
+        10: 40,  # 출장자 헤더
+        11: 32,  # 출장자 테이블 헤더 (25+2)
+        footer_row: 40,      # 신청 문구 (25+5)
+        footer_row + 1: 40,  # 날짜 (25+5)
+        footer_row + 2: 60,  # 회사명 (25+5)
+    }
+    
+    # 출장자 데이터 행들 2pt씩 늘림
+    for row_num in range(APPLICATION_TRAVELER_START_ROW, footer_row):
+        row_heights[row_num] = 32  # 30
+    
+    return tuple(sorted(row_heights.items()))
+
+@lru_cache(maxsize=128)
+def get_application_pagination(traveler_rows):
+    """
+    출장자 행이 기본 8행을 넘는 출장신청서의 페이지 나누기 계산
+    
+    기본 8행 문서가 A4 1페이지에 맞춰지는 배율을 그대로 유지하고, 넘치는 출장자는
+    다음 페이지로 이어 쓴다. 연속 페이지마다 출장자 표 헤더(APPLICATION_TITLE_ROWS)를
+    반복하고, 하단 문구 3행은 한 페이지에 둔다.
+    
+    Returns:
+        dict: 'scale' (인쇄 배율 %), 'row_breaks', 'print_title_rows', 'pages'
+    """
+    usable_width = (8.27 - APPLICATION_MARGIN_X_INCH * 2) * 72
+    usable_height = (11.69 - APPLICATION_MARGIN_Y_INCH * 2) * 72
+    table_width = sum(column_width_points(width) for width in APPLICATION_COLUMN_WIDTHS.values())
+    base_height = sum(pixel_row_height(height)
+                      for _, height in get_application_row_heights(APPLICATION_MIN_TRAVELER_ROWS))
+    scale = min(fit_scale_percent(usable_width, table_width),
+                fit_scale_percent(usable_height - PAGE_HEADROOM_POINTS, base_height))
+    
+    row_heights = tuple((row, pixel_row_height(height)) for row, height in get_application_row_heights(traveler_rows))
+    heights = dict(row_heights)
+    title_start, title_end = APPLICATION_TITLE_ROWS
+    title_height = sum(heights[row] for row in range(title_start, title_end + 1))
+    footer_row = get_application_footer_row(traveler_rows)
+    
+    breaks = paginate_rows(row_heights, get_scaled_page_height(usable_height, scale), title_height,
+                           keep_together=((footer_row, footer_row + 2),))
+    return {
+        'scale': scale,
+        'row_breaks': tuple(breaks),
+        'print_title_rows': f"{title_start}:{title_end}" if breaks else None,
+        'pages': len(breaks) + 1,
+    }
 
 def create_business_trip_application(application_data, filename="출장신청서.xlsx"):
     """
@@ -703,14 +1150,57 @@ def create_business_trip_application(application_data, filename="출장신청서
         str: 생성된 파일의 전체 경로
     """
     
-    # 새 워크북 생성
+    # 워크북 생성
+    wb = build_business_trip_application_workbook(application_data)
+    
+    # 출력 파일 경로
+    output_path = os.path.join(os.getcwd(), filename)
+    
+    # 엑셀 파일 저장
+    with stage('save'):
+        wb.save(output_path)
+    
+    return output_path
+
+def create_business_trip_application_bytes(application_data):
+    """
+    출장신청서를 파일로 저장하지 않고 메모리에서 생성
+    
+    Args:
+        application_data: 출장신청서 데이터 딕셔너리
+    
+    Returns:
+        bytes: xlsx 파일 내용
+    """
+    wb = build_business_trip_application_workbook(application_data)
+    return workbook_to_bytes(wb)
+
+def build_business_trip_application_workbook(application_data):
+    """출장신청서 워크북 객체 생성 (저장하지 않음)"""
     wb = openpyxl.Workbook()
     ws = wb.active
     ws.title = "출장신청서"
+    with stage('populate'):
+        fill_business_trip_application(ws, application_data)
+    return wb
+
+def fill_business_trip_application(ws, application_data):
+    """
+    주어진 워크시트에 출장신청서 내용, 스타일, 페이지 설정을 작성
+    
+    Args:
+        ws: 대상 워크시트 (새로 만든 빈 시트)
+        application_data: 출장신청서 데이터 딕셔너리
+    """
     
     # 현재 날짜
     current_date = datetime.now().strftime('%Y년 %m월 %d일')
     
+    # 출장자 행 수 (최소 8행, 출장자가 더 많으면 그만큼 늘리고 하단 문구를 아래로 이동)
+    travelers = application_data.get('travelers', [])
+    traveler_rows = max(APPLICATION_MIN_TRAVELER_ROWS, len(travelers))
+    footer_row = get_application_footer_row(traveler_rows)
+    
     # 기본 셀 데이터 매핑
     cell_data = {
         'A1:G1': '출 장 신 청 서',
@@ -745,9 +1235,9 @@ def create_business_trip_application(application_data, filename="출장신청서
         'D11': '성명',
         'E11:F11': '계좌번호',
         'G11': '비고',
-        'A20:G20': '위와 같이 출장을 신청합니다.',
-        'A21:G21': current_date,
-        'A22:G22': '주 식 회 사 엔 이 비',
+        f'A{footer_row}:G{footer_row}': '위와 같이 출장을 신청합니다.',
+        f'A{footer_row + 1}:G{footer_row + 1}': current_date,
+        f'A{footer_row + 2}:G{footer_row + 2}': '주 식 회 사 엔 이 비',
     }
     
     # 기본 정보 입력
@@ -769,18 +1259,15 @@ def create_business_trip_application(application_data, filename="출장신청서
             cell = ws.cell(row=min_row, column=min_col)
             cell.value = value
     
-    # 출장자 데이터 입력 (12행부터 19행까지 - 최대 8명)
-    travelers = application_data.get('travelers', [])
-    
-    # 8행 모두 병합 처리 (12-19행)
-    for row_idx in range(8):  # 0~7 (8행)
-        current_row = 12 + row_idx
+    # 출장자 데이터 입력 (12행부터, 최소 8행 모두 병합 처리)
+    for row_idx in range(traveler_rows):
+        current_row = APPLICATION_TRAVELER_START_ROW + row_idx
         
         # A열: 직급 (A:C 병합)
-        ws.merge_cells(start_row=current_row, start_column=1, end_row=current_row, end_column=3)
+        merge_new_cells(ws, current_row, 1, current_row, 3)
         
         # E-F열: 계좌번호 (병합)
-        ws.merge_cells(start_row=current_row, start_column=5, end_row=current_row, end_column=6)
+        merge_new_cells(ws, current_row, 5, current_row, 6)
         
         # 데이터가 있는 경우에만 값 입력
         if row_idx < len(travelers):
@@ -791,48 +1278,29 @@ def create_business_trip_application(application_data, filename="출장신청서
             ws.cell(row=current_row, column=7, value=traveler.get('note', ''))
     
     # 스타일 적용
-    apply_application_styles(ws)
+    with stage('styles'):
+        apply_application_styles(ws, traveler_rows)
     
     # 페이지 설정 적용
-    setup_application_page_settings(ws)
-    
-    # 출력 파일 경로
-    output_path = os.path.join(os.getcwd(), filename)
-    
-    # 엑셀 파일 저장
-    wb.save(output_path)
-    
-    return output_path
+    with stage('page_setup'):
+        setup_application_page_settings(ws, traveler_rows)
 
-def apply_application_styles(ws):
-    """출장신청서용 스타일 적용"""
-    
-    # 다양한 폰트 설정
-    default_font = Font(name='맑은 고딕', size=11)
-    title_font = Font(name='맑은 고딕', size=20, bold=True)  # 제목 크게
-    header_font = Font(name='맑은 고딕', size=10, bold=True)  # 헤더
-    section_header_font = Font(name='맑은 고딕', size=13, bold=True)  # 섹션 헤더 (출장자용)
-    small_font = Font(name='맑은 고딕', size=9)  # 작은 글씨
-    bottom_font = Font(name='맑은 고딕', size=14, bold=True)  # 하단 문구
-    
-    # 테두리 스타일
-    black_border = Border(
-        left=Side(style='thin', color='000000'),
-        right=Side(style='thin', color='000000'),
-        top=Side(style='thin', color='000000'),
-        bottom=Side(style='thin', color='000000')
-    )
-    
-    # 굵은 테두리 (결재란용)
-    thick_border = Border(
-        left=Side(style='medium', color='000000'),
-        right=Side(style='medium', color='000000'),
-        top=Side(style='medium', color='000000'),
-        bottom=Side(style='medium', color='000000')
-    )
-    
-    # 모든 셀에 기본 스타일 적용 (A1부터 G22까지)
-    for row in range(1, 23):
+def apply_application_styles(ws, traveler_rows=APPLICATION_MIN_TRAVELER_ROWS):
+    """출장신청서용 스타일 적용 (출장자 행 수에 비례하는 행만 처리)"""
+    
+    styles = APPLICATION_STYLES
+    default_font = styles['default_font']
+    title_font = styles['title_font']
+    header_font = styles['header_font']
+    section_header_font = styles['section_header_font']
+    bottom_font = styles['bottom_font']
+    black_border = styles['black_border']
+    center_alignment = styles['center']
+    
+    footer_row = get_application_footer_row(traveler_rows)
+    
+    # 모든 셀에 기본 스타일 적용 (A1부터 회사명 행까지)
+    for row in range(1, footer_row + 3):
         for col in range(1, 8):  # A~G열
             cell = ws.cell(row=row, column=col)
             
@@ -840,12 +1308,12 @@ def apply_application_styles(ws):
             if row == 1:
                 cell.border = None
                 cell.font = title_font
-                cell.alignment = Alignment(horizontal='center', vertical='center', wrap_text=True)
+                cell.alignment = center_alignment
             # 2-3행 결재란 (테두리 bold 제거)
             elif 2 <= row <= 3 and 4 <= col <= 7:  # D2:G3
-                cell.border = black_border  # thick_border → black_border로 변경
+                cell.border = black_border
                 cell.font = default_font  # bold 제거
-                cell.alignment = Alignment(horizontal='center', vertical='center', wrap_text=True)
+                cell.alignment = center_alignment
             # 4-11행 기본 정보 영역
             elif 4 <= row <= 11:
                 cell.border = black_border
@@ -856,21 +1324,21 @@ def apply_application_styles(ws):
                     cell.font = section_header_font
                 else:
                     cell.font = default_font
-                cell.alignment = Alignment(horizontal='center', vertical='center', wrap_text=True)
-            # 12-19행 출장자 데이터 영역 (8명까지)
-            elif 12 <= row <= 19:
+                cell.alignment = center_alignment
+            # 출장자 데이터 영역 (12행부터 출장자 행 수만큼)
+            elif APPLICATION_TRAVELER_START_ROW <= row < footer_row:
                 cell.border = black_border
                 cell.font = default_font
-                cell.alignment = Alignment(horizontal='center', vertical='center', wrap_text=True)
-            # 20-22행 하단 영역 (출장자 8행으로 확장)
-            elif 20 <= row <= 22:
+                cell.alignment = center_alignment
+            # 하단 영역 (신청 문구, 날짜, 회사명)
+            elif footer_row <= row <= footer_row + 2:
                 cell.border = None
                 cell.font = bottom_font
-                cell.alignment = Alignment(horizontal='center', vertical='center', wrap_text=True)
+                cell.alignment = center_alignment
             else:
                 cell.border = None
                 cell.font = default_font
-                cell.alignment = Alignment(horizontal='center', vertical='center', wrap_text=True)
+                cell.alignment = center_alignment
     
     # 특별한 셀들 폰트 설정 (배경색 없이)
     # 교통비 섹션 헤더
@@ -886,48 +1354,16 @@ def apply_application_styles(ws):
         if cell.value:
             cell.font = header_font
     
-    # 행 높이 세밀 조정
-    row_heights = {
-        1: 60,   # 제목 - 살짝 늘림
-        2: 30,   # 결재란
-        3: 90,   # 결재란 - 더 늘림 (60→70)
-        4: 40,   # 소속/과제책임자
-        5: 40,   # 연구과제명
-        6: 120,   # 출장기간/출장지
-        7: 160,   # 출장목적 (긴 텍스트)
-        8: 40,   # 교통비 헤더
-        9: 40,   # 교통비 상세
-        10: 40,  # 출장자 헤더
-        11: 32,  # 출장자 테이블 헤더 (25+2)
-        20: 40,  # 신청 문구 (25+5)
-        21: 40,  # 날짜 (25+5)
-        22: 60,  # 회사명 (25+5)
-    }
-    
-    # 출장자 데이터 행들 (12-19행 - 8명까지) 2pt씩 늘림
-    for row_num in range(12, 20):
-        row_heights[row_num] = 32  # 30
-    
     # 행 높이 적용
-    for row_num, height in row_heights.items():
+    for row_num, height in get_application_row_heights(traveler_rows):
         ws.row_dimensions[row_num].height = height
     
     # 열 너비 최적화
-    column_widths = {
-        'A': 15,  # 직급/라벨
-        'B': 15,  # 병합용
-        'C': 15,  # 병합용
-        'D': 15,  # 성명/값 (18→15로 줄임)
-        'E': 19,  # 계좌번호/라벨 (동일 간격)
-        'F': 19,  # 병합용 (동일 간격)
-        'G': 19,  # 비고 (동일 간격)
-    }
-    
-    for col_letter, width in column_widths.items():
+    for col_letter, width in APPLICATION_COLUMN_WIDTHS.items():
         ws.column_dimensions[col_letter].width = width
 
-def setup_application_page_settings(ws):
-    """출장신청서용 페이지 설정"""
+def setup_application_page_settings(ws, traveler_rows=APPLICATION_MIN_TRAVELER_ROWS):
+    """출장신청서용 페이지 설정 (출장자가 기본 8행을 넘으면 같은 배율로 다음 페이지에 이어서 인쇄)"""
     
     # 페이지 방향 설정 (세로)
     ws.page_setup.orientation = ws.ORIENTATION_PORTRAIT
@@ -937,7 +1373,8 @@ def setup_application_page_settings(ws):
     
     # 여백 설정 (단위: 인치) - 더 적절한 여백
     ws.page_margins = PageMargins(
-        left=0.7, right=0.7, top=0.8, bottom=0.8,
+        left=APPLICATION_MARGIN_X_INCH, right=APPLICATION_MARGIN_X_INCH,
+        top=APPLICATION_MARGIN_Y_INCH, bottom=APPLICATION_MARGIN_Y_INCH,
         header=0.3, footer=0.3
     )
     
@@ -950,12 +1387,21 @@ def setup_application_page_settings(ws):
     ws.page_setup.blackAndWhite = False  # 컬러 모드
     ws.page_setup.draft = False  # 초안 모드 비활성화
     
-    # 인쇄영역 설정 (출장신청서는 A1:G22 - 8명까지 확장)
-    ws.print_area = 'A1:G22'
+    # 인쇄영역 설정 (8명까지는 A1:G22, 출장자가 더 많으면 회사명 행까지 확장)
+    ws.print_area = f'A1:G{get_application_footer_row(traveler_rows) + 2}'
     
     # 인쇄 범위 외부를 회색으로 표시하기 위한 설정
     ws.page_setup.scale = 100  # 배율 100%
     
+    # 8행을 넘으면 1페이지 맞춤 대신 기본 문서와 같은 배율로 여러 페이지에 인쇄
+    pagination = None
+    if traveler_rows > APPLICATION_MIN_TRAVELER_ROWS:
+        pagination = get_application_pagination(traveler_rows)
+        ws.page_setup.fitToPage = False
+        ws.page_setup.scale = pagination['scale']
+        for row in pagination['row_breaks']:
+            ws.row_breaks.append(Break(id=row))
+    
     # 격자선 인쇄 설정
     ws.print_options.gridLines = False
     ws.print_options.gridLinesSet = True
@@ -964,8 +1410,11 @@ def setup_application_page_settings(ws):
     ws.print_options.horizontalCentered = True
     ws.print_options.verticalCentered = True
     
-    # 인쇄 제목 설정 (반복 인쇄할 행/열)
-    ws.print_title_rows = '1:1'  # 1행 제목 반복
+    # 인쇄 제목 설정 (반복 인쇄할 행/열, 여러 페이지면 출장자 표 헤더 반복)
+    if pagination and pagination['print_title_rows']:
+        ws.print_title_rows = pagination['print_title_rows']
+    else:
+        ws.print_title_rows = '1:1'  # 1행 제목 반복
     
     # 페이지 나누기 미리보기 설정
     ws.sheet_view.view = 'pageBreakPreview'  # 페이지 나누기 미리보기
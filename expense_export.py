@@ -0,0 +1,139 @@
+import argparse
+import csv
+import os
+import time
+from datetime import datetime
+
+import openpyxl
+from openpyxl.cell import WriteOnlyCell
+
+from batch_generator import load_trips, normalize_employee, normalize_trip
+from excel_generator import ADVANCED_REPORT_STYLES
+
+# 통합 지출 시트 컬럼 (지급신청 섹션의 일비/식비/소계 구성과 동일)
+CONSOLIDATED_HEADERS = [
+    '출장일', '연구과제명', '출장지', '성명', '직책',
+    '일비 일', '일비 일당', '일비 금액',
+    '식비 일', '식비 일당', '식비 금액',
+    '소계'
+]
+
+CONSOLIDATED_COLUMN_WIDTHS = [12, 30, 12, 10, 12, 8, 10, 12, 8, 10, 12, 12]
+
+def iter_employee_records(trips):
+    """출장 목록을 직원 단위 레코드로 하나씩 풀어서 반환 (제너레이터)"""
+    for index, trip in enumerate(trips):
+        for emp_data in normalize_trip(trip, index)['employees_data']:
+            yield emp_data
+
+def iter_employee_records_from_csv(path, encoding='utf-8-sig'):
+    """
+    CSV 파일을 한 행씩 읽어 직원 단위 레코드로 반환 (제너레이터)
+
+    각 행에 출장 공통 정보(project_name, destination, start_date 등)가 함께 있어야 하며,
+    파일 전체를 메모리에 올리지 않는다. cost_item 행은 건너뛴다.
+    """
+    with open(path, 'r', encoding=encoding, newline='') as f:
+        for row in csv.DictReader(f):
+            row = {key.strip(): (value or '').strip() for key, value in row.items() if key}
+            if row.get('employee_name') and not row.get('cost_item'):
+                yield normalize_employee(row, {})
+
+def export_consolidated_expenses(records, output_path, sheet_title="출장비 통합"):
+    """
+    직원 단위 출장 레코드를 write-only 워크시트로 스트리밍 저장
+
+    행을 한 줄씩 기록하므로 행 수와 관계없이 메모리 사용량이 일정하다.
+
+    Args:
+        records: 직원별 출장 데이터 이터러블 (create_advanced_business_trip_report의 employees_data 항목 형식)
+        output_path: 출력 파일 경로
+        sheet_title: 시트 이름
+
+    Returns:
+        dict: 출력 경로, 기록한 행 수, 합계 금액, 소요시간
+    """
+    start = time.perf_counter()
+
+    wb = openpyxl.Workbook(write_only=True)
+    ws = wb.create_sheet(sheet_title)
+
+    # write-only 시트는 행 기록 전에 열 너비와 틀 고정을 지정해야 함
+    for col, width in enumerate(CONSOLIDATED_COLUMN_WIDTHS, start=1):
+        ws.column_dimensions[openpyxl.utils.get_column_letter(col)].width = width
+    ws.freeze_panes = 'A2'
+
+    header_cells = []
+    for header in CONSOLIDATED_HEADERS:
+        cell = WriteOnlyCell(ws, value=header)
+        cell.font = ADVANCED_REPORT_STYLES['default_font']
+        cell.border = ADVANCED_REPORT_STYLES['black_border']
+        cell.alignment = ADVANCED_REPORT_STYLES['center']
+        header_cells.append(cell)
+    ws.append(header_cells)
+
+    row_num = 1
+    total_cost = 0
+
+    for emp_data in records:
+        row_num += 1
+
+        date_cell = WriteOnlyCell(ws, value=emp_data['start_date'])
+        date_cell.number_format = 'yyyy-mm-dd'
+
+        ws.append([
+            date_cell,
+            emp_data.get('project_name', ''),
+            emp_data.get('destination', ''),
+            emp_data['employee_name'],
+            emp_data.get('position', ''),
+            emp_data['trip_days'],
+            emp_data['daily_allowance_per_day'],
+            f"=F{row_num}*G{row_num}",   # 일비 금액
+            emp_data['trip_days'],
+            emp_data['meal_cost_per_day'],
+            f"=I{row_num}*J{row_num}",   # 식비 금액
+            f"=H{row_num}+K{row_num}",   # 소계
+        ])
+
+        total_cost += emp_data['daily_allowance_total'] + emp_data['meal_cost_total']
+
+    # 합계 행
+    total_label = WriteOnlyCell(ws, value='합계')
+    total_label.font = ADVANCED_REPORT_STYLES['default_font']
+    ws.append([total_label] + [None] * 6 +
+              [f"=SUM(H2:H{row_num})" if row_num > 1 else 0, None, None,
+               f"=SUM(K2:K{row_num})" if row_num > 1 else 0,
+               f"=SUM(L2:L{row_num})" if row_num > 1 else 0])
+
+    wb.save(output_path)
+
+    return {
+        'output_path': os.path.abspath(output_path),
+        'rows': row_num - 1,
+        'total_cost': total_cost,
+        'seconds': time.perf_counter() - start
+    }
+
+def main(argv=None):
+    """월간 출장비 통합 시트 생성 CLI"""
+    parser = argparse.ArgumentParser(description="출장자별 출장비 통합 시트 생성 (스트리밍)")
+    parser.add_argument('input', help="출장 목록 파일 (.json 또는 .csv)")
+    parser.add_argument('-o', '--output', help="출력 파일 경로")
+    parser.add_argument('--encoding', default='utf-8-sig', help="CSV 파일 인코딩")
+    args = parser.parse_args(argv)
+
+    output = args.output or f"출장비_통합_{datetime.now().strftime('%Y%m')}.xlsx"
+
+    if args.input.lower().endswith('.csv'):
+        records = iter_employee_records_from_csv(args.input, args.encoding)
+    else:
+        records = iter_employee_records(load_trips(args.input))
+
+    result = export_consolidated_expenses(records, output)
+    print(f"{result['rows']:,}행 기록, 합계 {result['total_cost']:,}원 ({result['seconds']:.2f}초)")
+    print(f"출력 파일: {result['output_path']}")
+    return 0
+
+if __name__ == '__main__':
+    raise SystemExit(main())
@@ -0,0 +1,85 @@
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+# 생성기 진입점별 import 시간 예산 (초, 새 프로세스 기준 중앙값)
+IMPORT_BUDGETS = {
+    'excel_generator': 0.5,
+    'template_engine': 0.6,
+    'batch_generator': 0.6,
+    'document_service': 0.6,
+}
+
+# 생성기 진입점 import 시 로드되면 안 되는 무거운 모듈 (numpy는 openpyxl이 직접 로드하므로 제외)
+DEFERRED_MODULES = ['pandas', 'streamlit']
+
+MEASURE_SCRIPT = """
+import json, sys, time
+start = time.perf_counter()
+import {module}
+seconds = time.perf_counter() - start
+print(json.dumps({{'seconds': seconds, 'loaded': [m for m in {deferred!r} if m in sys.modules]}}))
+"""
+
+def measure_import(module, repeat=5):
+    """
+    새 파이썬 프로세스에서 모듈 import 시간을 repeat회 측정
+
+    Returns:
+        dict: 중앙값/최소/최대 시간(초)과 함께 로드된 무거운 모듈 목록
+    """
+    project_dir = os.path.dirname(os.path.abspath(__file__))
+    script = MEASURE_SCRIPT.format(module=module, deferred=DEFERRED_MODULES)
+    samples = []
+    loaded = []
+
+    for _ in range(repeat):
+        completed = subprocess.run(
+            [sys.executable, '-c', script],
+            cwd=project_dir, capture_output=True, text=True, check=True
+        )
+        result = json.loads(completed.stdout.strip().splitlines()[-1])
+        samples.append(result['seconds'])
+        loaded = result['loaded']
+
+    return {
+        'module': module,
+        'median': statistics.median(samples),
+        'min': min(samples),
+        'max': max(samples),
+        'loaded': loaded
+    }
+
+def check_import_budgets(budgets=None, repeat=5):
+    """예산별 측정 결과 리스트 반환 (각 항목에 budget, passed 포함)"""
+    results = []
+    for module, budget in (budgets or IMPORT_BUDGETS).items():
+        result = measure_import(module, repeat)
+        result['budget'] = budget
+        result['passed'] = result['median'] <= budget and not result['loaded']
+        results.append(result)
+    return results
+
+def main(argv=None):
+    """import 시간 예산 확인 CLI (초과 시 종료 코드 1)"""
+    parser = argparse.ArgumentParser(description="생성기 모듈 import 시간 예산 확인")
+    parser.add_argument('modules', nargs='*', help="측정할 모듈 (기본값: 전체 진입점)")
+    parser.add_argument('-n', '--repeat', type=int, default=5, help="모듈별 측정 횟수")
+    args = parser.parse_args(argv)
+
+    budgets = {module: IMPORT_BUDGETS.get(module, 1.0) for module in args.modules} or IMPORT_BUDGETS
+    results = check_import_budgets(budgets, args.repeat)
+
+    for result in results:
+        status = "OK " if result['passed'] else "FAIL"
+        loaded = f"  (불필요한 로드: {', '.join(result['loaded'])})" if result['loaded'] else ""
+        print(f"[{status}] {result['module']:<18} {result['median'] * 1000:7.1f}ms "
+              f"(예산 {result['budget'] * 1000:.0f}ms, 최소 {result['min'] * 1000:.1f}ms){loaded}")
+
+    return 0 if all(result['passed'] for result in results) else 1
+
+if __name__ == '__main__':
+    raise SystemExit(main())
@@ -0,0 +1,239 @@
+import json
+import logging
+import os
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import datetime
+
+# 계측 사용 여부 환경변수 ('1'이면 사용)
+INSTRUMENTATION_ENV = "TRIP_INSTRUMENTATION"
+
+# 요청별 프로파일 덤프 환경변수 ('cprofile', 'tracemalloc' 또는 'cprofile,tracemalloc')
+PROFILE_ENV = "TRIP_PROFILE"
+
+# 프로파일 덤프 폴더
+PROFILE_DIR = os.path.join(".cache", "profiles")
+
+# 이 시간(초) 이상 걸린 요청은 느린 요청으로 경고 로그를 남김
+SLOW_REQUEST_SECONDS = 1.0
+
+# 최근 요청 보관 수
+RECENT_REQUEST_LIMIT = 100
+
+logger = logging.getLogger("trip.instrumentation")
+
+_settings = {
+    'enabled': os.environ.get(INSTRUMENTATION_ENV, '') == '1',
+    'profile': {mode.strip() for mode in os.environ.get(PROFILE_ENV, '').split(',') if mode.strip()},
+    'slow_seconds': SLOW_REQUEST_SECONDS
+}
+
+_current_trace = ContextVar('trip_request_trace', default=None)
+
+# 현재 컨텍스트(Streamlit 세션의 스크립트 실행 등)에서만 적용되는 계측 사용 여부 (None이면 전역 설정)
+_session_enabled = ContextVar('trip_instrumentation_enabled', default=None)
+_recent_requests = deque(maxlen=RECENT_REQUEST_LIMIT)
+_recent_requests_lock = threading.Lock()
+
+def configure(enabled=None, profile=None, slow_seconds=None):
+    """
+    프로세스 전체 계측 설정 변경 (None인 항목은 유지)
+
+    모든 세션/요청에 적용되므로 환경변수나 관리용 CLI에서만 사용하고,
+    화면에서 한 세션만 켜고 끌 때는 set_session_enabled를 사용한다.
+
+    Args:
+        enabled: 단계별 시간 측정 사용 여부
+        profile: {'cprofile', 'tracemalloc'} 중 요청마다 덤프할 프로파일러
+        slow_seconds: 느린 요청 기준 (초)
+    """
+    if enabled is not None:
+        _settings['enabled'] = enabled
+    if profile is not None:
+        _settings['profile'] = set(profile)
+    if slow_seconds is not None:
+        _settings['slow_seconds'] = slow_seconds
+
+def is_enabled():
+    """현재 컨텍스트의 계측 사용 여부 (세션 설정이 없으면 전역 설정)"""
+    enabled = _session_enabled.get()
+    return _settings['enabled'] if enabled is None else enabled
+
+def set_session_enabled(enabled):
+    """
+    현재 컨텍스트에서만 단계별 시간 측정 사용 여부 지정 (None이면 전역 설정을 따름)
+
+    프로파일러(PROFILE_ENV)는 프로세스 전체에 영향을 주므로 이 설정과 관계없이 전역 설정을 따른다.
+    """
+    _session_enabled.set(enabled)
+
+def percentile(sorted_values, ratio):
+    """정렬된 값 리스트의 백분위수 (최근접 순위 방식)"""
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, max(0, int(round(ratio * len(sorted_values))) - 1))
+    return sorted_values[index]
+
+class RequestTrace:
+    """요청 1건의 단계별 소요시간 (중첩된 단계는 바깥 단계 시간에서 제외)"""
+
+    def __init__(self, name, info):
+        self.name = name
+        self.info = info
+        self.started_at = datetime.now()
+        self.stages = {}
+        self.child_seconds = [0.0]
+        self.total_seconds = 0.0
+        self.peak_memory_kb = None
+        self.profile_path = None
+        self.error = None
+
+    def to_dict(self):
+        return {
+            'name': self.name,
+            'started_at': self.started_at.isoformat(timespec='seconds'),
+            'total_ms': round(self.total_seconds * 1000, 2),
+            'stages_ms': {stage: round(seconds * 1000, 2) for stage, seconds in self.stages.items()},
+            'peak_memory_kb': self.peak_memory_kb,
+            'profile_path': self.profile_path,
+            'error': self.error,
+            **self.info
+        }
+
+@contextmanager
+def stage(name):
+    """
+    현재 요청의 한 단계 시간 측정
+
+    진행 중인 요청이 없으면 이 단계 하나로 된 요청으로 기록한다 (예: 화면의 데이터 로드).
+    계측이 꺼져 있으면 아무것도 하지 않는다.
+    """
+    if not is_enabled():
+        yield
+        return
+
+    trace = _current_trace.get()
+    if trace is None:
+        with request(name), stage(name):
+            yield
+        return
+
+    trace.child_seconds.append(0.0)
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed = time.perf_counter() - start
+        own_seconds = elapsed - trace.child_seconds.pop()
+        trace.child_seconds[-1] += elapsed
+        trace.stages[name] = trace.stages.get(name, 0.0) + own_seconds
+
+@contextmanager
+def request(name, **info):
+    """
+    요청 1건(문서 생성 등) 계측 범위
+
+    끝나면 단계별 시간을 최근 요청 목록에 저장하고 JSON 로그로 남긴다.
+    PROFILE_ENV/configure(profile=...)에 따라 cProfile(.prof), tracemalloc(.txt) 덤프를 저장한다.
+    이미 요청 안에서 호출되면 단계로 취급한다.
+    """
+    if not is_enabled():
+        yield
+        return
+
+    if _current_trace.get() is not None:
+        with stage(name):
+            yield
+        return
+
+    trace = RequestTrace(name, info)
+    token = _current_trace.set(trace)
+    profiler, started_tracemalloc = _start_profilers(_settings['profile'])
+    start = time.perf_counter()
+    try:
+        yield trace
+    except Exception as e:
+        trace.error = f"{type(e).__name__}: {e}"
+        raise
+    finally:
+        trace.total_seconds = time.perf_counter() - start
+        _current_trace.reset(token)
+        _stop_profilers(trace, profiler, started_tracemalloc)
+        _record(trace)
+
+def _start_profilers(modes):
+    """요청 시작 시 프로파일러 시작 (다른 요청이 이미 사용 중이면 건너뜀)"""
+    profiler = None
+    started_tracemalloc = False
+
+    if 'cprofile' in modes:
+        import cProfile
+        profiler = cProfile.Profile()
+        try:
+            profiler.enable()
+        except ValueError:
+            # 다른 스레드의 프로파일러가 실행 중
+            profiler = None
+
+    if 'tracemalloc' in modes:
+        import tracemalloc
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+            started_tracemalloc = True
+
+    return profiler, started_tracemalloc
+
+def _stop_profilers(trace, profiler, started_tracemalloc):
+    """요청 종료 시 프로파일러 정지 및 덤프 저장"""
+    if profiler is None and not started_tracemalloc:
+        return
+
+    os.makedirs(PROFILE_DIR, exist_ok=True)
+    prefix = os.path.join(
+        PROFILE_DIR,
+        f"{trace.started_at.strftime('%Y%m%d_%H%M%S_%f')}_{trace.name.replace('/', '_')}"
+    )
+
+    if profiler is not None:
+        profiler.disable()
+        trace.profile_path = f"{prefix}.prof"
+        profiler.dump_stats(trace.profile_path)
+
+    if started_tracemalloc:
+        import tracemalloc
+        snapshot = tracemalloc.take_snapshot()
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        trace.peak_memory_kb = round(peak / 1024, 1)
+        with open(f"{prefix}_memory.txt", 'w', encoding='utf-8') as f:
+            for stat in snapshot.statistics('lineno')[:30]:
+                f.write(f"{stat}\n")
+
+def _record(trace):
+    """최근 요청 목록 저장 및 로그 출력"""
+    record = trace.to_dict()
+    with _recent_requests_lock:
+        _recent_requests.append(record)
+
+    if trace.total_seconds >= _settings['slow_seconds']:
+        logger.warning(json.dumps(record, ensure_ascii=False))
+    else:
+        logger.info(json.dumps(record, ensure_ascii=False))
+
+def get_recent_requests(min_seconds=0.0, limit=None):
+    """최근 요청 기록 (최신순), min_seconds 이상 걸린 요청만"""
+    with _recent_requests_lock:
+        records = list(_recent_requests)
+    records = [record for record in reversed(records) if record['total_ms'] >= min_seconds * 1000]
+    return records[:limit] if limit else records
+
+def get_slow_requests(limit=None):
+    """느린 요청 기준 이상 걸린 최근 요청 기록"""
+    return get_recent_requests(_settings['slow_seconds'], limit)
+
+def clear_recent_requests():
+    with _recent_requests_lock:
+        _recent_requests.clear()
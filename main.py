@@ -1,10 +1,12 @@
 import streamlit as st
 import pandas as pd
 from datetime import datetime, date
-import os
-from excel_generator import create_advanced_business_trip_report, create_business_trip_application
-from data_manager import load_data, save_data, get_all_data
+from excel_generator import create_business_trip_application_bytes
+from data_manager import add_new_data, get_all_data, get_data_signature, reset_to_default
 from employee_manager import employee_manager
+from trip_store import get_trip_store
+from render_jobs import get_job_manager
+import instrumentation
 
 # 페이지 설정
 st.set_page_config(
@@ -14,6 +16,37 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
+# 사이드바에서 이 세션에만 켠 계측 설정을 이번 스크립트 실행에 적용 (다른 세션에는 영향 없음)
+instrumentation.set_session_enabled(st.session_state.get('instrumentation_enabled'))
+
+@st.cache_resource(show_spinner=False, max_entries=1)
+def load_reference_data(data_signature):
+    """
+    과제책임자, 출장지, 연구과제명 참조 데이터를 프로세스 전체에서 공유
+    
+    data_signature(파일 수정시각)가 바뀌면 다시 로드하며, 반환값은 여러 세션이
+    함께 사용하므로 직접 수정하지 않는다.
+    """
+    return get_all_data()
+
+def invalidate_reference_data():
+    """참조 데이터를 변경한 뒤 공유 캐시 비우기"""
+    load_reference_data.clear()
+
+# 출장복명서 생성 작업 진행 확인 주기 (초)
+REPORT_JOB_POLL_SECONDS = 0.5
+
+@st.fragment(run_every=REPORT_JOB_POLL_SECONDS)
+def show_report_job_progress(job):
+    """
+    생성 중인 작업 진행 표시
+    
+    이 부분만 주기적으로 다시 실행하고, 작업이 끝나면 전체 화면을 한 번 다시 그린다.
+    """
+    if job.done():
+        st.rerun()
+    st.info(f"⏳ 출장복명서 생성 중... ({job.elapsed:.1f}초)")
+
 # 메인 제목
 st.title("📋 출장문서 자동화 시스템")
 st.markdown("---")
@@ -24,8 +57,8 @@ tab1, tab2 = st.tabs(["📝 출장신청서", "📋 출장복명서"])
 # 사이드바 - 기본 정보 설정
 st.sidebar.header("⚙️ 시스템 설정")
 
-# 데이터 로드 (연구과제명 포함)
-data = get_all_data()
+# 데이터 로드 (연구과제명 포함, 공유 캐시 사용)
+data = load_reference_data(get_data_signature())
 
 # ============================================================================
 # 탭 1: 출장신청서
@@ -264,21 +297,18 @@ with tab1:
                 safe_destination = app_destination.replace(' ', '_').replace('/', '_')
                 filename = f"출장신청서_{safe_destination}_{current_date}.xlsx"
                 
-                # 출장신청서 생성
-                file_path = create_business_trip_application(application_data, filename)
+                # 출장신청서 생성 (디스크 저장 없이 메모리에서 생성)
+                file_bytes = create_business_trip_application_bytes(application_data)
                 
                 st.success(f"✅ 출장신청서가 성공적으로 생성되었습니다!")
-                st.info(f"📁 파일 위치: {file_path}")
                 
                 # 파일 다운로드 링크
-                if os.path.exists(file_path):
-                    with open(file_path, "rb") as file:
-                        st.download_button(
-                            label="💾 출장신청서 다운로드",
-                            data=file.read(),
-                            file_name=filename,
-                            mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
-                        )
+                st.download_button(
+                    label="💾 출장신청서 다운로드",
+                    data=file_bytes,
+                    file_name=filename,
+                    mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+                )
                 
             except Exception as e:
                 st.error(f"❌ 출장신청서 생성 중 오류가 발생했습니다: {str(e)}")
@@ -291,6 +321,45 @@ with tab2:
     st.header("📋 출장복명서 작성")
     st.info("💡 직급별 출장비.csv 파일의 데이터를 기반으로 자동 계산됩니다.")
     
+    # 저장된 출장 불러오기 (복명서 재생성용)
+    with st.expander("📂 저장된 출장 불러오기"):
+        col_search1, col_search2, col_search3 = st.columns(3)
+        with col_search1:
+            search_employee = st.text_input("출장자 이름", key="search_trip_employee")
+        with col_search2:
+            search_project = st.text_input("연구과제명", key="search_trip_project")
+        with col_search3:
+            search_destination = st.text_input("출장지", key="search_trip_destination")
+        
+        saved_trips = get_trip_store().find_trips(
+            employee_name=search_employee or None,
+            project_name=search_project or None,
+            destination=search_destination or None,
+            limit=20
+        )
+        
+        if saved_trips:
+            trip_labels = {
+                trip['id']: f"#{trip['id']} {trip['start_date']}~{trip['end_date']} {trip['destination']} / "
+                            f"{trip['project_name']} ({trip['employees']}) - {trip['total_cost']:,}원"
+                for trip in saved_trips
+            }
+            selected_trip_id = st.selectbox(
+                "출장 선택",
+                options=list(trip_labels),
+                format_func=trip_labels.get,
+                key="selected_saved_trip"
+            )
+            
+            if st.button("📥 불러오기", key="load_saved_trip"):
+                saved_trip = get_trip_store().load_trip(selected_trip_id)
+                if saved_trip:
+                    st.session_state.employees_list, st.session_state.additional_costs = saved_trip
+                    st.session_state.saved_trip_signature = repr(saved_trip)
+                    st.rerun()
+        else:
+            st.caption("저장된 출장이 없습니다.")
+    
     # 기본 정보
     col_basic1, col_basic2 = st.columns(2)
     
@@ -663,6 +732,13 @@ with tab2:
         
         st.metric("🏆 전체 총 비용", f"{total_all_cost:,}원")
         
+        # 저장된 출장 기준 연구과제 누적 사용액 (집계 테이블 조회)
+        if project_name:
+            project_total = get_trip_store().get_project_total(project_name)
+            if project_total['trip_count']:
+                st.caption(f"📊 '{project_name}' 누적 사용액: {project_total['total_cost']:,}원 "
+                           f"(저장된 출장 {project_total['trip_count']}건)")
+        
         # 출장보고서 생성 버튼
         if st.button("📋 출장복명서 생성", type="primary", use_container_width=True):
             if not all([destination, project_name, project_manager]):
@@ -670,38 +746,70 @@ with tab2:
             elif not st.session_state.employees_list:
                 st.error("최소 1명의 출장자를 추가해주세요!")
             else:
+                # 백그라운드 스레드에서 생성 (생성 중에도 화면 조작 가능)
+                job = get_job_manager().submit_report(
+                    st.session_state.employees_list,
+                    st.session_state.additional_costs
+                )
+                st.session_state.report_job = {
+                    'job_id': job.job_id,
+                    'filename': f"출장복명서_{destination}_{start_date.strftime('%Y%m%d')}.xlsx",
+                    'employees_list': [dict(emp) for emp in st.session_state.employees_list],
+                    'additional_costs': [dict(cost) for cost in st.session_state.additional_costs]
+                }
+        
+        # 진행 중이거나 완료된 출장복명서 생성 작업 표시
+        report_job_info = st.session_state.get('report_job')
+        if report_job_info and 'file_bytes' not in report_job_info:
+            job = get_job_manager().get(report_job_info['job_id'])
+            
+            if job is None:
+                del st.session_state.report_job
+                st.warning("⚠️ 생성 작업을 찾을 수 없습니다. 다시 생성해주세요.")
+            elif not job.done():
+                show_report_job_progress(job)
+            elif job.error is not None:
+                del st.session_state.report_job
+                get_job_manager().discard(job.job_id)
+                st.error(f"❌ 오류 발생: {str(job.error)}")
+            else:
+                # 결과를 세션으로 옮기고 작업 관리자에서는 바로 제거
+                report_job_info['file_bytes'] = job.result()
+                report_job_info['elapsed'] = job.elapsed
+                get_job_manager().discard(job.job_id)
+        
+        if report_job_info and 'file_bytes' in report_job_info:
+            file_bytes = report_job_info['file_bytes']
+            st.success(f"✅ 출장복명서가 생성되었습니다! ({report_job_info['elapsed']:.2f}초)")
+            
+            # 출장 기록 저장 (같은 내용을 다시 생성할 때는 중복 저장하지 않음)
+            trip_signature = repr((report_job_info['employees_list'], report_job_info['additional_costs']))
+            if st.session_state.get('saved_trip_signature') != trip_signature:
                 try:
-                    # 파일명 생성
-                    filename = f"출장복명서_{destination}_{start_date.strftime('%Y%m%d')}.xlsx"
-                    
-                    # 엑셀 파일 생성
-                    output_path = create_advanced_business_trip_report(
-                        st.session_state.employees_list, 
-                        st.session_state.additional_costs,
-                        filename
+                    trip_id = get_trip_store().save_trip(
+                        report_job_info['employees_list'],
+                        report_job_info['additional_costs']
                     )
-                    
-                    st.success(f"✅ 출장복명서가 생성되었습니다!")
-                    st.info(f"📁 파일 위치: {output_path}")
-                    
-                    # 다운로드 버튼
-                    with open(output_path, "rb") as file:
-                        st.download_button(
-                            label="📥 파일 다운로드",
-                            data=file.read(),
-                            file_name=filename,
-                            mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-                            use_container_width=True
-                        )
-                    
+                    st.session_state.saved_trip_signature = trip_signature
+                    st.caption(f"💾 출장 기록이 저장되었습니다. (#{trip_id})")
                 except Exception as e:
-                    st.error(f"❌ 오류 발생: {str(e)}")
+                    st.warning(f"⚠️ 출장 기록 저장 실패: {str(e)}")
+            
+            # 다운로드 버튼
+            st.download_button(
+                label="📥 파일 다운로드",
+                data=file_bytes,
+                file_name=report_job_info['filename'],
+                mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+                use_container_width=True
+            )
         
         # 목록 초기화 버튼
         col_reset1, col_reset2 = st.columns(2)
         with col_reset1:
             if st.button("🔄 출장자 목록 초기화", type="secondary"):
                 st.session_state.employees_list = []
+                st.session_state.pop('report_job', None)
                 st.rerun()
         
         with col_reset2:
@@ -727,8 +835,9 @@ with st.sidebar.expander("➕ 새 데이터 추가"):
     
     if st.button("추가", key="add_data"):
         if new_value and new_value not in data[data_type]:
-            data[data_type].append(new_value)
-            save_data(data)
+            # 공유 캐시 객체는 수정하지 않고 저장소에 값 하나만 추가
+            add_new_data(data_type, new_value, {key: list(values) for key, values in data.items()})
+            invalidate_reference_data()
             st.success(f"'{new_value}' 추가됨!")
             st.rerun()
         elif new_value in data[data_type]:
@@ -745,7 +854,40 @@ with st.sidebar.expander("📋 현재 데이터 보기"):
 # 데이터 초기화 버튼
 st.sidebar.markdown("---")
 if st.sidebar.button("🔄 데이터 초기화", type="secondary"):
-    from data_manager import reset_to_default
     reset_to_default()
+    invalidate_reference_data()
     st.sidebar.success("데이터가 초기화되었습니다!")
-    st.rerun() 
\ No newline at end of file
+    st.rerun() 
+
+# 성능 모니터링 (관리자용, 계측은 켠 경우에만 기록)
+with st.sidebar.expander("⏱️ 성능 모니터링"):
+    instrumentation_enabled = st.checkbox(
+        "단계별 시간 측정 (이 세션)",
+        value=instrumentation.is_enabled(),
+        key='instrumentation_enabled',
+        help="이 세션의 문서 생성/데이터 로드 단계별 소요시간을 기록합니다. "
+             "(모든 세션에 적용하려면 TRIP_INSTRUMENTATION=1 환경변수로 설정)"
+    )
+    instrumentation.set_session_enabled(instrumentation_enabled)
+    
+    if instrumentation_enabled:
+        slow_ms = st.number_input("느린 요청 기준 (ms)", min_value=0, value=500, step=100)
+        slow_requests = instrumentation.get_recent_requests(min_seconds=slow_ms / 1000, limit=20)
+        
+        if slow_requests:
+            st.dataframe(
+                [
+                    {
+                        '시각': record['started_at'][11:],
+                        '요청': record['name'],
+                        '총 ms': record['total_ms'],
+                        '단계별 ms': ", ".join(f"{name} {ms:,.0f}" for name, ms in record['stages_ms'].items()),
+                        '오류': record['error'] or ''
+                    }
+                    for record in slow_requests
+                ],
+                use_container_width=True,
+                hide_index=True
+            )
+        else:
+            st.caption("기준 이상 걸린 최근 요청이 없습니다.")
@@ -0,0 +1,522 @@
+import ast
+import io
+import os
+import re
+import threading
+from functools import lru_cache
+
+from openpyxl.utils import get_column_letter
+from openpyxl.utils.cell import column_index_from_string, range_boundaries
+
+from excel_generator import column_width_points, fill_advanced_business_trip_report, fill_business_trip_application
+from instrumentation import stage
+from xlsx_writer import GridWorkbook
+
+# 한글 글꼴 경로 지정 환경변수 (지정하지 않으면 아래 후보 경로에서 찾음)
+PDF_FONT_ENV = "TRIP_PDF_FONT"
+PDF_BOLD_FONT_ENV = "TRIP_PDF_BOLD_FONT"
+
+# (보통, 굵게) 한글 TrueType 글꼴 후보 경로
+KOREAN_FONT_CANDIDATES = [
+    (r"C:\Windows\Fonts\malgun.ttf", r"C:\Windows\Fonts\malgunbd.ttf"),
+    ("/usr/share/fonts/truetype/nanum/NanumGothic.ttf", "/usr/share/fonts/truetype/nanum/NanumGothicBold.ttf"),
+    ("/usr/share/fonts/nanum/NanumGothic.ttf", "/usr/share/fonts/nanum/NanumGothicBold.ttf"),
+    ("/Library/Fonts/NanumGothic.ttf", "/Library/Fonts/NanumGothicBold.ttf"),
+    (os.path.expanduser("~/Library/Fonts/NanumGothic.ttf"), os.path.expanduser("~/Library/Fonts/NanumGothicBold.ttf")),
+]
+
+# TrueType 글꼴이 없을 때 사용하는 reportlab 내장 한글 CID 글꼴 (PDF에 포함되지 않음)
+FALLBACK_CID_FONT = "HYGothic-Medium"
+
+PDF_FONT_NAME = "TripKorean"
+PDF_BOLD_FONT_NAME = "TripKorean-Bold"
+
+# 테두리 종류별 선 굵기 (pt)
+BORDER_LINE_WIDTHS = {
+    'hair': 0.25,
+    'thin': 0.5,
+    'dotted': 0.5,
+    'dashed': 0.5,
+    'dashDot': 0.5,
+    'dashDotDot': 0.5,
+    'medium': 1.0,
+    'mediumDashed': 1.0,
+    'mediumDashDot': 1.0,
+    'mediumDashDotDot': 1.0,
+    'slantDashDot': 1.0,
+    'thick': 1.5,
+    'double': 1.5,
+}
+
+# 엑셀 기본 행 높이/열 너비
+DEFAULT_ROW_HEIGHT = 15
+DEFAULT_COLUMN_WIDTH = 8.43
+
+# 셀 안쪽 여백 (pt)
+CELL_PADDING = 2
+
+# 지원하는 수식: 숫자, 셀 참조, SUM(범위), 사칙연산
+FORMULA_TOKEN = re.compile(r"\s*(?:SUM\(([A-Z]+\d+):([A-Z]+\d+)\)|([A-Z]+)(\d+)|(\d+(?:\.\d+)?)|([-+*/()]))")
+
+_font_lock = threading.Lock()
+
+def require_reportlab():
+    """reportlab 사용 가능 여부 확인 (선택 의존성)"""
+    try:
+        import reportlab  # noqa: F401
+    except ImportError as e:
+        raise ImportError("PDF 출력에는 reportlab 패키지가 필요합니다. (pip install reportlab)") from e
+
+def find_korean_fonts():
+    """사용할 한글 TrueType 글꼴 (보통, 굵게) 경로, 없으면 (None, None)"""
+    regular = os.environ.get(PDF_FONT_ENV)
+    if regular:
+        return regular, os.environ.get(PDF_BOLD_FONT_ENV)
+
+    for regular, bold in KOREAN_FONT_CANDIDATES:
+        if os.path.exists(regular):
+            return regular, bold if os.path.exists(bold) else None
+    return None, None
+
+@lru_cache(maxsize=1)
+def register_korean_fonts():
+    """
+    한글 글꼴을 프로세스당 한 번만 등록
+
+    TrueType 글꼴 파일은 최초 호출 때 한 번만 읽고, 이후 문서에는 사용한 글자만 부분 포함한다.
+
+    Returns:
+        tuple: (보통 글꼴 이름, 굵은 글꼴 이름 또는 None (굵은 글꼴이 없으면 획을 덧그려 표현))
+    """
+    require_reportlab()
+    from reportlab.pdfbase import pdfmetrics
+    from reportlab.pdfbase.cidfonts import UnicodeCIDFont
+    from reportlab.pdfbase.ttfonts import TTFont
+
+    with _font_lock:
+        regular_path, bold_path = find_korean_fonts()
+        if regular_path is None:
+            pdfmetrics.registerFont(UnicodeCIDFont(FALLBACK_CID_FONT))
+            return FALLBACK_CID_FONT, None
+
+        pdfmetrics.registerFont(TTFont(PDF_FONT_NAME, regular_path))
+        if bold_path is None:
+            return PDF_FONT_NAME, None
+        pdfmetrics.registerFont(TTFont(PDF_BOLD_FONT_NAME, bold_path))
+        return PDF_FONT_NAME, PDF_BOLD_FONT_NAME
+
+def evaluate_arithmetic(expression):
+    """숫자와 사칙연산만 있는 식 계산"""
+    def evaluate(node):
+        if isinstance(node, ast.Expression):
+            return evaluate(node.body)
+        if isinstance(node, ast.Constant) and isinstance(node.value, (int, float)):
+            return node.value
+        if isinstance(node, ast.UnaryOp) and isinstance(node.op, (ast.USub, ast.UAdd)):
+            value = evaluate(node.operand)
+            return -value if isinstance(node.op, ast.USub) else value
+        if isinstance(node, ast.BinOp):
+            left, right = evaluate(node.left), evaluate(node.right)
+            if isinstance(node.op, ast.Add):
+                return left + right
+            if isinstance(node.op, ast.Sub):
+                return left - right
+            if isinstance(node.op, ast.Mult):
+                return left * right
+            if isinstance(node.op, ast.Div):
+                return left / right
+        raise ValueError(f"지원하지 않는 수식입니다: {expression}")
+
+    return evaluate(ast.parse(expression, mode='eval'))
+
+def numeric_value(value):
+    """수식/셀 참조 계산용 숫자 값 (숫자가 아니면 0)"""
+    if isinstance(value, bool):
+        return int(value)
+    return value if isinstance(value, (int, float)) else 0
+
+class FormulaEvaluator:
+    """문서에 사용하는 간단한 수식(=F13*G13, =SUM(L13:L20) 등)을 계산하여 표시값으로 변환"""
+
+    def __init__(self, ws):
+        self.ws = ws
+        self.results = {}
+
+    def cell_value(self, row, col):
+        if (row, col) in self.results:
+            return self.results[(row, col)]
+
+        cell = self.ws._cells.get((row, col))
+        value = cell.value if cell is not None else None
+        if isinstance(value, str) and value.startswith('=') and len(value) > 1:
+            self.results[(row, col)] = 0  # 순환 참조 방지
+            try:
+                value = self.evaluate(value[1:])
+            except (ValueError, SyntaxError, ZeroDivisionError):
+                value = '#VALUE!'
+            self.results[(row, col)] = value
+        return value
+
+    def evaluate(self, formula):
+        parts = []
+        position = 0
+        while position < len(formula):
+            match = FORMULA_TOKEN.match(formula, position)
+            if match is None:
+                if formula[position:].strip():
+                    raise ValueError(f"지원하지 않는 수식입니다: ={formula}")
+                break
+
+            sum_start, sum_end, column_letter, row, number, operator = match.groups()
+            if sum_start:
+                min_col, min_row, max_col, max_row = range_boundaries(f"{sum_start}:{sum_end}")
+                total = sum(
+                    numeric_value(self.cell_value(r, c))
+                    for r in range(min_row, max_row + 1)
+                    for c in range(min_col, max_col + 1)
+                )
+                parts.append(repr(total))
+            elif column_letter:
+                value = numeric_value(self.cell_value(int(row), column_index_from_string(column_letter)))
+                parts.append(f"({value!r})")
+            else:
+                parts.append(number or operator)
+            position = match.end()
+
+        result = evaluate_arithmetic(''.join(parts))
+        if isinstance(result, float) and result.is_integer():
+            return int(result)
+        return result
+
+def display_text(value):
+    """셀 값을 엑셀 '일반' 서식과 같은 문자열로 변환"""
+    if value is None:
+        return ''
+    if isinstance(value, bool):
+        return 'TRUE' if value else 'FALSE'
+    if isinstance(value, float):
+        return "%.10g" % value
+    return str(value)
+
+def wrap_lines(text, font_name, font_size, max_width, wrap):
+    """셀 너비에 맞춰 글자 단위로 줄바꿈 (한글은 공백 없이도 나눔)"""
+    from reportlab.pdfbase.pdfmetrics import stringWidth
+
+    if not wrap:
+        return [text.replace('\n', ' ')]
+
+    lines = []
+    for paragraph in text.split('\n'):
+        line = ''
+        for char in paragraph:
+            if line and stringWidth(line + char, font_name, font_size) > max_width:
+                # 가능하면 공백에서 나눔
+                cut = line.rfind(' ')
+                if cut > 0:
+                    lines.append(line[:cut])
+                    line = line[cut + 1:]
+                else:
+                    lines.append(line)
+                    line = ''
+            line += char
+        lines.append(line)
+    return lines
+
+class SheetLayout:
+    """인쇄 영역, 행/열 크기, 병합 범위, 페이지 구분을 pt 단위로 정리한 시트 배치"""
+
+    def __init__(self, ws):
+        self.ws = ws
+
+        if ws.print_area:
+            min_col, min_row, max_col, max_row = range_boundaries(ws.print_area)
+        else:
+            rows = [row for row, _ in ws._cells] or [1]
+            cols = [col for _, col in ws._cells] or [1]
+            min_col, min_row, max_col, max_row = min(cols), min(rows), max(cols), max(rows)
+        self.min_col, self.min_row, self.max_col, self.max_row = min_col, min_row, max_col, max_row
+
+        self.col_widths = {}
+        for col in range(min_col, max_col + 1):
+            dimension = ws.column_dimensions.get(get_column_letter(col))
+            width = dimension.width if dimension is not None and dimension.width is not None else DEFAULT_COLUMN_WIDTH
+            self.col_widths[col] = column_width_points(width)
+
+        self.row_heights = {}
+        for row in range(min_row, max_row + 1):
+            dimension = ws.row_dimensions.get(row)
+            height = dimension.height if dimension is not None and dimension.height is not None else DEFAULT_ROW_HEIGHT
+            self.row_heights[row] = height
+
+        # 병합 범위: 셀 -> (시작 행, 시작 열, 끝 행, 끝 열)
+        self.merged = {}
+        for r1, c1, r2, c2 in ws.merged_ranges:
+            for row in range(r1, r2 + 1):
+                for col in range(c1, c2 + 1):
+                    self.merged[(row, col)] = (r1, c1, r2, c2)
+
+        # 인쇄 제목 행 (2페이지부터 반복)
+        self.title_rows = []
+        if ws.print_title_rows:
+            start, end = (int(part) for part in ws.print_title_rows.split(':'))
+            self.title_rows = list(range(start, end + 1))
+
+        # 페이지 나누기 (Break id 행 다음부터 새 페이지)
+        breaks = sorted({brk.id for brk in ws.row_breaks.brk if min_row <= brk.id < max_row})
+        self.pages = []
+        start = min_row
+        for brk in breaks + [max_row]:
+            rows = list(range(start, brk + 1))
+            if self.pages:
+                rows = [row for row in self.title_rows if row < start] + rows
+            self.pages.append(rows)
+            start = brk + 1
+
+    @property
+    def total_width(self):
+        return sum(self.col_widths.values())
+
+    def page_height(self, rows):
+        return sum(self.row_heights.get(row, DEFAULT_ROW_HEIGHT) for row in rows)
+
+class WorksheetPdfRenderer:
+    """GridWorksheet(excel_generator 레이아웃)를 reportlab 캔버스에 그림"""
+
+    def __init__(self, ws):
+        require_reportlab()
+        self.ws = ws
+        self.layout = SheetLayout(ws)
+        self.formulas = FormulaEvaluator(ws)
+        self.regular_font, self.bold_font = register_korean_fonts()
+
+    def page_size(self):
+        from reportlab.lib.pagesizes import A4, landscape
+
+        if self.ws.page_setup.orientation == self.ws.ORIENTATION_LANDSCAPE:
+            return landscape(A4)
+        return A4
+
+    def scale(self, usable_width, usable_height):
+        """페이지 맞춤 배율 (엑셀과 같이 축소만 함)"""
+        page_setup = self.ws.page_setup
+        if not page_setup.fitToPage:
+            return (page_setup.scale or 100) / 100
+
+        scale = 1.0
+        if page_setup.fitToWidth != 0:
+            scale = min(scale, usable_width / self.layout.total_width)
+        if page_setup.fitToHeight != 0:
+            tallest = max(self.layout.page_height(rows) for rows in self.layout.pages)
+            scale = min(scale, usable_height / tallest)
+        return scale
+
+    def render(self, canvas):
+        page_width, page_height = self.page_size()
+        margins = self.ws.page_margins
+        left, right = margins.left * 72, margins.right * 72
+        top, bottom = margins.top * 72, margins.bottom * 72
+        usable_width = page_width - left - right
+        usable_height = page_height - top - bottom
+        scale = self.scale(usable_width, usable_height)
+
+        for rows in self.layout.pages:
+            content_width = self.layout.total_width * scale
+            content_height = self.layout.page_height(rows) * scale
+            x = left
+            y = page_height - top
+            if self.ws.print_options.horizontalCentered:
+                x += max(0, (usable_width - content_width) / 2)
+            if self.ws.print_options.verticalCentered:
+                y -= max(0, (usable_height - content_height) / 2)
+
+            canvas.saveState()
+            canvas.translate(x, y)
+            canvas.scale(scale, scale)
+            self.draw_page(canvas, rows)
+            canvas.restoreState()
+            canvas.showPage()
+
+    def draw_page(self, canvas, rows):
+        """페이지 원점(왼쪽 위)부터 아래 방향으로 행을 그림"""
+        layout = self.layout
+        row_tops = {}
+        y = 0
+        for row in rows:
+            row_tops[row] = y
+            y -= layout.row_heights[row]
+
+        col_lefts = {}
+        x = 0
+        for col in range(layout.min_col, layout.max_col + 1):
+            col_lefts[col] = x
+            x += layout.col_widths[col]
+
+        page_rows = set(rows)
+        segments = {}
+        for row in rows:
+            for col in range(layout.min_col, layout.max_col + 1):
+                cell = self.ws._cells.get((row, col))
+                if cell is None:
+                    continue
+                self.collect_borders(segments, cell, row_tops, col_lefts)
+
+                merge = layout.merged.get((row, col))
+                if merge is not None and (merge[0], merge[1]) != (row, col):
+                    continue
+                r2, c2 = (merge[2], merge[3]) if merge is not None else (row, col)
+                # 페이지를 넘는 병합 범위는 현재 페이지 안쪽만 사용
+                bottom_row = max(r for r in range(row, r2 + 1) if r in page_rows)
+                right_col = min(c2, layout.max_col)
+                rect = (
+                    col_lefts[col],
+                    row_tops[bottom_row] - layout.row_heights[bottom_row],
+                    col_lefts[right_col] + layout.col_widths[right_col],
+                    row_tops[row]
+                )
+                self.draw_text(canvas, cell, rect)
+
+        self.draw_borders(canvas, segments)
+
+    def collect_borders(self, segments, cell, row_tops, col_lefts):
+        """셀 테두리 선분 수집 (병합 범위 안쪽 선은 제외, 겹치는 선은 굵은 쪽 사용)"""
+        border = cell.border
+        if border is None:
+            return
+
+        layout = self.layout
+        row, col = cell.row, cell.column
+        r1, c1, r2, c2 = layout.merged.get((row, col), (row, col, row, col))
+        x1 = round(col_lefts[col], 3)
+        x2 = round(col_lefts[col] + layout.col_widths[col], 3)
+        y1 = round(row_tops[row], 3)
+        y2 = round(row_tops[row] - layout.row_heights[row], 3)
+
+        sides = []
+        if col == c1:
+            sides.append((border.left, ('v', x1, y2, y1)))
+        if col == c2:
+            sides.append((border.right, ('v', x2, y2, y1)))
+        if row == r1:
+            sides.append((border.top, ('h', y1, x1, x2)))
+        if row == r2:
+            sides.append((border.bottom, ('h', y2, x1, x2)))
+
+        for side, key in sides:
+            if side is None or not side.style:
+                continue
+            current = segments.get(key)
+            if current is None or BORDER_LINE_WIDTHS.get(side.style, 0.5) > BORDER_LINE_WIDTHS.get(current, 0.5):
+                segments[key] = side.style
+
+    def draw_borders(self, canvas, segments):
+        """
+        수집한 테두리를 선 종류별로 모아 한 번에 그림
+
+        같은 직선 위에 이어지는 선분은 하나로 합쳐 PDF 명령 수를 줄인다.
+        """
+        by_style = {}
+        for key, style in segments.items():
+            by_style.setdefault(style, []).append(key)
+
+        for style, keys in by_style.items():
+            lines = []
+            for orientation, fixed, start, end in sorted(keys):
+                if lines and lines[-1][0] == orientation and lines[-1][1] == fixed and lines[-1][3] >= start:
+                    lines[-1][3] = max(lines[-1][3], end)
+                else:
+                    lines.append([orientation, fixed, start, end])
+
+            canvas.setLineWidth(BORDER_LINE_WIDTHS.get(style, 0.5))
+            canvas.setDash(*((2, 2) if 'dash' in style.lower() or style == 'dotted' else ()))
+            canvas.lines([
+                (start, fixed, end, fixed) if orientation == 'h' else (fixed, start, fixed, end)
+                for orientation, fixed, start, end in lines
+            ])
+        canvas.setDash()
+
+    def draw_text(self, canvas, cell, rect):
+        """셀 값을 정렬/줄바꿈 설정에 맞춰 그림"""
+        text = display_text(self.formulas.cell_value(cell.row, cell.column))
+        if not text:
+            return
+
+        x1, y1, x2, y2 = rect
+        font = cell.font
+        alignment = cell.alignment
+        font_size = font.sz if font is not None and font.sz else 11
+        bold = bool(font is not None and font.b)
+        font_name = self.bold_font if bold and self.bold_font else self.regular_font
+        horizontal = alignment.horizontal if alignment is not None else None
+        vertical = alignment.vertical if alignment is not None else None
+        wrap = bool(alignment is not None and alignment.wrap_text)
+
+        if horizontal is None:
+            # 엑셀 '일반' 정렬: 숫자는 오른쪽, 문자는 왼쪽
+            horizontal = 'right' if isinstance(self.formulas.cell_value(cell.row, cell.column), (int, float)) else 'left'
+
+        lines = wrap_lines(text, font_name, font_size, x2 - x1 - CELL_PADDING * 2, wrap)
+        line_height = font_size * 1.25
+        block_height = line_height * len(lines)
+
+        if vertical == 'top':
+            top = y2 - CELL_PADDING
+        elif vertical == 'center':
+            top = (y1 + y2 + block_height) / 2
+        else:
+            top = y1 + CELL_PADDING + block_height
+
+        # 굵은 글꼴이 없으면 획을 덧그려 굵게 표현
+        fake_bold = bold and not self.bold_font
+        if fake_bold:
+            canvas.setLineWidth(font_size * 0.03)
+
+        for index, line in enumerate(lines):
+            baseline = top - line_height * index - font_size
+            text_object = canvas.beginText()
+            text_object.setFont(font_name, font_size)
+            if fake_bold:
+                text_object.setTextRenderMode(2)
+            text_object.setTextOrigin(*self.text_origin(line, font_name, font_size, horizontal, x1, x2, baseline))
+            text_object.textOut(line)
+            canvas.drawText(text_object)
+
+    @staticmethod
+    def text_origin(line, font_name, font_size, horizontal, x1, x2, baseline):
+        from reportlab.pdfbase.pdfmetrics import stringWidth
+
+        width = stringWidth(line, font_name, font_size)
+        if horizontal in ('center', 'centerContinuous', 'distributed', 'justify'):
+            return (x1 + x2 - width) / 2, baseline
+        if horizontal == 'right':
+            return x2 - CELL_PADDING - width, baseline
+        return x1 + CELL_PADDING, baseline
+
+def render_worksheet_pdf(ws, title=None):
+    """GridWorksheet 1개를 A4 PDF 바이트로 변환 (페이지 나누기/인쇄 제목/페이지 맞춤 반영)"""
+    from reportlab.pdfgen.canvas import Canvas
+
+    renderer = WorksheetPdfRenderer(ws)
+    buffer = io.BytesIO()
+    canvas = Canvas(buffer, pagesize=renderer.page_size(), pageCompression=1)
+    canvas.setTitle(title or ws.title)
+    renderer.render(canvas)
+    canvas.save()
+    return buffer.getvalue()
+
+def create_advanced_business_trip_report_pdf(employees_data, additional_costs):
+    """출장복명서 PDF 바이트 생성 (스프레드시트 프로그램 불필요)"""
+    require_reportlab()
+    wb = GridWorkbook("출장복명서")
+    with stage('populate'):
+        fill_advanced_business_trip_report(wb.active, employees_data, additional_costs)
+    with stage('pdf'):
+        return render_worksheet_pdf(wb.active)
+
+def create_business_trip_application_pdf(application_data):
+    """출장신청서 PDF 바이트 생성 (스프레드시트 프로그램 불필요)"""
+    require_reportlab()
+    wb = GridWorkbook("출장신청서")
+    with stage('populate'):
+        fill_business_trip_application(wb.active, application_data)
+    with stage('pdf'):
+        return render_worksheet_pdf(wb.active)
@@ -0,0 +1,229 @@
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from datetime import datetime
+
+from excel_generator import TEMPLATE_VERSION
+
+# 렌더 캐시 기본 한도
+DEFAULT_MAX_ENTRIES = 256
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+# 디스크 캐시 기본 한도 (작성일이 키에 포함되어 날마다 새 파일이 생기므로 디스크도 제한)
+DEFAULT_MAX_DISK_ENTRIES = 4096
+DEFAULT_MAX_DISK_BYTES = 512 * 1024 * 1024
+
+# 디스크 캐시 폴더 (RenderCache(cache_dir=...)로 사용)
+RENDER_CACHE_DIR = os.path.join(".cache", "renders")
+
+def to_canonical(value):
+    """json.dumps 기본 변환: date/time은 ISO 문자열로"""
+    if hasattr(value, 'isoformat'):
+        return value.isoformat()
+    raise TypeError(f"직렬화할 수 없는 값입니다: {type(value).__name__}")
+
+def make_render_key(document_type, *inputs, render_date=None, output_format='xlsx'):
+    """
+    입력 데이터의 정규화된 해시로 캐시 키 생성 ('<해시>.<출력 형식>', 디스크 캐시 파일명으로 사용)
+
+    키에는 템플릿 버전과 작성일(문서 하단에 출력되는 오늘 날짜)이 포함되므로
+    레이아웃이 바뀌거나 날짜가 바뀌면 이전 결과를 재사용하지 않는다.
+    """
+    canonical = json.dumps(
+        {
+            'type': document_type,
+            'format': output_format,
+            'template_version': TEMPLATE_VERSION,
+            'date': (render_date or datetime.now().date()).isoformat(),
+            'inputs': inputs
+        },
+        sort_keys=True, ensure_ascii=False, separators=(',', ':'), default=to_canonical
+    )
+    return f"{hashlib.sha256(canonical.encode('utf-8')).hexdigest()}.{output_format}"
+
+class RenderCache:
+    """
+    렌더링 결과(xlsx/pdf 바이트) 캐시
+
+    메모리는 항목 수와 총 바이트 한도 안에서 LRU로 유지하고, cache_dir를 지정하면
+    디스크에도 저장하여 프로세스가 다시 시작되어도 재사용한다.
+    디스크도 파일 수와 총 바이트 한도를 넘으면 오래 사용하지 않은 파일부터 삭제한다.
+    """
+
+    def __init__(self, max_entries=DEFAULT_MAX_ENTRIES, max_bytes=DEFAULT_MAX_BYTES, cache_dir=None,
+                 max_disk_entries=DEFAULT_MAX_DISK_ENTRIES, max_disk_bytes=DEFAULT_MAX_DISK_BYTES):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.cache_dir = cache_dir
+        self.max_disk_entries = max_disk_entries
+        self.max_disk_bytes = max_disk_bytes
+        self.entries = OrderedDict()
+        self.total_bytes = 0
+        self.disk_entries = OrderedDict()
+        self.disk_bytes = 0
+        self.lock = threading.Lock()
+        self.counters = {'hits': 0, 'disk_hits': 0, 'misses': 0, 'evictions': 0, 'disk_evictions': 0}
+
+        if cache_dir:
+            os.makedirs(cache_dir, exist_ok=True)
+            self._scan_disk()
+
+    def _disk_path(self, key):
+        return os.path.join(self.cache_dir, key)
+
+    def _scan_disk(self):
+        """기존 디스크 캐시 파일을 수정시각 순으로 목록에 올리고 한도 적용"""
+        files = []
+        with os.scandir(self.cache_dir) as it:
+            for entry in it:
+                if entry.is_file() and not entry.name.startswith('.tmp_'):
+                    stat = entry.stat()
+                    files.append((stat.st_mtime_ns, entry.name, stat.st_size))
+
+        with self.lock:
+            for _, name, size in sorted(files):
+                self.disk_entries[name] = size
+                self.disk_bytes += size
+            removed = self._evict_disk()
+        self._remove_files(removed)
+
+    def _evict_disk(self):
+        """디스크 한도를 넘은 항목을 목록에서 빼고 삭제할 파일명 반환 (lock 안에서 호출)"""
+        removed = []
+        while self.disk_entries and (len(self.disk_entries) > self.max_disk_entries
+                                     or self.disk_bytes > self.max_disk_bytes):
+            name, size = self.disk_entries.popitem(last=False)
+            self.disk_bytes -= size
+            self.counters['disk_evictions'] += 1
+            removed.append(name)
+        return removed
+
+    def _remove_files(self, names):
+        for name in names:
+            try:
+                os.remove(self._disk_path(name))
+            except OSError:
+                # 다른 프로세스가 이미 삭제한 경우
+                pass
+
+    def get(self, key):
+        """캐시된 바이트 반환 (없으면 None)"""
+        with self.lock:
+            content = self.entries.get(key)
+            if content is not None:
+                self.entries.move_to_end(key)
+                self.counters['hits'] += 1
+                return content
+
+        if self.cache_dir:
+            try:
+                with open(self._disk_path(key), 'rb') as f:
+                    content = f.read()
+            except OSError:
+                content = None
+            if content is not None:
+                with self.lock:
+                    self.counters['disk_hits'] += 1
+                    if key in self.disk_entries:
+                        self.disk_entries.move_to_end(key)
+                    else:
+                        # 다른 프로세스가 저장한 파일
+                        self.disk_entries[key] = len(content)
+                        self.disk_bytes += len(content)
+                try:
+                    # 수정시각을 사용 시각으로 갱신 (재시작 후 LRU 순서 유지)
+                    os.utime(self._disk_path(key))
+                except OSError:
+                    pass
+                self._store(key, content)
+                return content
+
+        with self.lock:
+            self.counters['misses'] += 1
+        return None
+
+    def put(self, key, content):
+        """렌더링 결과 저장 (디스크 캐시가 있으면 파일로도 저장)"""
+        self._store(key, content)
+
+        if self.cache_dir and len(content) <= self.max_disk_bytes:
+            suffix = os.path.splitext(key)[1]
+            fd, tmp_path = tempfile.mkstemp(prefix='.tmp_', suffix=suffix, dir=self.cache_dir)
+            try:
+                with os.fdopen(fd, 'wb') as f:
+                    f.write(content)
+                os.replace(tmp_path, self._disk_path(key))
+            except OSError as e:
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+                print(f"렌더 캐시 저장 오류: {e}")
+                return
+
+            with self.lock:
+                previous = self.disk_entries.pop(key, None)
+                if previous is not None:
+                    self.disk_bytes -= previous
+                self.disk_entries[key] = len(content)
+                self.disk_bytes += len(content)
+                removed = self._evict_disk()
+            self._remove_files(removed)
+
+    def _store(self, key, content):
+        """메모리에 저장하고 한도를 넘으면 오래 사용하지 않은 항목부터 제거"""
+        if len(content) > self.max_bytes:
+            return
+
+        with self.lock:
+            previous = self.entries.pop(key, None)
+            if previous is not None:
+                self.total_bytes -= len(previous)
+            self.entries[key] = content
+            self.total_bytes += len(content)
+
+            while len(self.entries) > self.max_entries or self.total_bytes > self.max_bytes:
+                _, evicted = self.entries.popitem(last=False)
+                self.total_bytes -= len(evicted)
+                self.counters['evictions'] += 1
+
+    def get_or_render(self, key, render, *args):
+        """캐시에 있으면 반환하고, 없으면 render(*args) 결과를 저장 후 반환"""
+        content = self.get(key)
+        if content is None:
+            content = render(*args)
+            self.put(key, content)
+        return content
+
+    def clear(self):
+        """메모리 캐시 비우기 (디스크 파일은 유지)"""
+        with self.lock:
+            self.entries.clear()
+            self.total_bytes = 0
+
+    def get_stats(self):
+        """적중/미적중 횟수와 현재 사용량"""
+        with self.lock:
+            stats = dict(self.counters)
+            stats['entries'] = len(self.entries)
+            stats['bytes'] = self.total_bytes
+            if self.cache_dir:
+                stats['disk_entries'] = len(self.disk_entries)
+                stats['disk_bytes'] = self.disk_bytes
+        lookups = stats['hits'] + stats['disk_hits'] + stats['misses']
+        stats['hit_rate'] = round((stats['hits'] + stats['disk_hits']) / lookups, 3) if lookups else 0.0
+        return stats
+
+# 전역 렌더 캐시 (메모리 전용, 처음 사용할 때 생성)
+_render_cache = None
+_render_cache_lock = threading.Lock()
+
+def get_render_cache():
+    """전역 RenderCache 인스턴스 반환"""
+    global _render_cache
+    if _render_cache is None:
+        with _render_cache_lock:
+            if _render_cache is None:
+                _render_cache = RenderCache()
+    return _render_cache
@@ -0,0 +1,159 @@
+import asyncio
+import contextvars
+import itertools
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+from excel_generator import (
+    create_advanced_business_trip_report_bytes,
+    create_business_trip_application_bytes
+)
+from instrumentation import request
+from render_cache import get_render_cache, make_render_key
+
+# 보관하는 완료 작업 수 (오래된 작업부터 정리)
+MAX_RETAINED_JOBS = 200
+
+class RenderJob:
+    """제출된 렌더링 작업 핸들 (상태 조회 및 결과 대기)"""
+
+    def __init__(self, job_id, description, future, submitted_at):
+        self.job_id = job_id
+        self.description = description
+        self.future = future
+        self.submitted_at = submitted_at
+        self.started_at = None
+        self.finished_at = None
+
+    @property
+    def status(self):
+        """'queued', 'running', 'done', 'failed' 중 하나"""
+        if not self.future.done():
+            return 'running' if self.started_at is not None else 'queued'
+        return 'failed' if self.future.exception() is not None else 'done'
+
+    def done(self):
+        return self.future.done()
+
+    def result(self, timeout=None):
+        """완료될 때까지 대기 후 결과 반환 (실패 시 예외 발생)"""
+        return self.future.result(timeout)
+
+    @property
+    def error(self):
+        """실패한 작업의 예외 (진행 중이거나 성공이면 None)"""
+        return self.future.exception() if self.future.done() else None
+
+    @property
+    def elapsed(self):
+        """제출 후 경과시간 (완료된 작업은 총 소요시간, 초)"""
+        return (self.finished_at or time.perf_counter()) - self.submitted_at
+
+class RenderJobManager:
+    """
+    스레드 풀에서 문서를 생성하고 작업 ID로 결과를 찾을 수 있게 하는 관리자
+
+    UI 스레드는 submit 후 바로 반환되며, 작업 상태를 조회하거나 asyncio에서 await할 수 있다.
+    """
+
+    def __init__(self, max_workers=2, max_retained_jobs=MAX_RETAINED_JOBS):
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='render-job')
+        self.max_retained_jobs = max_retained_jobs
+        self.jobs = OrderedDict()
+        self.jobs_lock = threading.Lock()
+        self.id_counter = itertools.count(1)
+
+    def submit(self, func, *args, description='', cache_key=None):
+        """
+        func(*args)를 백그라운드에서 실행하고 RenderJob 반환
+
+        cache_key를 지정하면 전역 렌더 캐시에 같은 결과가 있을 때 다시 생성하지 않는다.
+        """
+        job = RenderJob(f"job-{next(self.id_counter)}", description, None, time.perf_counter())
+
+        def run():
+            job.started_at = time.perf_counter()
+            try:
+                with request(f"render_jobs/{description or func.__name__}", job_id=job.job_id):
+                    if cache_key is not None:
+                        return get_render_cache().get_or_render(cache_key, func, *args)
+                    return func(*args)
+            finally:
+                job.finished_at = time.perf_counter()
+
+        with self.jobs_lock:
+            # 제출한 세션의 계측 설정이 작업 스레드에도 적용되도록 컨텍스트를 복사하여 실행
+            job.future = self.executor.submit(contextvars.copy_context().run, run)
+            self.jobs[job.job_id] = job
+            self._prune()
+        return job
+
+    def _prune(self):
+        """보관 한도를 넘은 완료 작업 정리 (jobs_lock 안에서 호출)"""
+        excess = len(self.jobs) - self.max_retained_jobs
+        if excess <= 0:
+            return
+        for job_id in [job_id for job_id, job in self.jobs.items() if job.done()][:excess]:
+            del self.jobs[job_id]
+
+    def get(self, job_id):
+        """작업 ID로 RenderJob 조회 (없거나 정리되었으면 None)"""
+        with self.jobs_lock:
+            return self.jobs.get(job_id)
+
+    def discard(self, job_id):
+        """결과를 가져간 작업을 목록에서 제거"""
+        with self.jobs_lock:
+            self.jobs.pop(job_id, None)
+
+    def submit_report(self, employees_data, additional_costs):
+        """출장복명서 생성 작업 제출 (결과: xlsx 바이트)"""
+        employees_data = [dict(emp) for emp in employees_data]
+        additional_costs = [dict(cost) for cost in additional_costs]
+        return self.submit(
+            create_advanced_business_trip_report_bytes, employees_data, additional_costs,
+            description='출장복명서',
+            cache_key=make_render_key('report', employees_data, additional_costs)
+        )
+
+    def submit_application(self, application_data):
+        """출장신청서 생성 작업 제출 (결과: xlsx 바이트)"""
+        application_data = dict(application_data)
+        application_data['travelers'] = [dict(t) for t in application_data.get('travelers', [])]
+        return self.submit(
+            create_business_trip_application_bytes, application_data,
+            description='출장신청서',
+            cache_key=make_render_key('application', application_data)
+        )
+
+    async def wait(self, job):
+        """asyncio 코드에서 작업 완료를 await"""
+        return await asyncio.wrap_future(job.future)
+
+    def shutdown(self, wait=True):
+        self.executor.shutdown(wait=wait)
+
+# 전역 작업 관리자 (처음 사용할 때 생성)
+_job_manager = None
+_job_manager_lock = threading.Lock()
+
+def get_job_manager():
+    """전역 RenderJobManager 인스턴스 반환"""
+    global _job_manager
+    if _job_manager is None:
+        with _job_manager_lock:
+            if _job_manager is None:
+                _job_manager = RenderJobManager()
+    return _job_manager
+
+async def render_report_async(employees_data, additional_costs):
+    """출장복명서를 백그라운드 스레드에서 생성하여 xlsx 바이트 반환 (asyncio용)"""
+    manager = get_job_manager()
+    return await manager.wait(manager.submit_report(employees_data, additional_costs))
+
+async def render_application_async(application_data):
+    """출장신청서를 백그라운드 스레드에서 생성하여 xlsx 바이트 반환 (asyncio용)"""
+    manager = get_job_manager()
+    return await manager.wait(manager.submit_application(application_data))
@@ -0,0 +1,290 @@
+import argparse
+import json
+import os
+import statistics
+import threading
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, quote, urlsplit
+
+from document_service import DOCUMENT_TYPES, OUTPUT_FORMATS, generate_document
+from instrumentation import percentile
+from render_cache import get_render_cache
+
+# 기본 바인딩 주소 (로컬 전용)
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+
+# 지연시간 통계에 사용하는 최근 요청 수
+LATENCY_WINDOW = 1000
+
+# 요청 본문 최대 크기 (bytes)
+MAX_REQUEST_BYTES = 5 * 1024 * 1024
+
+XLSX_CONTENT_TYPE = "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+PDF_CONTENT_TYPE = "application/pdf"
+
+# 출력 형식별 응답 Content-Type
+CONTENT_TYPES = {'xlsx': XLSX_CONTENT_TYPE, 'pdf': PDF_CONTENT_TYPE}
+
+class ServiceBusy(Exception):
+    """워커와 대기열이 모두 찬 상태"""
+
+class RenderTimeout(Exception):
+    """요청 대기시간 안에 렌더링이 끝나지 않음"""
+
+def get_outcome(future):
+    """완료된 Future의 결과 구분 (취소된 Future는 exception()을 호출하면 예외 발생)"""
+    if future.cancelled():
+        return 'cancelled'
+    return 'failed' if future.exception() is not None else 'completed'
+
+class RenderService:
+    """
+    문서 렌더링 워커 풀 + 제한된 대기열
+
+    실행 중(workers) + 대기 중(queue_size)인 요청 수가 한도에 도달하면 새 요청을
+    즉시 ServiceBusy로 거절하여, 요청이 무한정 쌓이지 않게 한다.
+    스레드 워커는 전역 렌더 캐시를 공유한다 (프로세스 워커는 캐시를 사용하지 않음).
+    """
+
+    def __init__(self, workers=2, queue_size=8, use_processes=False, use_cache=True):
+        self.workers = workers
+        self.queue_size = queue_size
+        self.cache = get_render_cache() if use_cache and not use_processes else None
+        executor_class = ProcessPoolExecutor if use_processes else ThreadPoolExecutor
+        self.executor = executor_class(max_workers=workers)
+        self.slots = threading.BoundedSemaphore(workers + queue_size)
+        self.metrics_lock = threading.Lock()
+        self.latencies = deque(maxlen=LATENCY_WINDOW)
+        self.counters = {'accepted': 0, 'completed': 0, 'failed': 0, 'rejected': 0, 'timed_out': 0, 'cancelled': 0}
+        self.in_flight = 0
+        self.started_at = time.time()
+
+    def submit(self, document_type, payload, output_format='xlsx'):
+        """렌더링 작업 제출 (한도 초과 시 ServiceBusy), Future 반환"""
+        if not self.slots.acquire(blocking=False):
+            with self.metrics_lock:
+                self.counters['rejected'] += 1
+            raise ServiceBusy(f"처리 한도 초과 (워커 {self.workers}, 대기열 {self.queue_size})")
+
+        with self.metrics_lock:
+            self.counters['accepted'] += 1
+            self.in_flight += 1
+
+        submitted = time.perf_counter()
+        try:
+            future = self.executor.submit(generate_document, document_type, payload, self.cache, output_format)
+        except Exception:
+            self._finish(submitted, 'failed')
+            raise
+        future.add_done_callback(lambda f: self._finish(submitted, get_outcome(f)))
+        return future
+
+    def _finish(self, submitted, outcome):
+        """작업 종료 시 슬롯 반환 및 지연시간 기록 (outcome: 'completed', 'failed', 'cancelled')"""
+        latency = time.perf_counter() - submitted
+        with self.metrics_lock:
+            self.in_flight -= 1
+            self.counters[outcome] += 1
+            if outcome != 'cancelled':
+                self.latencies.append(latency)
+        self.slots.release()
+
+    def render(self, document_type, payload, timeout=None, output_format='xlsx'):
+        """
+        동기 렌더링: (파일명, bytes) 반환
+
+        timeout 안에 끝나지 않으면 RenderTimeout. 아직 대기열에 있던 작업은 취소하고,
+        이미 실행 중인 작업은 끝까지 실행되어 슬롯을 반환한다 (결과는 캐시에 남음).
+        """
+        future = self.submit(document_type, payload, output_format)
+        try:
+            return future.result(timeout=timeout)
+        except FutureTimeoutError:
+            future.cancel()
+            with self.metrics_lock:
+                self.counters['timed_out'] += 1
+            raise RenderTimeout(f"렌더링 대기시간 초과 ({timeout}초)") from None
+
+    def get_metrics(self):
+        """요청 수, 처리 중 수, 최근 지연시간 백분위수(ms) 반환"""
+        with self.metrics_lock:
+            latencies = sorted(self.latencies)
+            metrics = dict(self.counters)
+            metrics['in_flight'] = self.in_flight
+
+        metrics.update({
+            'workers': self.workers,
+            'queue_size': self.queue_size,
+            'uptime_seconds': round(time.time() - self.started_at, 1),
+            'latency_ms': {
+                'count': len(latencies),
+                'mean': round(statistics.fmean(latencies) * 1000, 2) if latencies else 0.0,
+                'p50': round(percentile(latencies, 0.50) * 1000, 2),
+                'p95': round(percentile(latencies, 0.95) * 1000, 2),
+                'p99': round(percentile(latencies, 0.99) * 1000, 2),
+                'max': round(latencies[-1] * 1000, 2) if latencies else 0.0
+            }
+        })
+        if self.cache is not None:
+            metrics['cache'] = self.cache.get_stats()
+        return metrics
+
+    def shutdown(self, wait=True):
+        self.executor.shutdown(wait=wait)
+
+class RenderRequestHandler(BaseHTTPRequestHandler):
+    """
+    POST /render/report, /render/application : JSON 입력 -> xlsx 응답
+        (?format=pdf 또는 본문의 "format" 필드로 PDF 응답, reportlab 필요)
+    GET /metrics : 처리 통계 JSON
+    GET /health : 상태 확인
+    """
+
+    server_version = "TripRenderService/1.0"
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+    def send_json(self, status, data, headers=None):
+        body = json.dumps(data, ensure_ascii=False).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        if self.path == '/metrics':
+            self.send_json(200, self.server.service.get_metrics())
+        elif self.path == '/health':
+            self.send_json(200, {'status': 'ok'})
+        else:
+            self.send_json(404, {'error': f"알 수 없는 경로: {self.path}"})
+
+    def do_POST(self):
+        prefix = '/render/'
+        url = urlsplit(self.path)
+        document_type = url.path[len(prefix):] if url.path.startswith(prefix) else None
+        if document_type not in DOCUMENT_TYPES:
+            self.send_json(404, {'error': f"알 수 없는 경로: {self.path}"})
+            return
+
+        # 본문을 읽지 않고 응답하는 경우 남은 본문이 다음 요청으로 읽히지 않도록 연결을 닫음
+        try:
+            length = int(self.headers.get('Content-Length') or 0)
+        except ValueError:
+            length = -1
+        if length < 0:
+            self.close_connection = True
+            self.send_json(400, {'error': f"Content-Length 헤더 오류: {self.headers.get('Content-Length')}"})
+            return
+        if length > MAX_REQUEST_BYTES:
+            self.close_connection = True
+            self.send_json(413, {'error': f"요청 본문이 너무 큽니다 (최대 {MAX_REQUEST_BYTES:,} bytes)."})
+            return
+
+        try:
+            payload = json.loads(self.rfile.read(length) or b'{}')
+        except ValueError as e:
+            self.send_json(400, {'error': f"JSON 형식 오류: {e}"})
+            return
+        if not isinstance(payload, dict):
+            self.send_json(400, {'error': f"JSON 객체가 필요합니다: {type(payload).__name__}"})
+            return
+
+        # 출력 형식: 쿼리 문자열 우선, 없으면 본문의 format 필드
+        query_format = parse_qs(url.query).get('format')
+        body_format = payload.pop('format', None)
+        output_format = query_format[-1] if query_format else (body_format or 'xlsx')
+        if output_format not in OUTPUT_FORMATS:
+            self.send_json(400, {'error': f"지원하지 않는 출력 형식입니다: {output_format}"})
+            return
+
+        start = time.perf_counter()
+        try:
+            filename, content = self.server.service.render(
+                document_type, payload, self.server.request_timeout, output_format
+            )
+        except ServiceBusy as e:
+            self.send_json(429, {'error': str(e)}, {'Retry-After': '1'})
+            return
+        except RenderTimeout as e:
+            self.send_json(504, {'error': str(e)})
+            return
+        except ImportError as e:
+            # PDF 출력에 필요한 reportlab 미설치
+            self.send_json(501, {'error': str(e)})
+            return
+        except (ValueError, KeyError, TypeError) as e:
+            self.send_json(400, {'error': f"{type(e).__name__}: {e}"})
+            return
+        except Exception as e:
+            self.send_json(500, {'error': f"{type(e).__name__}: {e}"})
+            return
+
+        self.send_response(200)
+        self.send_header('Content-Type', CONTENT_TYPES[output_format])
+        self.send_header('Content-Length', str(len(content)))
+        self.send_header('Content-Disposition', f"attachment; filename*=UTF-8''{quote(filename)}")
+        self.send_header('X-Render-Seconds', f"{time.perf_counter() - start:.4f}")
+        self.end_headers()
+        self.wfile.write(content)
+
+class RenderHTTPServer(ThreadingHTTPServer):
+    """RenderService를 공유하는 HTTP 서버"""
+
+    daemon_threads = True
+
+    def __init__(self, address, service, request_timeout=60.0, verbose=False):
+        super().__init__(address, RenderRequestHandler)
+        self.service = service
+        self.request_timeout = request_timeout
+        self.verbose = verbose
+
+def create_server(host=DEFAULT_HOST, port=DEFAULT_PORT, workers=2, queue_size=8,
+                  use_processes=False, request_timeout=60.0, verbose=False, use_cache=True):
+    """
+    렌더링 서버 생성 (port=0이면 빈 포트 자동 할당, server.server_address로 확인)
+
+    serve_forever()는 호출하지 않으므로 테스트에서는 별도 스레드로 실행할 수 있다.
+    """
+    service = RenderService(workers, queue_size, use_processes, use_cache)
+    return RenderHTTPServer((host, port), service, request_timeout, verbose)
+
+def main(argv=None):
+    """로컬 렌더링 서버 실행 CLI"""
+    parser = argparse.ArgumentParser(description="출장신청서/출장복명서 로컬 HTTP 렌더링 서버")
+    parser.add_argument('--host', default=DEFAULT_HOST, help="바인딩 주소")
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT, help="포트")
+    parser.add_argument('-w', '--workers', type=int, default=os.cpu_count() or 2, help="렌더링 워커 수")
+    parser.add_argument('-q', '--queue-size', type=int, default=8, help="대기열 크기 (초과 시 429 응답)")
+    parser.add_argument('--processes', action='store_true', help="스레드 대신 프로세스 워커 사용")
+    parser.add_argument('--timeout', type=float, default=60.0, help="요청당 최대 대기시간(초)")
+    parser.add_argument('--no-cache', action='store_true', help="렌더 캐시 사용 안 함")
+    parser.add_argument('-v', '--verbose', action='store_true', help="요청 로그 출력")
+    args = parser.parse_args(argv)
+
+    server = create_server(args.host, args.port, args.workers, args.queue_size,
+                           args.processes, args.timeout, args.verbose, not args.no_cache)
+    host, port = server.server_address[:2]
+    print(f"렌더링 서버 시작: http://{host}:{port} (워커 {args.workers}, 대기열 {args.queue_size})")
+
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        server.service.shutdown()
+    return 0
+
+if __name__ == '__main__':
+    raise SystemExit(main())
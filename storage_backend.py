@@ -0,0 +1,298 @@
+import json
+import os
+import shutil
+import sqlite3
+import threading
+import time
+
+if os.name == 'nt':
+    import msvcrt
+else:
+    import fcntl
+
+# 저장소 종류 선택 환경변수 ('json' 또는 'sqlite')
+STORAGE_BACKEND_ENV = "TRIP_DATA_BACKEND"
+
+class StorageLockTimeout(Exception):
+    """잠금 대기 시간 초과"""
+
+class FileLock:
+    """프로세스 간 파일 잠금 (.lock 파일, Windows/Linux 공용)"""
+
+    def __init__(self, path, timeout=10.0, poll_interval=0.05):
+        self.lock_path = f"{path}.lock"
+        self.timeout = timeout
+        self.poll_interval = poll_interval
+        self.lock_file = None
+
+    def __enter__(self):
+        self.lock_file = open(self.lock_path, 'a+b')
+        deadline = time.monotonic() + self.timeout
+
+        while True:
+            try:
+                if os.name == 'nt':
+                    self.lock_file.seek(0)
+                    msvcrt.locking(self.lock_file.fileno(), msvcrt.LK_NBLCK, 1)
+                else:
+                    fcntl.flock(self.lock_file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+                return self
+            except OSError:
+                if time.monotonic() >= deadline:
+                    self.lock_file.close()
+                    self.lock_file = None
+                    raise StorageLockTimeout(f"잠금 대기 시간 초과: {self.lock_path}")
+                time.sleep(self.poll_interval)
+
+    def __exit__(self, exc_type, exc_value, tb):
+        try:
+            if os.name == 'nt':
+                self.lock_file.seek(0)
+                msvcrt.locking(self.lock_file.fileno(), msvcrt.LK_UNLCK, 1)
+            else:
+                fcntl.flock(self.lock_file.fileno(), fcntl.LOCK_UN)
+        finally:
+            self.lock_file.close()
+            self.lock_file = None
+        return False
+
+def copy_data(data):
+    """{데이터 유형: 값 리스트} 사본 생성 (공유 스냅샷 보호용)"""
+    return {key: list(values) for key, values in data.items()}
+
+def atomic_write_json(path, data):
+    """
+    임시 파일에 쓴 뒤 교체하여 중간에 끊겨도 파일이 깨지지 않게 저장
+
+    임시 파일은 0666으로 만들어 커널이 현재 umask를 적용하게 하고 (일반 파일 생성과 같은 권한),
+    기존 파일이 있으면 교체 전에 그 권한을 복사한다.
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    while True:
+        tmp_path = os.path.join(directory, f".tmp_{os.urandom(8).hex()}.json")
+        try:
+            fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, 'O_BINARY', 0), 0o666)
+            break
+        except FileExistsError:
+            continue
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+            f.flush()
+            os.fsync(f.fileno())
+        if os.path.exists(path):
+            shutil.copymode(path, tmp_path)
+        os.replace(tmp_path, path)
+    except Exception:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+def connect_sqlite(path):
+    """WAL 모드, 자동 커밋(명시적 BEGIN 사용) SQLite 연결 생성"""
+    conn = sqlite3.connect(path, timeout=10.0, isolation_level=None)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    return conn
+
+class JsonFileStorage:
+    """JSON 파일 저장소 (원자적 저장 + 파일 잠금 + 메모리 스냅샷)"""
+
+    def __init__(self, path):
+        self.path = path
+        self.snapshot = None
+        self.snapshot_signature = None
+        self.snapshot_lock = threading.Lock()
+
+    def exists(self):
+        return os.path.exists(self.path)
+
+    def get_signature(self):
+        """변경 감지용 (수정시각, 크기), 파일이 없으면 None"""
+        try:
+            stat = os.stat(self.path)
+        except OSError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size)
+
+    def load(self):
+        """파일이 바뀌지 않았으면 메모리 스냅샷 사본 반환"""
+        signature = self.get_signature()
+        with self.snapshot_lock:
+            if self.snapshot is None or signature != self.snapshot_signature:
+                with open(self.path, 'r', encoding='utf-8') as f:
+                    self.snapshot = json.load(f)
+                self.snapshot_signature = signature
+            return copy_data(self.snapshot)
+
+    def _write(self, data):
+        atomic_write_json(self.path, data)
+        with self.snapshot_lock:
+            self.snapshot = copy_data(data)
+            self.snapshot_signature = self.get_signature()
+
+    def save(self, data):
+        with FileLock(self.path):
+            self._write(data)
+
+    def _read_latest(self):
+        """잠금 상태에서 디스크의 최신 내용 읽기 (다른 세션의 변경 반영)"""
+        if not self.exists():
+            return {}
+        with open(self.path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    def add_value(self, data_type, value):
+        with FileLock(self.path):
+            data = self._read_latest()
+            values = data.setdefault(data_type, [])
+            if value in values:
+                return False
+            values.append(value)
+            self._write(data)
+            return True
+
+    def remove_value(self, data_type, value):
+        with FileLock(self.path):
+            data = self._read_latest()
+            if value not in data.get(data_type, []):
+                return False
+            data[data_type].remove(value)
+            self._write(data)
+            return True
+
+class SQLiteStorage:
+    """
+    SQLite 저장소
+
+    값 추가/삭제는 행 단위 INSERT/DELETE로 처리하고, 조회는 version이 바뀌지 않는 한
+    메모리 스냅샷에서 반환한다. 연결은 스레드별로 만든다.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.local = threading.local()
+        self.snapshot = None
+        self.snapshot_version = None
+        self.snapshot_lock = threading.Lock()
+        self._init_schema()
+
+    def connect(self):
+        conn = getattr(self.local, 'conn', None)
+        if conn is None:
+            conn = connect_sqlite(self.path)
+            self.local.conn = conn
+        return conn
+
+    def _init_schema(self):
+        conn = self.connect()
+        conn.executescript("""
+            CREATE TABLE IF NOT EXISTS reference_data (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                data_type TEXT NOT NULL,
+                value TEXT NOT NULL,
+                UNIQUE (data_type, value)
+            );
+            CREATE TABLE IF NOT EXISTS meta (
+                key TEXT PRIMARY KEY,
+                version INTEGER NOT NULL
+            );
+            INSERT OR IGNORE INTO meta (key, version) VALUES ('reference_data', 0);
+        """)
+
+    def _bump_version(self, conn):
+        conn.execute("UPDATE meta SET version = version + 1 WHERE key = 'reference_data'")
+
+    def get_version(self):
+        row = self.connect().execute("SELECT version FROM meta WHERE key = 'reference_data'").fetchone()
+        return row[0]
+
+    def get_signature(self):
+        """변경 감지용 버전 번호 (쓰기 트랜잭션마다 1씩 증가)"""
+        return self.get_version()
+
+    def exists(self):
+        """저장된 값이 한 번이라도 기록되었는지 여부"""
+        return self.get_version() > 0
+
+    def load(self):
+        version = self.get_version()
+        with self.snapshot_lock:
+            if self.snapshot is None or version != self.snapshot_version:
+                data = {}
+                rows = self.connect().execute(
+                    "SELECT data_type, value FROM reference_data ORDER BY id"
+                )
+                for data_type, value in rows:
+                    data.setdefault(data_type, []).append(value)
+                self.snapshot = data
+                self.snapshot_version = version
+            return copy_data(self.snapshot)
+
+    def save(self, data):
+        """전체 데이터 교체 (초기화/가져오기용)"""
+        conn = self.connect()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            conn.execute("DELETE FROM reference_data")
+            conn.executemany(
+                "INSERT OR IGNORE INTO reference_data (data_type, value) VALUES (?, ?)",
+                [(data_type, value) for data_type, values in data.items() for value in values]
+            )
+            self._bump_version(conn)
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+
+    def add_value(self, data_type, value):
+        conn = self.connect()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            cursor = conn.execute(
+                "INSERT OR IGNORE INTO reference_data (data_type, value) VALUES (?, ?)",
+                (data_type, value)
+            )
+            added = cursor.rowcount > 0
+            if added:
+                self._bump_version(conn)
+            conn.execute("COMMIT")
+            return added
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+
+    def remove_value(self, data_type, value):
+        conn = self.connect()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            cursor = conn.execute(
+                "DELETE FROM reference_data WHERE data_type = ? AND value = ?",
+                (data_type, value)
+            )
+            removed = cursor.rowcount > 0
+            if removed:
+                self._bump_version(conn)
+            conn.execute("COMMIT")
+            return removed
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+
+def create_storage(json_path, backend=None):
+    """
+    저장소 생성 (backend 미지정 시 TRIP_DATA_BACKEND 환경변수, 기본값 'json')
+
+    SQLite 저장소가 비어 있고 기존 JSON 파일이 있으면 JSON 내용을 가져온다.
+    """
+    backend = (backend or os.environ.get(STORAGE_BACKEND_ENV, 'json')).lower()
+
+    if backend == 'json':
+        return JsonFileStorage(json_path)
+    if backend == 'sqlite':
+        storage = SQLiteStorage(os.path.splitext(json_path)[0] + '.db')
+        if not storage.exists() and os.path.exists(json_path):
+            storage.save(JsonFileStorage(json_path).load())
+        return storage
+
+    raise ValueError(f"지원하지 않는 저장소입니다: {backend}")
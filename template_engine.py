@@ -0,0 +1,231 @@
+import argparse
+import copy
+import os
+import re
+import threading
+from datetime import datetime
+
+import openpyxl
+from openpyxl.utils.indexed_list import IndexedList
+
+from excel_generator import (
+    APPLICATION_MIN_TRAVELER_ROWS,
+    TEMPLATE_VERSION,
+    build_business_trip_application_workbook,
+    create_business_trip_application_bytes,
+    get_application_footer_row,
+    workbook_to_bytes
+)
+
+# 기본 템플릿 파일 경로 (레이아웃 버전별 파일이므로 레이아웃이 바뀌면 새 템플릿을 다시 생성)
+TEMPLATE_DIR = os.path.join(".cache", "templates")
+APPLICATION_TEMPLATE_FILE = os.path.join(TEMPLATE_DIR, f"출장신청서_template_v{TEMPLATE_VERSION}.xlsx")
+
+# 출장신청서 기본 템플릿의 출장자 행 수 (12~19행)
+APPLICATION_TEMPLATE_TRAVELER_ROWS = APPLICATION_MIN_TRAVELER_ROWS
+
+# {{project_name}}, {{travelers.0.name}} 형태의 자리표시자
+PLACEHOLDER_PATTERN = re.compile(r'\{\{\s*([\w.]+)\s*\}\}')
+
+# deepcopy 시 내용이 복사되지 않는 워크북 스타일 테이블 (IndexedList)
+WORKBOOK_STYLE_TABLES = [
+    '_fonts', '_alignments', '_borders', '_fills',
+    '_number_formats', '_protections', '_cell_styles'
+]
+
+# 프로세스 단위 템플릿 캐시: 절대경로 -> (수정시각, 템플릿)
+_template_cache = {}
+_template_cache_lock = threading.Lock()
+
+class DocumentTemplate:
+    """한 번 로드한 템플릿 워크북과 자리표시자 위치 목록"""
+
+    def __init__(self, workbook):
+        self.workbook = workbook
+        self.placeholders = self.find_placeholders(workbook)
+
+    @staticmethod
+    def find_placeholders(workbook):
+        """자리표시자가 있는 셀 좌표를 (시트명, 좌표, 원본 문자열, 필드 리스트)로 수집"""
+        placeholders = []
+        for ws in workbook.worksheets:
+            for row in ws.iter_rows():
+                for cell in row:
+                    if isinstance(cell.value, str) and '{{' in cell.value:
+                        fields = PLACEHOLDER_PATTERN.findall(cell.value)
+                        if fields:
+                            placeholders.append((ws.title, cell.coordinate, cell.value, fields))
+        return placeholders
+
+    def render(self, context):
+        """템플릿 사본에 데이터만 채운 워크북 반환 (원본 템플릿은 변경하지 않음)"""
+        wb = copy.deepcopy(self.workbook)
+
+        # 스타일 객체는 변경되지 않으므로 원본 테이블 내용을 그대로 공유
+        for attr in WORKBOOK_STYLE_TABLES:
+            setattr(wb, attr, IndexedList(getattr(self.workbook, attr)))
+
+        for sheet_title, coordinate, template_text, fields in self.placeholders:
+            cell = wb[sheet_title][coordinate]
+            full_match = PLACEHOLDER_PATTERN.fullmatch(template_text.strip())
+
+            if full_match:
+                # 자리표시자만 있는 셀은 원래 값 타입(숫자 등)을 그대로 입력
+                value = resolve_field(context, full_match.group(1))
+                cell.value = value if value != '' else None
+            else:
+                cell.value = PLACEHOLDER_PATTERN.sub(
+                    lambda m: str(resolve_field(context, m.group(1))), template_text
+                )
+
+        return wb
+
+def resolve_field(context, field_path):
+    """'travelers.0.name' 같은 점 표기 경로로 값을 찾고, 없으면 빈 문자열 반환"""
+    value = context
+    for key in field_path.split('.'):
+        if isinstance(value, dict):
+            value = value.get(key)
+        elif isinstance(value, (list, tuple)) and key.isdigit():
+            index = int(key)
+            value = value[index] if index < len(value) else None
+        else:
+            value = None
+
+        if value is None:
+            return ''
+    return value
+
+def load_template(template_path):
+    """템플릿을 프로세스당 한 번만 로드 (파일이 수정되면 다시 로드)"""
+    abs_path = os.path.abspath(template_path)
+    mtime = os.path.getmtime(abs_path)
+
+    with _template_cache_lock:
+        cached = _template_cache.get(abs_path)
+        if cached and cached[0] == mtime:
+            return cached[1]
+
+    template = DocumentTemplate(openpyxl.load_workbook(abs_path))
+
+    with _template_cache_lock:
+        _template_cache[abs_path] = (mtime, template)
+    return template
+
+def clear_template_cache():
+    """로드된 템플릿 캐시 비우기"""
+    with _template_cache_lock:
+        _template_cache.clear()
+
+def export_application_template(template_path=APPLICATION_TEMPLATE_FILE):
+    """
+    현재 코드의 출장신청서 레이아웃을 자리표시자가 들어간 템플릿 파일로 저장
+
+    저장된 템플릿은 엑셀에서 직접 수정하여 레이아웃을 바꿀 수 있다.
+    """
+    placeholder_data = {
+        'project_manager': '{{project_manager}}',
+        'project_name': '{{project_name}}',
+        'trip_period': '{{trip_period}}',
+        'destination': '{{destination}}',
+        'trip_purpose': '{{trip_purpose}}',
+        'company_car': '{{company_car}}',
+        'public_transport': '{{public_transport}}',
+        'travelers': [
+            {
+                'position': f'{{{{travelers.{i}.position}}}}',
+                'name': f'{{{{travelers.{i}.name}}}}',
+                'account': f'{{{{travelers.{i}.account}}}}',
+                'note': f'{{{{travelers.{i}.note}}}}'
+            }
+            for i in range(APPLICATION_TEMPLATE_TRAVELER_ROWS)
+        ]
+    }
+
+    wb = build_business_trip_application_workbook(placeholder_data)
+    wb.active[f"A{get_application_footer_row(APPLICATION_TEMPLATE_TRAVELER_ROWS) + 1}"] = '{{current_date}}'
+
+    template_dir = os.path.dirname(template_path)
+    if template_dir:
+        os.makedirs(template_dir, exist_ok=True)
+    wb.save(template_path)
+    return os.path.abspath(template_path)
+
+def build_application_context(application_data):
+    """출장신청서 데이터에 템플릿 공통 값(작성일)을 더한 컨텍스트 생성"""
+    context = dict(application_data)
+    context.setdefault('current_date', datetime.now().strftime('%Y년 %m월 %d일'))
+    return context
+
+def render_application_from_template(application_data, template_path=APPLICATION_TEMPLATE_FILE):
+    """
+    템플릿 워크북을 복제하여 출장신청서 생성
+
+    템플릿의 출장자 행(APPLICATION_TEMPLATE_TRAVELER_ROWS)보다 출장자가 많으면 출장자가
+    누락되지 않도록 출장자 행을 늘리는 코드 레이아웃으로 생성한다.
+
+    Args:
+        application_data: 출장신청서 데이터 딕셔너리
+        template_path: 템플릿 파일 경로 (없으면 기본 레이아웃으로 자동 생성)
+
+    Returns:
+        bytes: xlsx 파일 내용
+    """
+    travelers = application_data.get('travelers', [])
+    if len(travelers) > APPLICATION_TEMPLATE_TRAVELER_ROWS:
+        return create_business_trip_application_bytes(application_data)
+
+    if not os.path.exists(template_path):
+        export_application_template(template_path)
+
+    template = load_template(template_path)
+    wb = template.render(build_application_context(application_data))
+    return workbook_to_bytes(wb)
+
+def build_report_context(employees_data, additional_costs):
+    """
+    출장복명서 템플릿용 컨텍스트 생성
+
+    첫 번째 직원 기준의 공통 정보와 employees.N.*, additional_costs.N.* 목록을 제공한다.
+    """
+    first_emp = employees_data[0] if employees_data else {}
+    context = {
+        'project_manager': first_emp.get('project_manager', ''),
+        'project_name': first_emp.get('project_name', ''),
+        'destination': first_emp.get('destination', ''),
+        'trip_purpose': first_emp.get('trip_purpose', ''),
+        'current_date': datetime.now().strftime('%Y년 %m월 %d일'),
+        'employees': employees_data,
+        'additional_costs': additional_costs,
+        'total_cost': sum(emp['daily_allowance_total'] + emp['meal_cost_total'] for emp in employees_data)
+                      + sum(cost['amount'] for cost in additional_costs),
+    }
+
+    if first_emp:
+        context['start_datetime'] = f"{first_emp['start_date'].strftime('%Y년  %m월 %d일')} {first_emp['start_time'].strftime('%H시 %M분')}"
+        context['end_datetime'] = f"{first_emp['end_date'].strftime('%Y년  %m월 %d일')} {first_emp['end_time'].strftime('%H시 %M분')}"
+    return context
+
+def render_report_from_template(employees_data, additional_costs, template_path):
+    """
+    사용자가 만든 출장복명서 템플릿을 복제하여 자리표시자만 채움
+
+    복명서는 출장자/비용 행 수가 가변이므로 기본 템플릿을 제공하지 않으며,
+    템플릿에 준비된 행(employees.N.*) 수만큼만 채워진다.
+    """
+    template = load_template(template_path)
+    wb = template.render(build_report_context(employees_data, additional_costs))
+    return workbook_to_bytes(wb)
+
+def main(argv=None):
+    """템플릿 파일 생성 CLI"""
+    parser = argparse.ArgumentParser(description="출장신청서 템플릿 파일 생성")
+    parser.add_argument('-o', '--output', default=APPLICATION_TEMPLATE_FILE, help="템플릿 파일 경로")
+    args = parser.parse_args(argv)
+
+    path = export_application_template(args.output)
+    print(f"템플릿 생성 완료: {path}")
+    return 0
+
+if __name__ == '__main__':
+    raise SystemExit(main())
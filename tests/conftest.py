@@ -0,0 +1,138 @@
+import os
+import sys
+from datetime import date, time
+
+import openpyxl
+import pytest
+
+# 저장소 루트의 모듈(excel_generator, trip_store, ...)을 바로 import
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def make_employee(name, start_date, end_date, daily_allowance_per_day=40000, meal_cost_per_day=15000,
+                  project_name='해양 조사 연구과제', **fields):
+    """main.py의 employees_list 항목 형식으로 출장자 1명 데이터 생성"""
+    trip_days = (end_date - start_date).days + 1
+    employee = {
+        'employee_name': name,
+        'position': '연구원',
+        'project_manager': '김철수',
+        'project_name': project_name,
+        'destination': '부산',
+        'trip_purpose': '현장 조사',
+        'start_date': start_date,
+        'start_time': time(9, 0),
+        'end_date': end_date,
+        'end_time': time(18, 0),
+        'trip_days': trip_days,
+        'daily_allowance_per_day': daily_allowance_per_day,
+        'meal_cost_per_day': meal_cost_per_day,
+        'daily_allowance_total': daily_allowance_per_day * trip_days,
+        'meal_cost_total': meal_cost_per_day * trip_days,
+        'holiday_work': False,
+        'holiday_days': 0,
+        'special_work': False,
+        'special_days': 0,
+        'dangerous_work': False,
+        'dangerous_days': 0,
+    }
+    employee.update(fields)
+    return employee
+
+
+@pytest.fixture
+def sample_trip():
+    """출장자 2명, 추가 비용 2건 (1명은 월을 넘는 출장)"""
+    employees_data = [
+        make_employee('홍길동', date(2026, 3, 30), date(2026, 4, 2)),
+        make_employee('이영희', date(2026, 3, 30), date(2026, 3, 31), position='선임연구원'),
+    ]
+    additional_costs = [
+        {'item': '숙박비', 'payment_method': '법인카드', 'amount': 120000},
+        {'item': '유류비', 'payment_method': '개인카드', 'amount': 35001},
+    ]
+    return employees_data, additional_costs
+
+
+def make_report_trip(destination='부산', employee_names=('홍길동', '이영희'), **fields):
+    """batch_generator/render_service 입력 형식의 출장 1건 (비용 항목을 직접 지정하여 직원 CSV 불필요)"""
+    trip = {
+        'project_manager': '김철수',
+        'project_name': '해양 조사 연구과제',
+        'destination': destination,
+        'trip_purpose': '현장 조사',
+        'start_date': '2026-03-02',
+        'end_date': '2026-03-03',
+        'employees': [
+            {
+                'employee_name': name,
+                'position': '연구원',
+                'trip_days': 2,
+                'daily_allowance_per_day': 40000,
+                'meal_cost_per_day': 15000,
+                'daily_allowance_total': 80000,
+                'meal_cost_total': 30000,
+            }
+            for name in employee_names
+        ],
+        'additional_costs': [{'item': '숙박비', 'payment_method': '법인카드', 'amount': 120000}],
+    }
+    trip.update(fields)
+    return trip
+
+
+def make_application_data(travelers=3):
+    """출장신청서 입력 데이터"""
+    return {
+        'project_manager': '김철수',
+        'project_name': '해양 조사 연구과제',
+        'trip_period': '2026.03.02 ~ 03.03(1박 2일)',
+        'destination': '부산',
+        'trip_purpose': '현장 조사',
+        'company_car': '',
+        'public_transport': 'KTX',
+        'travelers': [
+            {'position': '연구원', 'name': f"직원{i + 1}", 'account': f"110-{i:03d}-000000", 'note': ''}
+            for i in range(travelers)
+        ],
+    }
+
+
+def snapshot_sheet(ws):
+    """비교용 워크시트 내용: 셀 값/서식, 병합, 행/열 크기, 인쇄 설정"""
+    cells = {}
+    for row in ws.iter_rows():
+        for cell in row:
+            if cell.value is not None or cell.has_style:
+                cells[cell.coordinate] = (
+                    cell.value, repr(cell.font), repr(cell.border), repr(cell.alignment),
+                    repr(cell.fill), cell.number_format
+                )
+    return {
+        'title': ws.title,
+        'cells': cells,
+        'merges': sorted(str(merged) for merged in ws.merged_cells.ranges),
+        'row_heights': {row: dim.height for row, dim in ws.row_dimensions.items() if dim.height},
+        'col_widths': {col: dim.width for col, dim in ws.column_dimensions.items() if dim.width},
+        'page_setup': repr(ws.page_setup.__dict__),
+        'page_margins': repr(ws.page_margins),
+        'print_options': repr(ws.print_options),
+        'print_area': ws.print_area,
+        'print_title_rows': ws.print_title_rows,
+        'row_breaks': [brk.id for brk in ws.row_breaks.brk],
+        'sheet_properties': repr(ws.sheet_properties),
+        'sheet_view': repr(ws.sheet_view),
+    }
+
+
+def snapshot_workbook(source):
+    wb = openpyxl.load_workbook(source)
+    return [snapshot_sheet(ws) for ws in wb.worksheets]
+
+
+def assert_same_workbook(expected, actual):
+    expected, actual = snapshot_workbook(expected), snapshot_workbook(actual)
+    assert [sheet['title'] for sheet in actual] == [sheet['title'] for sheet in expected]
+    for expected_sheet, actual_sheet in zip(expected, actual):
+        for key in expected_sheet:
+            assert actual_sheet[key] == expected_sheet[key], f"{expected_sheet['title']}: {key}"
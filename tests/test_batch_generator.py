@@ -0,0 +1,149 @@
+import json
+import zipfile
+
+import openpyxl
+import pytest
+
+from batch_generator import (
+    SUMMARY_SHEET_TITLE,
+    generate_applications_batch,
+    generate_reports_batch,
+    load_trips,
+    main,
+    make_sheet_title,
+    normalize_trip,
+)
+from conftest import make_application_data, make_report_trip
+
+
+def make_trips():
+    """정상 출장 2건 사이에 출장자가 없는 잘못된 출장 1건"""
+    return [
+        make_report_trip('부산'),
+        {'destination': '잘못된 출장', 'employees': []},
+        make_report_trip('제주', employee_names=['박민수']),
+    ]
+
+
+def test_normalize_trip_fills_trip_level_fields():
+    report = normalize_trip(make_report_trip('부산'), index=4)
+    first_emp = report['employees_data'][0]
+
+    assert report['name'] == '부산_20260302'
+    assert report['filename'] == '출장복명서_부산_20260302_005.xlsx'
+    assert first_emp['destination'] == '부산'
+    assert first_emp['end_date'].isoformat() == '2026-03-03'
+    assert first_emp['start_time'].strftime('%H:%M') == '09:00'
+    assert report['additional_costs'] == [{'item': '숙박비', 'payment_method': '법인카드', 'amount': 120000}]
+
+
+def test_make_sheet_title_is_unique_and_valid():
+    used = set()
+    assert make_sheet_title('부산/제주:1', used) == '부산_제주_1'
+    assert make_sheet_title('부산/제주:1', used) == '부산_제주_1_2'
+    long_title = make_sheet_title('가' * 40, used)
+    assert len(long_title) <= 31
+
+
+@pytest.mark.parametrize('engine, workers', [('code', 1), ('direct', 1), ('code', 2)])
+def test_zip_batch_records_errors_and_keeps_other_documents(tmp_path, engine, workers):
+    output_path = tmp_path / 'reports.zip'
+    result = generate_reports_batch(make_trips(), str(output_path), mode='zip', workers=workers, engine=engine)
+
+    documents = result['documents']
+    assert result['failed'] == 1
+    assert documents[1]['name'] is None
+    assert documents[1]['error'].startswith('ValueError: 2번째 출장에 출장자가 없습니다')
+    assert [doc['travelers'] for doc in documents] == [2, 0, 1]
+
+    with zipfile.ZipFile(output_path) as zf:
+        names = zf.namelist()
+        assert names == [documents[0]['name'], documents[2]['name']]
+        assert zf.read(names[0])[:2] == b'PK'
+
+
+def test_zip_batch_renames_duplicate_filenames(tmp_path):
+    trips = [make_report_trip('부산', filename='같은이름.xlsx'), make_report_trip('부산', filename='같은이름.xlsx')]
+    result = generate_reports_batch(trips, str(tmp_path / 'reports.zip'))
+
+    assert [doc['name'] for doc in result['documents']] == ['같은이름.xlsx', '같은이름_2.xlsx']
+
+
+@pytest.mark.parametrize('engine', ['code', 'direct'])
+def test_sheets_batch_drops_failed_sheet_and_summarizes_the_rest(tmp_path, engine):
+    output_path = tmp_path / 'reports.xlsx'
+    result = generate_reports_batch(make_trips(), str(output_path), mode='sheets', engine=engine)
+
+    assert result['failed'] == 1
+    assert result['documents'][1]['error'].startswith('ValueError')
+    assert 'ValueError' in result['documents'][1]['traceback']
+
+    wb = openpyxl.load_workbook(output_path)
+    assert wb.sheetnames == [SUMMARY_SHEET_TITLE, '부산_20260302', '제주_20260302']
+    summary_values = [cell.value for row in wb[SUMMARY_SHEET_TITLE].iter_rows() for cell in row]
+    assert '부산_20260302' in summary_values
+    assert '잘못된 출장' not in summary_values
+
+
+def test_unknown_mode_is_rejected(tmp_path):
+    with pytest.raises(ValueError):
+        generate_reports_batch([make_report_trip()], str(tmp_path / 'out'), mode='folder')
+
+
+def test_applications_batch_captures_errors(tmp_path):
+    applications = [make_application_data(2), {'destination': '대전', 'travelers': 'x'}]
+    result = generate_applications_batch(applications, str(tmp_path / 'applications.zip'))
+
+    assert result['failed'] == 1
+    assert result['documents'][0]['error'] is None
+    assert result['documents'][1]['error'] is not None
+    assert result['documents'][0]['traceback'] is None
+    assert 'Traceback' in result['documents'][1]['traceback']
+
+
+def test_load_trips_from_json_and_csv(tmp_path):
+    json_path = tmp_path / 'trips.json'
+    json_path.write_text(json.dumps([make_report_trip()], ensure_ascii=False), encoding='utf-8')
+    assert load_trips(str(json_path))[0]['destination'] == '부산'
+
+    csv_path = tmp_path / 'trips.csv'
+    csv_path.write_text(
+        "trip_id,employee_name,position,destination,start_date,end_date,trip_days,"
+        "daily_allowance_per_day,meal_cost_per_day,daily_allowance_total,meal_cost_total\n"
+        "1,홍길동,연구원,부산,2026-03-02,2026-03-03,2,40000,15000,80000,30000\n"
+        "1,이영희,연구원,부산,2026-03-02,2026-03-03,2,40000,15000,80000,30000\n"
+        "2,박민수,연구원,제주,2026-03-05,2026-03-05,1,40000,15000,40000,15000\n",
+        encoding='utf-8-sig'
+    )
+    trips = load_trips(str(csv_path))
+    assert [len(trip['employees']) for trip in trips] == [2, 1]
+
+
+def test_main_returns_nonzero_when_a_document_fails(tmp_path, capsys):
+    input_path = tmp_path / 'trips.json'
+    input_path.write_text(json.dumps(make_trips(), ensure_ascii=False), encoding='utf-8')
+
+    exit_code = main([str(input_path), '-o', str(tmp_path / 'out.zip')])
+    assert exit_code != 0
+    out = capsys.readouterr().out
+    assert '생성 실패' in out
+    assert 'Traceback' not in out
+
+
+def test_main_prints_traceback_when_verbose(tmp_path, capsys):
+    input_path = tmp_path / 'trips.json'
+    input_path.write_text(json.dumps(make_trips(), ensure_ascii=False), encoding='utf-8')
+
+    assert main([str(input_path), '-o', str(tmp_path / 'out.zip'), '--verbose']) != 0
+    assert 'Traceback (most recent call last)' in capsys.readouterr().out
+
+
+@pytest.mark.parametrize('engine', ['template', 'direct'])
+def test_main_rejects_engine_with_pdf(tmp_path, capsys, engine):
+    input_path = tmp_path / 'applications.json'
+    input_path.write_text(json.dumps([make_application_data(2)], ensure_ascii=False), encoding='utf-8')
+
+    with pytest.raises(SystemExit) as excinfo:
+        main([str(input_path), '--type', 'application', '--engine', engine, '--format', 'pdf'])
+    assert excinfo.value.code == 2
+    assert 'xlsx 형식에서만' in capsys.readouterr().err
@@ -0,0 +1,66 @@
+import pytest
+
+import benchmark
+from benchmark import (
+    MAX_NOISE_ALLOWANCE,
+    build_result,
+    compare_with_baseline,
+    confirm_regressions,
+    get_noisy_results,
+)
+
+
+def make_result(name, p50, round_spread=0.0, peak_kb=100.0, output_bytes=1000):
+    return {
+        'name': name,
+        'latency_ms': {'p50': p50, 'min': p50, 'mad': 0.0, 'round_spread': round_spread},
+        'peak_memory_kb': peak_kb,
+        'output_bytes': output_bytes,
+    }
+
+
+def make_baseline(*results):
+    return {'results': {result['name']: result for result in results}}
+
+
+def latency_row(rows, name):
+    return next(row for row in rows if row[0] == name and row[1] == 'p50_ms')
+
+
+def test_round_spread_uses_median_deviation_of_round_medians():
+    rounds = [{'total': [value / 1000]} for value in (10, 11, 12, 30)]
+    result = build_result('case', rounds, 100, 1024)
+    # 라운드 중앙값 11.5, 편차 중앙값 1.0 (한 라운드만 튀어도 잡음이 커지지 않음)
+    assert result['latency_ms']['round_spread'] == pytest.approx(1.0 / 11.5, abs=1e-4)
+
+
+def test_noise_allowance_is_capped_and_ignores_current_run():
+    baseline = make_baseline(make_result('noisy', 10.0, round_spread=0.8), make_result('quiet', 10.0, 0.05))
+    results = [make_result('noisy', 14.0, round_spread=0.9), make_result('quiet', 13.0, round_spread=0.9)]
+
+    rows = compare_with_baseline(results, baseline, threshold=0.2)
+    assert latency_row(rows, 'noisy')[5] == pytest.approx(0.2 + MAX_NOISE_ALLOWANCE)
+    assert latency_row(rows, 'noisy')[6] is True
+    assert latency_row(rows, 'quiet')[5] == pytest.approx(0.25)
+    assert latency_row(rows, 'quiet')[6] is True
+
+
+def test_noisy_baseline_is_reported():
+    baseline = make_baseline(make_result('a', 10.0, round_spread=0.05), make_result('b', 10.0, round_spread=0.5))
+    assert get_noisy_results(baseline) == ['b']
+
+
+@pytest.mark.parametrize('reruns, regressed', [([10.0, 11.0], False), ([9.0, 30.0], True), ([10.0, 16.0], True),
+                                               ([30.0, 11.0], True)])
+def test_confirm_regressions_uses_the_median_run(monkeypatch, reruns, regressed):
+    # 최초 측정 15ms + 재측정 2회의 중앙값으로 판단 (가장 빠른 재측정이 아님)
+    baseline = make_baseline(make_result('case', 10.0))
+    pending = list(reruns)
+
+    def fake_run_suite(*args):
+        return [make_result('case', pending.pop(0))]
+
+    monkeypatch.setattr(benchmark, 'run_suite', fake_run_suite)
+    rows = confirm_regressions([make_result('case', 15.0)], baseline, 0.2, None, 1, True, 0, 1)
+    assert latency_row(rows, 'case')[6] is regressed
+    assert pending == []
@@ -0,0 +1,59 @@
+import json
+from datetime import datetime
+
+import pytest
+
+from conftest import make_application_data, make_report_trip
+from document_service import generate_document, main
+from render_cache import RenderCache
+
+
+def test_report_filename_and_cache_reuse():
+    cache = RenderCache()
+    filename, content = generate_document('report', make_report_trip('부산'), cache)
+
+    assert filename == '출장복명서_부산_20260302.xlsx'
+    assert content[:2] == b'PK'
+    assert generate_document('report', make_report_trip('부산'), cache)[1] is content
+    assert cache.get_stats()['hits'] == 1
+
+
+def test_application_filename_uses_destination_and_today():
+    filename, _ = generate_document('application', dict(make_application_data(), destination='부산 해운대'))
+    assert filename == f"출장신청서_부산_해운대_{datetime.now().strftime('%Y%m%d')}.xlsx"
+
+
+def test_output_formats_are_cached_separately():
+    pytest.importorskip('reportlab')
+    cache = RenderCache()
+    trip = make_report_trip('부산', filename='복명서.xlsx')
+
+    xlsx_name, xlsx = generate_document('report', trip, cache, 'xlsx')
+    pdf_name, pdf = generate_document('report', trip, cache, 'pdf')
+    assert (xlsx_name, pdf_name) == ('복명서.xlsx', '복명서.pdf')
+    assert xlsx[:2] == b'PK' and pdf.startswith(b'%PDF')
+    assert cache.get_stats()['entries'] == 2
+
+
+def test_unknown_type_or_format_is_rejected():
+    with pytest.raises(ValueError):
+        generate_document('invoice', {})
+    with pytest.raises(ValueError):
+        generate_document('application', make_application_data(), output_format='docx')
+
+
+def test_cli_writes_document(tmp_path):
+    input_path = tmp_path / 'application.json'
+    input_path.write_text(json.dumps(make_application_data(), ensure_ascii=False), encoding='utf-8')
+    output_path = tmp_path / 'out.xlsx'
+
+    assert main(['application', str(input_path), '-o', str(output_path)]) == 0
+    assert output_path.read_bytes()[:2] == b'PK'
+
+
+def test_cli_reports_invalid_input(tmp_path, capsys):
+    input_path = tmp_path / 'trip.json'
+    input_path.write_text('{"employees": []}', encoding='utf-8')
+
+    assert main(['report', str(input_path), '-o', str(tmp_path / 'out.xlsx')]) == 1
+    assert '생성 실패' in capsys.readouterr().err
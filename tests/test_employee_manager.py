@@ -0,0 +1,161 @@
+import os
+from datetime import date, time
+
+import pandas as pd
+import pytest
+
+import employee_manager
+from employee_manager import EmployeeManager
+
+RATE_CSV = "이름,직급,일비,식비\n홍길동,연구원,\"40,000\",\"15,000\"\n이영희,책임연구원,\"60,000\",\"25,000\"\n"
+
+
+@pytest.fixture
+def rate_file(tmp_path, monkeypatch):
+    monkeypatch.setattr(employee_manager, 'RATE_CACHE_DIR', str(tmp_path / 'cache'))
+    path = tmp_path / 'rates.csv'
+    path.write_bytes(RATE_CSV.encode('cp949'))
+    return path
+
+
+@pytest.fixture
+def parse_calls(monkeypatch):
+    calls = []
+    original = employee_manager.parse_rate_table
+
+    def counting_parse(content, encoding='cp949'):
+        calls.append(len(content))
+        return original(content, encoding)
+
+    monkeypatch.setattr(employee_manager, 'parse_rate_table', counting_parse)
+    return calls
+
+
+def touch(path, offset):
+    """수정시각을 바꿔 변경된 파일로 보이게 함"""
+    mtime = os.path.getmtime(path) + offset
+    os.utime(path, (mtime, mtime))
+
+
+def test_loads_rates_and_calculates_expenses(rate_file):
+    manager = EmployeeManager(str(rate_file), check_interval=0)
+
+    assert manager.get_employee_names() == ['홍길동', '이영희']
+    assert manager.get_employee_info('이영희') == {
+        'name': '이영희', 'position': '책임연구원', 'daily_allowance': 60000, 'meal_cost': 25000
+    }
+    expenses = manager.calculate_trip_expenses('홍길동', date(2026, 3, 2), time(9), date(2026, 3, 4), time(18))
+    assert (expenses['trip_days'], expenses['total_cost']) == (3, 3 * 55000)
+    assert manager.calculate_trip_expenses('없는사람', date(2026, 3, 2), time(9), date(2026, 3, 2), time(18)) is None
+
+
+def test_missing_file_uses_default_data(tmp_path):
+    manager = EmployeeManager(str(tmp_path / 'missing.csv'))
+    assert manager.get_employee_info('김철수')['daily_allowance'] == 50000
+
+
+def test_preprocessed_cache_skips_parsing_same_content(rate_file, parse_calls):
+    EmployeeManager(str(rate_file))
+    EmployeeManager(str(rate_file))
+    assert len(parse_calls) == 1
+
+
+def test_touched_file_with_same_content_is_not_reloaded(rate_file, parse_calls):
+    manager = EmployeeManager(str(rate_file), check_interval=0)
+    touch(rate_file, 10)
+    assert manager.reload_if_changed() is False
+    assert len(parse_calls) == 1
+
+
+def test_changed_file_is_reloaded(rate_file):
+    manager = EmployeeManager(str(rate_file), check_interval=0)
+    rate_file.write_bytes((RATE_CSV + "박민수,주임연구원,\"45,000\",\"18,000\"\n").encode('cp949'))
+    touch(rate_file, 10)
+
+    assert manager.reload_if_changed() is True
+    assert manager.get_employee_info('박민수')['meal_cost'] == 18000
+
+
+def test_broken_file_is_not_reparsed_until_it_changes(rate_file, parse_calls):
+    rate_file.write_bytes("이름,직급\n홍길동,연구원\n".encode('cp949'))
+    manager = EmployeeManager(str(rate_file), check_interval=0)
+
+    # 파싱 실패 시 기본 데이터 사용
+    assert manager.get_employee_info('김철수') is not None
+    assert len(parse_calls) == 1
+
+    for _ in range(3):
+        assert manager.reload_if_changed() is False
+    assert len(parse_calls) == 1
+
+    rate_file.write_bytes(RATE_CSV.encode('cp949'))
+    touch(rate_file, 10)
+    assert manager.reload_if_changed() is True
+    assert manager.get_employee_info('홍길동')['daily_allowance'] == 40000
+    assert manager.failed_signature is None
+
+
+def test_bulk_expenses_match_single_calculation(rate_file):
+    manager = EmployeeManager(str(rate_file), check_interval=0)
+    trips = pd.DataFrame({
+        'employee_name': ['홍길동', '이영희', '없는사람'],
+        'start_date': ['2026-03-02', '2026-03-02', '2026-03-02'],
+        'end_date': ['2026-03-04', '2026-03-01', '2026-03-02'],
+    })
+
+    result = manager.calculate_trip_expenses_bulk(trips)
+    assert result['trip_days'].tolist() == [3, 1, 1]
+    assert result['total_cost'].tolist() == [3 * 55000, 85000, 0]
+    assert result['found'].tolist() == [True, True, False]
+
+
+def test_restoring_original_content_after_a_broken_save_keeps_real_rates(rate_file, parse_calls):
+    manager = EmployeeManager(str(rate_file), check_interval=0)
+
+    rate_file.write_bytes("이름,직급\n홍길동,연구원\n".encode('cp949'))
+    touch(rate_file, 10)
+    # 잘못 저장된 파일은 무시하고 이전 출장비 표를 유지
+    assert manager.reload_if_changed() is False
+    assert manager.get_employee_names() == ['홍길동', '이영희']
+    assert len(parse_calls) == 2
+
+    rate_file.write_bytes(RATE_CSV.encode('cp949'))
+    touch(rate_file, 20)
+    assert manager.reload_if_changed() is False
+    assert manager.get_employee_info('홍길동')['daily_allowance'] == 40000
+    assert manager.failed_signature is None
+    assert len(parse_calls) == 2
+
+
+def test_broken_first_load_recovers_when_original_content_returns(rate_file):
+    original = rate_file.read_bytes()
+    rate_file.write_bytes("이름,직급\n홍길동,연구원\n".encode('cp949'))
+    manager = EmployeeManager(str(rate_file), check_interval=0)
+    assert manager.get_employee_info('김철수') is not None
+    assert manager.source_hash is None
+
+    rate_file.write_bytes(original)
+    touch(rate_file, 10)
+    assert manager.reload_if_changed() is True
+    assert manager.get_employee_names() == ['홍길동', '이영희']
+
+
+def test_missing_file_on_reload_keeps_previous_rates(rate_file):
+    manager = EmployeeManager(str(rate_file), check_interval=0)
+    rate_file.unlink()
+
+    assert manager.reload_if_changed() is False
+    assert manager.get_employee_info('이영희')['meal_cost'] == 25000
+
+
+def test_rate_cache_keeps_only_recent_files(rate_file, monkeypatch):
+    monkeypatch.setattr(employee_manager, 'RATE_CACHE_LIMIT', 2)
+    manager = EmployeeManager(str(rate_file), check_interval=0)
+    for i in range(4):
+        rate_file.write_bytes((RATE_CSV + f"직원{i},연구원,\"40,000\",\"15,000\"\n").encode('cp949'))
+        touch(rate_file, 10 * (i + 1))
+        assert manager.reload_if_changed() is True
+
+    cached = os.listdir(employee_manager.RATE_CACHE_DIR)
+    assert len(cached) == 2
+    assert os.path.basename(employee_manager.get_rate_cache_path(manager.source_hash)) in cached
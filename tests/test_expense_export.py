@@ -0,0 +1,75 @@
+from datetime import datetime
+
+import openpyxl
+
+from conftest import make_report_trip
+from expense_export import (
+    CONSOLIDATED_HEADERS,
+    export_consolidated_expenses,
+    iter_employee_records,
+    iter_employee_records_from_csv,
+    main,
+)
+
+
+def test_export_writes_one_row_per_employee_with_formulas(tmp_path):
+    trips = [make_report_trip('부산'), make_report_trip('제주', employee_names=['박민수'])]
+    output_path = tmp_path / 'expenses.xlsx'
+
+    result = export_consolidated_expenses(iter_employee_records(trips), str(output_path))
+    assert result['rows'] == 3
+    assert result['total_cost'] == 3 * (80000 + 30000)
+
+    ws = openpyxl.load_workbook(output_path).active
+    assert [cell.value for cell in ws[1]] == CONSOLIDATED_HEADERS
+    assert ws.freeze_panes == 'A2'
+    assert [ws.cell(row=row, column=4).value for row in (2, 3, 4)] == ['홍길동', '이영희', '박민수']
+    assert ws['A2'].value == datetime(2026, 3, 2)
+    assert ws['A2'].number_format == 'yyyy-mm-dd'
+    assert (ws['H2'].value, ws['K2'].value, ws['L2'].value) == ('=F2*G2', '=I2*J2', '=H2+K2')
+
+    assert ws['A5'].value == '합계'
+    assert (ws['H5'].value, ws['K5'].value, ws['L5'].value) == ('=SUM(H2:H4)', '=SUM(K2:K4)', '=SUM(L2:L4)')
+
+
+def test_export_without_records_writes_zero_totals(tmp_path):
+    output_path = tmp_path / 'empty.xlsx'
+    result = export_consolidated_expenses(iter([]), str(output_path))
+
+    assert (result['rows'], result['total_cost']) == (0, 0)
+    ws = openpyxl.load_workbook(output_path).active
+    assert ws['A2'].value == '합계'
+    assert ws['L2'].value == 0
+
+
+def test_csv_records_are_streamed_and_cost_rows_skipped(tmp_path):
+    csv_path = tmp_path / 'trips.csv'
+    csv_path.write_text(
+        "employee_name,position,project_name,destination,start_date,end_date,trip_days,"
+        "daily_allowance_per_day,meal_cost_per_day,daily_allowance_total,meal_cost_total,cost_item,cost_amount\n"
+        "홍길동,연구원,과제,부산,2026-03-02,2026-03-03,2,40000,15000,80000,30000,,\n"
+        ",,,,,,,,,,,숙박비,120000\n"
+        "이영희,연구원,과제,부산,2026-03-02,2026-03-02,1,40000,15000,40000,15000,,\n",
+        encoding='utf-8-sig'
+    )
+
+    records = iter_employee_records_from_csv(str(csv_path))
+    assert iter(records) is records
+    records = list(records)
+    assert [record['employee_name'] for record in records] == ['홍길동', '이영희']
+    assert records[1]['daily_allowance_total'] == 40000
+
+
+def test_main_reports_rows_and_total(tmp_path, capsys):
+    input_path = tmp_path / 'trips.json'
+    input_path.write_text(
+        '[{"destination": "부산", "start_date": "2026-03-02", "employees": [{"employee_name": "홍길동", '
+        '"position": "연구원", "trip_days": 1, "daily_allowance_per_day": 40000, "meal_cost_per_day": 15000, '
+        '"daily_allowance_total": 40000, "meal_cost_total": 15000}]}]',
+        encoding='utf-8'
+    )
+    output_path = tmp_path / 'out.xlsx'
+
+    assert main([str(input_path), '-o', str(output_path)]) == 0
+    assert '1행 기록, 합계 55,000원' in capsys.readouterr().out
+    assert output_path.exists()
@@ -0,0 +1,116 @@
+import contextvars
+import threading
+import time
+
+import pytest
+
+import instrumentation
+from instrumentation import percentile, request, stage
+
+
+@pytest.fixture(autouse=True)
+def isolated_instrumentation():
+    """테스트마다 전역 설정과 최근 요청 기록 초기화"""
+    settings = dict(instrumentation._settings)
+    instrumentation.configure(enabled=False, profile=set())
+    instrumentation.clear_recent_requests()
+    yield
+    instrumentation._settings.update(settings)
+    instrumentation.clear_recent_requests()
+
+
+def run_in_new_context(func, *args):
+    return contextvars.Context().run(func, *args)
+
+
+def test_percentile_nearest_rank():
+    values = list(range(1, 101))
+    assert percentile(values, 0.50) == 50
+    assert percentile(values, 0.95) == 95
+    assert percentile(values, 1.0) == 100
+    assert percentile([7], 0.99) == 7
+    assert percentile([], 0.5) == 0.0
+
+
+def test_disabled_records_nothing():
+    with request('render'), stage('fill'):
+        pass
+    assert instrumentation.get_recent_requests() == []
+
+
+def test_nested_stages_exclude_child_time():
+    instrumentation.configure(enabled=True)
+    with request('render', document='report'):
+        with stage('outer'):
+            time.sleep(0.02)
+            with stage('inner'):
+                time.sleep(0.05)
+
+    record, = instrumentation.get_recent_requests()
+    assert record['name'] == 'render'
+    assert record['document'] == 'report'
+    assert record['stages_ms']['inner'] >= 45
+    assert 15 <= record['stages_ms']['outer'] < record['stages_ms']['inner']
+    assert record['total_ms'] >= record['stages_ms']['inner'] + record['stages_ms']['outer']
+
+
+def test_request_records_error_and_reraises():
+    instrumentation.configure(enabled=True)
+    with pytest.raises(KeyError):
+        with request('render'):
+            raise KeyError('employee_name')
+    assert instrumentation.get_recent_requests()[0]['error'] == "KeyError: 'employee_name'"
+
+
+def test_stage_outside_request_is_recorded_as_request():
+    instrumentation.configure(enabled=True)
+    with stage('load_data'):
+        pass
+    record, = instrumentation.get_recent_requests()
+    assert record['name'] == 'load_data'
+    assert 'load_data' in record['stages_ms']
+
+
+def test_session_setting_is_scoped_to_its_context():
+    def enabled_session():
+        instrumentation.set_session_enabled(True)
+        with request('session_a'):
+            pass
+        return instrumentation.is_enabled()
+
+    def default_session():
+        with request('session_b'):
+            pass
+        return instrumentation.is_enabled()
+
+    assert run_in_new_context(enabled_session) is True
+    assert run_in_new_context(default_session) is False
+    assert [record['name'] for record in instrumentation.get_recent_requests()] == ['session_a']
+
+
+def test_session_setting_overrides_global_setting():
+    instrumentation.configure(enabled=True)
+
+    def disabled_session():
+        instrumentation.set_session_enabled(False)
+        with request('hidden'):
+            pass
+
+    run_in_new_context(disabled_session)
+    assert instrumentation.get_recent_requests() == []
+
+
+def test_session_setting_follows_copied_context_into_threads():
+    results = []
+
+    def worker():
+        results.append(instrumentation.is_enabled())
+
+    def session():
+        instrumentation.set_session_enabled(True)
+        thread = threading.Thread(target=contextvars.copy_context().run, args=(worker,))
+        thread.start()
+        thread.join()
+
+    run_in_new_context(session)
+    assert results == [True]
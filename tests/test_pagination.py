@@ -0,0 +1,97 @@
+import pytest
+
+import excel_generator
+from conftest import make_application_data
+from excel_generator import (
+    ADVANCED_REPORT_TITLE_ROWS,
+    APPLICATION_MARGIN_Y_INCH,
+    APPLICATION_MIN_TRAVELER_ROWS,
+    APPLICATION_TITLE_ROWS,
+    PAGE_HEADROOM_POINTS,
+    calculate_auto_dimensions,
+    column_width_points,
+    fit_scale_percent,
+    get_advanced_report_pagination,
+    get_advanced_report_row_heights,
+    get_application_footer_row,
+    get_application_pagination,
+    get_application_row_heights,
+    paginate_rows,
+    pixel_row_height,
+)
+
+
+def printed_page_heights(row_heights, breaks, last_row, title_rows, scale_percent):
+    """페이지별 실제 인쇄 높이 (pt, 픽셀 반올림 + 인쇄 제목 행 포함)"""
+    heights = {row: pixel_row_height(height) for row, height in row_heights}
+    title_height = sum(heights[row] for row in range(title_rows[0], title_rows[1] + 1)) if breaks else 0
+    pages = []
+    start = 1
+    for end in list(breaks) + [last_row]:
+        used = sum(heights[row] for row in range(start, end + 1)) + (title_height if start > 1 else 0)
+        pages.append(used * scale_percent / 100)
+        start = end + 1
+    return pages
+
+
+def test_fit_scale_percent_floors_like_excel():
+    assert fit_scale_percent(501.84, 549) == 91
+    assert fit_scale_percent(600, 500) == 100
+    assert fit_scale_percent(1, 1000) == 10
+
+
+def test_pixel_row_height_rounds_up_to_whole_pixels():
+    assert pixel_row_height(15) == 15
+    assert pixel_row_height(20) == 20.25
+    assert pixel_row_height(22) == 22.5
+
+
+def test_paginate_rows_keeps_blocks_together():
+    rows = [(row, 10) for row in range(1, 11)]
+    assert paginate_rows(rows, 35) == [3, 6, 9]
+    assert paginate_rows(rows, 35, title_height=10) == [3, 5, 7, 9]
+    assert paginate_rows(rows, 35, keep_together=((3, 4),)) == [2, 5, 8]
+
+
+@pytest.mark.parametrize('travelers', [1, 10, 25, 40, 60, 100, 300])
+def test_report_pages_leave_headroom(travelers):
+    dims = calculate_auto_dimensions(total_rows=50, total_cols=12, margin_inches=0.65)
+    data_end_row = 12 + travelers
+    pagination = get_advanced_report_pagination(
+        data_end_row, dims['row_height'], dims['col_width'], dims['usable_width_inch'], dims['usable_height_inch']
+    )
+    row_heights = get_advanced_report_row_heights(data_end_row, dims['row_height'])
+    scale = fit_scale_percent(dims['usable_width_inch'] * 72, column_width_points(dims['col_width']) * 12)
+
+    # 마지막 (첨부) 페이지를 제외한 표/추가수당 페이지
+    breaks = pagination['row_breaks'][:-1]
+    pages = printed_page_heights(row_heights, breaks, pagination['page_break_row'], ADVANCED_REPORT_TITLE_ROWS, scale)
+    assert len(pages) == pagination['pages'] - 1
+    assert max(pages) <= dims['usable_height_inch'] * 72 - PAGE_HEADROOM_POINTS
+
+
+@pytest.mark.parametrize('travelers', [9, 12, 20, 40, 100])
+def test_application_pages_leave_headroom(travelers):
+    pagination = get_application_pagination(travelers)
+    usable_height = (11.69 - APPLICATION_MARGIN_Y_INCH * 2) * 72
+    last_row = get_application_footer_row(travelers) + 2
+
+    pages = printed_page_heights(get_application_row_heights(travelers), pagination['row_breaks'], last_row,
+                                 APPLICATION_TITLE_ROWS, pagination['scale'])
+    assert len(pages) == pagination['pages']
+    assert max(pages) <= usable_height - PAGE_HEADROOM_POINTS
+
+
+def test_default_application_fits_one_page_at_the_multi_page_scale():
+    pagination = get_application_pagination(APPLICATION_MIN_TRAVELER_ROWS)
+    assert pagination['pages'] == 1
+    assert isinstance(pagination['scale'], int)
+
+
+@pytest.mark.parametrize('style_class', ['Font', 'Border', 'Side', 'Alignment'])
+def test_application_reuses_shared_style_objects(monkeypatch, style_class):
+    def fail(*args, **kwargs):
+        raise AssertionError(f"{style_class}를 문서마다 새로 생성함")
+
+    monkeypatch.setattr(excel_generator, style_class, fail)
+    assert excel_generator.create_business_trip_application_bytes(make_application_data(12))[:2] == b'PK'
@@ -0,0 +1,98 @@
+import re
+from datetime import date
+
+import pytest
+
+pytest.importorskip('reportlab')
+
+from conftest import make_application_data, make_employee
+from excel_generator import (
+    calculate_auto_dimensions,
+    fill_advanced_business_trip_report,
+    get_advanced_report_pagination,
+    get_application_pagination,
+)
+from pdf_export import (
+    FormulaEvaluator,
+    SheetLayout,
+    create_advanced_business_trip_report_pdf,
+    create_business_trip_application_pdf,
+    display_text,
+    evaluate_arithmetic,
+)
+from xlsx_writer import GridWorkbook
+
+
+def count_pages(content):
+    return len(re.findall(rb'/Type /Page\b(?!s)', content))
+
+
+def make_report_input(travelers):
+    employees_data = [make_employee(f"직원{i + 1:03d}", date(2026, 3, 2), date(2026, 3, 3)) for i in range(travelers)]
+    return employees_data, [{'item': '숙박비', 'payment_method': '법인카드', 'amount': 120000}]
+
+
+def get_report_pages(travelers):
+    dims = calculate_auto_dimensions(total_rows=50, total_cols=12, margin_inches=0.65)
+    return get_advanced_report_pagination(
+        12 + travelers, dims['row_height'], dims['col_width'], dims['usable_width_inch'], dims['usable_height_inch']
+    )['pages']
+
+
+def test_evaluate_arithmetic_only_allows_numbers_and_operators():
+    assert evaluate_arithmetic('(2+3)*4-10/5') == 18
+    assert evaluate_arithmetic('-3') == -3
+    with pytest.raises(ValueError):
+        evaluate_arithmetic('__import__("os")')
+
+
+def test_formula_evaluator_resolves_references_and_sums():
+    ws = GridWorkbook('수식').active
+    ws['F2'], ws['G2'], ws['H2'] = 2, 40000, '=F2*G2'
+    ws['F3'], ws['G3'], ws['H3'] = 1, 35000, '=F3*G3'
+    ws['H4'] = '=SUM(H2:H3)'
+    ws['H5'] = '=H4/0'
+    ws['H6'] = '=H6+1'
+    ws['H7'] = '=VLOOKUP(A1)'
+
+    evaluator = FormulaEvaluator(ws)
+    assert evaluator.cell_value(2, 8) == 80000
+    assert evaluator.cell_value(4, 8) == 115000
+    assert evaluator.cell_value(5, 8) == '#VALUE!'
+    assert evaluator.cell_value(6, 8) == 1  # 순환 참조는 0으로 계산
+    assert evaluator.cell_value(7, 8) == '#VALUE!'
+
+
+def test_display_text_matches_general_format():
+    assert display_text(None) == ''
+    assert display_text(True) == 'TRUE'
+    assert display_text(0.1 + 0.2) == '0.3'
+    assert display_text(80000) == '80000'
+
+
+@pytest.mark.parametrize('travelers', [1, 40])
+def test_report_pdf_follows_sheet_pagination(travelers):
+    employees_data, additional_costs = make_report_input(travelers)
+    content = create_advanced_business_trip_report_pdf(employees_data, additional_costs)
+
+    assert content.startswith(b'%PDF')
+    assert count_pages(content) == get_report_pages(travelers)
+
+
+def test_report_layout_repeats_title_rows_on_continuation_pages():
+    employees_data, additional_costs = make_report_input(40)
+    ws = GridWorkbook('출장복명서').active
+    fill_advanced_business_trip_report(ws, employees_data, additional_costs)
+
+    layout = SheetLayout(ws)
+    assert len(layout.pages) == get_report_pages(40)
+    assert layout.pages[0][0] == 1
+    for page in layout.pages[1:]:
+        assert page[:3] == [10, 11, 12]
+
+
+@pytest.mark.parametrize('travelers', [3, 30])
+def test_application_pdf_page_count(travelers):
+    content = create_business_trip_application_pdf(make_application_data(travelers))
+    expected = get_application_pagination(travelers)['pages'] if travelers > 8 else 1
+    assert count_pages(content) == expected
@@ -0,0 +1,114 @@
+import os
+from datetime import date
+
+from render_cache import RenderCache, make_render_key
+
+
+def test_make_render_key_depends_on_inputs_date_and_format():
+    key = make_render_key('report', [{'a': 1}], render_date=date(2026, 3, 2))
+    assert key.endswith('.xlsx')
+    assert key == make_render_key('report', [{'a': 1}], render_date=date(2026, 3, 2))
+    assert key != make_render_key('report', [{'a': 2}], render_date=date(2026, 3, 2))
+    assert key != make_render_key('report', [{'a': 1}], render_date=date(2026, 3, 3))
+    assert key != make_render_key('application', [{'a': 1}], render_date=date(2026, 3, 2))
+
+    pdf_key = make_render_key('report', [{'a': 1}], render_date=date(2026, 3, 2), output_format='pdf')
+    assert pdf_key.endswith('.pdf')
+    assert pdf_key[:-4] != key[:-5]
+
+
+def test_memory_lru_entry_limit():
+    cache = RenderCache(max_entries=2)
+    cache.put('a', b'1')
+    cache.put('b', b'2')
+    assert cache.get('a') == b'1'  # a가 최근 사용
+    cache.put('c', b'3')
+
+    assert cache.get('b') is None
+    assert cache.get('a') == b'1'
+    assert cache.get('c') == b'3'
+    stats = cache.get_stats()
+    assert stats['entries'] == 2
+    assert stats['evictions'] == 1
+
+
+def test_memory_lru_byte_limit():
+    cache = RenderCache(max_entries=10, max_bytes=10)
+    cache.put('a', b'x' * 4)
+    cache.put('b', b'x' * 4)
+    cache.put('c', b'x' * 4)
+    assert cache.get('a') is None
+    assert cache.get_stats()['bytes'] == 8
+
+    # 한도보다 큰 결과는 메모리에 넣지 않음
+    cache.put('big', b'x' * 11)
+    assert cache.get('big') is None
+    assert cache.get_stats()['bytes'] == 8
+
+
+def test_overwrite_does_not_double_count_bytes():
+    cache = RenderCache(max_bytes=100)
+    cache.put('a', b'x' * 30)
+    cache.put('a', b'x' * 50)
+    stats = cache.get_stats()
+    assert (stats['entries'], stats['bytes']) == (1, 50)
+
+
+def test_disk_tier_survives_restart(tmp_path):
+    cache_dir = str(tmp_path / 'renders')
+    RenderCache(cache_dir=cache_dir).put('k1.xlsx', b'content')
+
+    cache = RenderCache(cache_dir=cache_dir)
+    assert cache.get('k1.xlsx') == b'content'
+    stats = cache.get_stats()
+    assert stats['disk_hits'] == 1
+    assert stats['disk_entries'] == 1
+
+    # 디스크에서 읽은 결과는 메모리에도 올라감
+    assert cache.get('k1.xlsx') == b'content'
+    assert cache.get_stats()['hits'] == 1
+
+
+def test_disk_tier_entry_and_byte_limits(tmp_path):
+    cache_dir = str(tmp_path / 'renders')
+    cache = RenderCache(cache_dir=cache_dir, max_disk_entries=2, max_disk_bytes=10)
+    cache.put('a.xlsx', b'x' * 3)
+    cache.put('b.xlsx', b'x' * 3)
+    cache.put('c.xlsx', b'x' * 3)
+    assert sorted(os.listdir(cache_dir)) == ['b.xlsx', 'c.xlsx']
+
+    cache.put('d.pdf', b'x' * 8)
+    assert sorted(os.listdir(cache_dir)) == ['d.pdf']
+    stats = cache.get_stats()
+    assert (stats['disk_entries'], stats['disk_bytes'], stats['disk_evictions']) == (1, 8, 3)
+
+    # 디스크 한도보다 큰 결과는 파일로 쓰지 않음
+    cache.put('e.xlsx', b'x' * 11)
+    assert sorted(os.listdir(cache_dir)) == ['d.pdf']
+
+
+def test_disk_limits_applied_to_existing_files_on_start(tmp_path):
+    cache_dir = tmp_path / 'renders'
+    cache_dir.mkdir()
+    for i, name in enumerate(['old.xlsx', 'mid.xlsx', 'new.xlsx']):
+        path = cache_dir / name
+        path.write_bytes(b'x' * 4)
+        os.utime(path, (1000 + i, 1000 + i))
+    (cache_dir / '.tmp_partial.xlsx').write_bytes(b'x')
+
+    cache = RenderCache(cache_dir=str(cache_dir), max_disk_entries=2)
+    assert sorted(os.listdir(cache_dir)) == ['.tmp_partial.xlsx', 'mid.xlsx', 'new.xlsx']
+    assert cache.get_stats()['disk_bytes'] == 8
+
+
+def test_get_or_render_renders_once():
+    cache = RenderCache()
+    calls = []
+
+    def render(value):
+        calls.append(value)
+        return value.encode()
+
+    assert cache.get_or_render('k', render, 'doc') == b'doc'
+    assert cache.get_or_render('k', render, 'doc') == b'doc'
+    assert calls == ['doc']
@@ -0,0 +1,64 @@
+import asyncio
+import threading
+
+import pytest
+
+from conftest import make_application_data
+from render_jobs import RenderJobManager
+
+
+@pytest.fixture
+def manager():
+    manager = RenderJobManager(max_workers=1, max_retained_jobs=3)
+    yield manager
+    manager.shutdown(wait=True)
+
+
+def test_job_status_moves_from_queued_to_done(manager):
+    release = threading.Event()
+    running = manager.submit(release.wait, 5, description='blocker')
+    queued = manager.submit(lambda: b'result', description='queued')
+
+    assert queued.status == 'queued'
+    release.set()
+    assert queued.result(5) == b'result'
+    assert running.status == 'done'
+    assert queued.status == 'done'
+    assert queued.error is None
+    assert queued.elapsed >= 0
+
+
+def test_failed_job_reports_error(manager):
+    def fail():
+        raise ValueError("직원 정보를 찾을 수 없습니다")
+
+    job = manager.submit(fail)
+    with pytest.raises(ValueError):
+        job.result(5)
+    assert job.status == 'failed'
+    assert isinstance(job.error, ValueError)
+
+
+def test_discard_and_prune_release_finished_jobs(manager):
+    jobs = [manager.submit(lambda value=i: value) for i in range(3)]
+    for job in jobs:
+        job.result(5)
+
+    manager.discard(jobs[0].job_id)
+    assert manager.get(jobs[0].job_id) is None
+    assert manager.get(jobs[1].job_id) is jobs[1]
+
+    # 보관 한도(3)를 넘으면 완료된 작업부터 정리
+    more = [manager.submit(lambda value=i: value) for i in range(2)]
+    for job in more:
+        job.result(5)
+    manager.submit(lambda: None).result(5)
+    assert len(manager.jobs) <= 3
+    assert manager.get(jobs[1].job_id) is None
+
+
+def test_submit_application_renders_xlsx_and_can_be_awaited(manager):
+    job = manager.submit_application(make_application_data(2))
+    content = asyncio.run(manager.wait(job))
+    assert content[:2] == b'PK'
+    assert job.result() == content
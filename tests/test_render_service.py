@@ -0,0 +1,184 @@
+import http.client
+import io
+import json
+import threading
+import urllib.error
+import urllib.request
+
+import openpyxl
+import pytest
+
+import render_service
+from conftest import make_application_data, make_report_trip
+from render_service import CONTENT_TYPES, create_server
+
+
+@pytest.fixture
+def start_server():
+    servers = []
+
+    def start(**options):
+        server = create_server(port=0, use_cache=False, **options)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        servers.append(server)
+        return server, f"http://127.0.0.1:{server.server_address[1]}"
+
+    yield start
+
+    for server in servers:
+        server.shutdown()
+        server.server_close()
+        server.service.shutdown(wait=True)
+
+
+@pytest.fixture
+def blocked_render(monkeypatch):
+    """렌더링이 release.set() 전까지 끝나지 않도록 generate_document 교체"""
+    started = threading.Event()
+    release = threading.Event()
+
+    def generate_document(document_type, payload, cache=None, output_format='xlsx'):
+        started.set()
+        release.wait(10)
+        return 'blocked.xlsx', b'done'
+
+    monkeypatch.setattr(render_service, 'generate_document', generate_document)
+    yield started, release
+    release.set()
+
+
+def post(url, body):
+    data = body if isinstance(body, bytes) else json.dumps(body, ensure_ascii=False).encode('utf-8')
+    request = urllib.request.Request(url, data=data, method='POST', headers={'Content-Type': 'application/json'})
+    try:
+        with urllib.request.urlopen(request, timeout=30) as response:
+            return response.status, dict(response.headers), response.read()
+    except urllib.error.HTTPError as e:
+        return e.code, dict(e.headers), e.read()
+
+
+def get_json(url):
+    with urllib.request.urlopen(url, timeout=30) as response:
+        return json.loads(response.read())
+
+
+def test_render_application_returns_xlsx(start_server):
+    _, base_url = start_server()
+    status, headers, body = post(f"{base_url}/render/application", make_application_data())
+
+    assert status == 200
+    assert headers['Content-Type'] == CONTENT_TYPES['xlsx']
+    ws = openpyxl.load_workbook(io.BytesIO(body)).active
+    assert ws['A1'].value
+    assert get_json(f"{base_url}/metrics")['completed'] == 1
+
+
+def test_render_report_returns_xlsx(start_server):
+    _, base_url = start_server()
+    status, headers, body = post(f"{base_url}/render/report", make_report_trip())
+
+    assert status == 200
+    assert "filename*=UTF-8''" in headers['Content-Disposition']
+    assert body[:2] == b'PK'
+
+
+def test_render_pdf_by_query_or_body_field(start_server):
+    pytest.importorskip('reportlab')
+    _, base_url = start_server()
+
+    status, headers, body = post(f"{base_url}/render/report?format=pdf", make_report_trip())
+    assert (status, headers['Content-Type']) == (200, CONTENT_TYPES['pdf'])
+    assert body.startswith(b'%PDF')
+
+    status, headers, body = post(f"{base_url}/render/application", dict(make_application_data(), format='pdf'))
+    assert (status, headers['Content-Type']) == (200, CONTENT_TYPES['pdf'])
+    assert body.startswith(b'%PDF')
+
+
+@pytest.mark.parametrize('path, body', [
+    ('/render/report', b'{not json'),
+    ('/render/report', b'[1, 2]'),
+    ('/render/report', b'"text"'),
+    ('/render/report', {'employees': []}),
+    ('/render/report?format=docx', {'employees': []}),
+    ('/render/application?format=docx', {}),
+])
+def test_bad_requests_return_400(start_server, path, body):
+    _, base_url = start_server()
+    status, _, response = post(f"{base_url}{path}", body)
+
+    assert status == 400
+    assert 'error' in json.loads(response)
+
+
+def post_with_length(base_url, length, body=b'{}'):
+    """Content-Length 헤더를 직접 지정하여 요청"""
+    host, port = base_url[len('http://'):].split(':')
+    connection = http.client.HTTPConnection(host, int(port), timeout=30)
+    try:
+        connection.putrequest('POST', '/render/application')
+        connection.putheader('Content-Type', 'application/json')
+        connection.putheader('Content-Length', length)
+        connection.endheaders(body)
+        response = connection.getresponse()
+        return response.status, json.loads(response.read())
+    finally:
+        connection.close()
+
+
+@pytest.mark.parametrize('length', ['abc', '-1', '1.5'])
+def test_invalid_content_length_returns_400(start_server, length):
+    _, base_url = start_server()
+    status, response = post_with_length(base_url, length)
+
+    assert status == 400
+    assert 'Content-Length' in response['error']
+
+
+def test_oversized_body_returns_413(start_server, monkeypatch):
+    monkeypatch.setattr(render_service, 'MAX_REQUEST_BYTES', 16)
+    _, base_url = start_server()
+    body = json.dumps(make_application_data(), ensure_ascii=False).encode('utf-8')
+
+    status, response = post_with_length(base_url, str(len(body)), body)
+    assert status == 413
+    assert 'error' in response
+
+
+def test_unknown_path_returns_404(start_server):
+    _, base_url = start_server()
+    assert post(f"{base_url}/render/invoice", {})[0] == 404
+
+
+def test_full_queue_returns_429(start_server, blocked_render):
+    started, release = blocked_render
+    server, base_url = start_server(workers=1, queue_size=0)
+    future = server.service.submit('report', {})
+    assert started.wait(5)
+
+    status, headers, _ = post(f"{base_url}/render/report", make_report_trip())
+    assert status == 429
+    assert headers['Retry-After'] == '1'
+
+    release.set()
+    assert future.result(5) == ('blocked.xlsx', b'done')
+    metrics = get_json(f"{base_url}/metrics")
+    assert (metrics['accepted'], metrics['rejected']) == (1, 1)
+
+
+def test_timeout_returns_504_and_is_not_a_failure(start_server, blocked_render):
+    _, release = blocked_render
+    server, base_url = start_server(workers=1, queue_size=1, request_timeout=0.2)
+
+    status, _, body = post(f"{base_url}/render/report", make_report_trip())
+    assert status == 504
+    assert 'error' in json.loads(body)
+
+    release.set()
+    server.service.shutdown(wait=True)
+    metrics = server.service.get_metrics()
+    assert metrics['timed_out'] == 1
+    assert metrics['failed'] == 0
+    assert metrics['completed'] == 1
+    assert metrics['in_flight'] == 0
@@ -0,0 +1,106 @@
+import json
+import os
+import stat
+
+import pytest
+
+from storage_backend import (
+    FileLock,
+    JsonFileStorage,
+    SQLiteStorage,
+    StorageLockTimeout,
+    atomic_write_json,
+    create_storage,
+)
+
+
+@pytest.fixture(params=['json', 'sqlite'])
+def storage(request, tmp_path):
+    return create_storage(str(tmp_path / 'business_trip_data.json'), backend=request.param)
+
+
+def test_add_and_remove_values(storage):
+    storage.save({'destinations': ['부산'], 'purposes': []})
+
+    assert storage.add_value('destinations', '제주') is True
+    assert storage.add_value('destinations', '제주') is False
+    assert storage.add_value('purposes', '현장 조사') is True
+    assert storage.load()['destinations'] == ['부산', '제주']
+
+    assert storage.remove_value('destinations', '부산') is True
+    assert storage.remove_value('destinations', '부산') is False
+    assert storage.load()['destinations'] == ['제주']
+    assert storage.load()['purposes'] == ['현장 조사']
+
+
+def test_load_returns_a_copy_of_the_snapshot(storage):
+    storage.save({'destinations': ['부산']})
+    storage.load()['destinations'].append('변경')
+    assert storage.load() == {'destinations': ['부산']}
+
+
+def test_signature_changes_on_write(storage):
+    storage.save({'destinations': []})
+    before = storage.get_signature()
+    storage.add_value('destinations', '부산')
+    assert storage.get_signature() != before
+
+
+def test_json_storage_sees_changes_from_another_instance(tmp_path):
+    path = str(tmp_path / 'data.json')
+    first, second = JsonFileStorage(path), JsonFileStorage(path)
+    first.save({'destinations': ['부산']})
+    assert second.load() == {'destinations': ['부산']}
+
+    second.add_value('destinations', '제주')
+    assert first.load() == {'destinations': ['부산', '제주']}
+
+
+def test_sqlite_storage_imports_existing_json(tmp_path):
+    json_path = tmp_path / 'business_trip_data.json'
+    json_path.write_text(json.dumps({'destinations': ['부산', '제주']}, ensure_ascii=False), encoding='utf-8')
+
+    storage = create_storage(str(json_path), backend='sqlite')
+    assert isinstance(storage, SQLiteStorage)
+    assert storage.load() == {'destinations': ['부산', '제주']}
+    assert os.path.exists(tmp_path / 'business_trip_data.db')
+
+
+def test_unknown_backend_is_rejected(tmp_path):
+    with pytest.raises(ValueError):
+        create_storage(str(tmp_path / 'data.json'), backend='redis')
+
+
+@pytest.mark.skipif(os.name == 'nt', reason="POSIX 권한 비트")
+def test_atomic_write_keeps_existing_file_mode(tmp_path):
+    path = tmp_path / 'data.json'
+    path.write_text('{}', encoding='utf-8')
+    os.chmod(path, 0o640)
+
+    atomic_write_json(str(path), {'destinations': ['부산']})
+    assert stat.S_IMODE(os.stat(path).st_mode) == 0o640
+    assert json.loads(path.read_text(encoding='utf-8')) == {'destinations': ['부산']}
+    assert os.listdir(tmp_path) == ['data.json']
+
+
+@pytest.mark.skipif(os.name == 'nt', reason="POSIX 권한 비트")
+def test_atomic_write_new_file_uses_current_umask(tmp_path):
+    path = tmp_path / 'new.json'
+    previous = os.umask(0o027)
+    try:
+        atomic_write_json(str(path), {})
+    finally:
+        os.umask(previous)
+
+    # mkstemp 기본값 0600이 아니라 쓰는 시점의 umask를 적용한 일반 파일 권한
+    assert stat.S_IMODE(os.stat(path).st_mode) == 0o640
+
+
+def test_file_lock_times_out_while_held(tmp_path):
+    path = str(tmp_path / 'data.json')
+    with FileLock(path):
+        with pytest.raises(StorageLockTimeout):
+            with FileLock(path, timeout=0.1):
+                pass
+    with FileLock(path, timeout=0.1):
+        pass
@@ -0,0 +1,128 @@
+import io
+import os
+from datetime import date
+
+import openpyxl
+import pytest
+
+import template_engine
+from conftest import assert_same_workbook, make_application_data, make_employee
+from excel_generator import TEMPLATE_VERSION, create_business_trip_application_bytes
+from template_engine import (
+    APPLICATION_TEMPLATE_FILE,
+    export_application_template,
+    load_template,
+    render_application_from_template,
+    render_report_from_template,
+    resolve_field,
+)
+
+
+@pytest.fixture(autouse=True)
+def fresh_template_cache():
+    template_engine.clear_template_cache()
+    yield
+    template_engine.clear_template_cache()
+
+
+def test_resolve_field_paths():
+    context = {'project_name': '과제', 'travelers': [{'name': '홍길동'}], 'count': 0}
+    assert resolve_field(context, 'project_name') == '과제'
+    assert resolve_field(context, 'travelers.0.name') == '홍길동'
+    assert resolve_field(context, 'travelers.1.name') == ''
+    assert resolve_field(context, 'travelers.x') == ''
+    assert resolve_field(context, 'missing.field') == ''
+    assert resolve_field(context, 'count') == 0
+
+
+@pytest.mark.parametrize('travelers', [1, 3, 8])
+def test_application_template_matches_code_layout(tmp_path, travelers):
+    template_path = str(tmp_path / '출장신청서_template.xlsx')
+    application_data = make_application_data(travelers)
+
+    expected = create_business_trip_application_bytes(application_data)
+    actual = render_application_from_template(application_data, template_path)
+    assert os.path.exists(template_path)
+    assert_same_workbook(io.BytesIO(expected), io.BytesIO(actual))
+
+
+def test_more_travelers_than_template_rows_uses_code_layout(tmp_path):
+    template_path = str(tmp_path / 'template.xlsx')
+    application_data = make_application_data(12)
+
+    content = render_application_from_template(application_data, template_path)
+    assert not os.path.exists(template_path)
+    names = [cell.value for cell in openpyxl.load_workbook(io.BytesIO(content)).active['D']]
+    assert '직원12' in names
+
+
+def test_render_does_not_modify_cached_template(tmp_path):
+    template_path = str(tmp_path / 'template.xlsx')
+    export_application_template(template_path)
+    template = load_template(template_path)
+    ws = template.workbook.active
+    before = {coordinate: ws[coordinate].value for _, coordinate, _, _ in template.placeholders}
+
+    content = render_application_from_template(make_application_data(2), template_path)
+    assert load_template(template_path) is template
+    assert {coordinate: ws[coordinate].value for coordinate in before} == before
+
+    rendered = openpyxl.load_workbook(io.BytesIO(content)).active
+    assert not any('{{' in str(rendered[coordinate].value) for coordinate in before)
+
+
+def test_edited_template_is_reloaded(tmp_path):
+    template_path = str(tmp_path / 'template.xlsx')
+    wb = openpyxl.Workbook()
+    wb.active['A1'] = '{{project_name}} 출장'
+    wb.save(template_path)
+    first = load_template(template_path)
+
+    wb.active['A1'] = '과제: {{project_name}}'
+    wb.save(template_path)
+    os.utime(template_path, (os.path.getmtime(template_path) + 10,) * 2)
+
+    assert load_template(template_path) is not first
+    content = render_application_from_template({'project_name': '해양 조사'}, template_path)
+    assert openpyxl.load_workbook(io.BytesIO(content)).active['A1'].value == '과제: 해양 조사'
+
+
+def test_report_template_keeps_value_types(tmp_path):
+    template_path = str(tmp_path / 'report_template.xlsx')
+    wb = openpyxl.Workbook()
+    ws = wb.active
+    ws['A1'] = '{{destination}}'
+    ws['A2'] = '{{employees.0.employee_name}} 외'
+    ws['A3'] = '{{employees.0.daily_allowance_total}}'
+    ws['A4'] = '{{total_cost}}'
+    ws['A5'] = '{{employees.5.employee_name}}'
+    wb.save(template_path)
+
+    employees_data = [make_employee('홍길동', date(2026, 3, 2), date(2026, 3, 3))]
+    additional_costs = [{'item': '숙박비', 'payment_method': '법인카드', 'amount': 50000}]
+    ws = openpyxl.load_workbook(io.BytesIO(
+        render_report_from_template(employees_data, additional_costs, template_path)
+    )).active
+
+    assert ws['A1'].value == '부산'
+    assert ws['A2'].value == '홍길동 외'
+    assert ws['A3'].value == 80000
+    assert ws['A4'].value == 80000 + 30000 + 50000
+    assert ws['A5'].value is None
+
+
+def test_default_template_is_exported_per_layout_version_under_cache(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    application_data = make_application_data(2)
+
+    assert render_application_from_template(application_data)[:2] == b'PK'
+    assert APPLICATION_TEMPLATE_FILE.startswith('.cache')
+    assert f"v{TEMPLATE_VERSION}" in os.path.basename(APPLICATION_TEMPLATE_FILE)
+    assert (tmp_path / APPLICATION_TEMPLATE_FILE).exists()
+    assert not (tmp_path / 'templates').exists()
+
+    # 이전 레이아웃 버전의 템플릿 파일은 읽지 않음 (읽으면 로드 오류)
+    stale_path = tmp_path / '.cache' / 'templates' / '출장신청서_template_v0.xlsx'
+    stale_path.write_bytes(b'stale')
+    template_engine.clear_template_cache()
+    assert render_application_from_template(application_data)[:2] == b'PK'
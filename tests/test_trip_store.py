@@ -0,0 +1,138 @@
+import sqlite3
+from datetime import date
+
+import pytest
+
+from conftest import make_employee
+from trip_store import TripStore, get_employee_month_shares, get_month_days, split_amount
+
+
+@pytest.fixture
+def store(tmp_path):
+    return TripStore(str(tmp_path / 'trips.db'))
+
+
+def snapshot_aggregates(store):
+    conn = store.connect()
+    return (
+        conn.execute("SELECT * FROM project_totals ORDER BY project_name").fetchall(),
+        conn.execute("SELECT * FROM employee_month_totals ORDER BY employee_name, month").fetchall(),
+    )
+
+
+def test_get_month_days_splits_across_months():
+    assert get_month_days(date(2026, 1, 30), date(2026, 3, 1)) == [('2026-01', 2), ('2026-02', 28), ('2026-03', 1)]
+    assert get_month_days('2026-05-10', '2026-05-10') == [('2026-05', 1)]
+
+
+def test_split_amount_keeps_total_and_gives_remainder_to_later_shares():
+    assert split_amount(100, [1, 1, 1]) == [33, 33, 34]
+    assert sum(split_amount(35001, [2, 3])) == 35001
+    assert split_amount(0, [1, 4]) == [0, 0]
+
+
+def test_employee_month_shares_split_by_travel_day(sample_trip):
+    employees_data, additional_costs = sample_trip
+    shares = get_employee_month_shares(employees_data, 155001)
+
+    # 홍길동: 3/30~4/2 (3월 2일, 4월 2일), 추가 비용은 2명이 나누고 나머지 1원은 뒤 순번
+    assert shares == [
+        ('홍길동', '2026-03', 80000, 30000, 38750),
+        ('홍길동', '2026-04', 80000, 30000, 38750),
+        ('이영희', '2026-03', 80000, 30000, 77501),
+    ]
+
+
+def test_save_trip_updates_aggregates(store, sample_trip):
+    employees_data, additional_costs = sample_trip
+    store.save_trip(employees_data, additional_costs)
+
+    project = store.get_project_total('해양 조사 연구과제')
+    assert project['trip_count'] == 1
+    assert project['employee_total'] == 160000 + 60000 + 80000 + 30000
+    assert project['additional_total'] == 155001
+    assert project['total_cost'] == project['employee_total'] + 155001
+
+    march = store.get_employee_month_total('홍길동', '2026-03')
+    april = store.get_employee_month_total('홍길동', date(2026, 4, 15))
+    assert (march['trip_count'], april['trip_count']) == (1, 1)
+    assert march['daily_allowance_total'] + april['daily_allowance_total'] == 160000
+    assert march['additional_total'] + april['additional_total'] == 77500
+    assert store.get_employee_month_total('이영희', '2026-03')['total_cost'] == 80000 + 30000 + 77501
+    assert store.get_employee_month_total('이영희', '2026-04')['trip_count'] == 0
+
+
+def test_delete_trip_subtracts_aggregates(store, sample_trip):
+    employees_data, additional_costs = sample_trip
+    first_id = store.save_trip(employees_data, additional_costs)
+    before = snapshot_aggregates(store)
+
+    second_id = store.save_trip(employees_data, additional_costs)
+    assert store.get_project_total('해양 조사 연구과제')['trip_count'] == 2
+    assert store.get_employee_month_total('홍길동', '2026-04')['trip_count'] == 2
+
+    assert store.delete_trip(second_id) is True
+    assert snapshot_aggregates(store) == before
+
+    assert store.delete_trip(first_id) is True
+    assert store.get_project_total('해양 조사 연구과제')['trip_count'] == 0
+    assert store.get_employee_month_total('홍길동', '2026-03')['total_cost'] == 0
+    assert store.get_project_totals() == []
+    assert store.delete_trip(first_id) is False
+
+
+def test_rebuild_aggregates_matches_incremental_totals(store, sample_trip):
+    employees_data, additional_costs = sample_trip
+    store.save_trip(employees_data, additional_costs)
+    deleted_id = store.save_trip([make_employee('박민수', date(2026, 4, 28), date(2026, 5, 3))], [])
+    store.save_trip(
+        [make_employee('홍길동', date(2026, 4, 1), date(2026, 4, 1), project_name='연안 관측 과제')],
+        [{'item': '주차비', 'payment_method': '현금', 'amount': 7000}]
+    )
+    store.delete_trip(deleted_id)
+    incremental = snapshot_aggregates(store)
+
+    store.rebuild_aggregates()
+    assert snapshot_aggregates(store) == incremental
+    assert [row['project_name'] for row in store.get_project_totals()] == ['해양 조사 연구과제', '연안 관측 과제']
+
+
+def test_load_trip_round_trip(store, sample_trip):
+    employees_data, additional_costs = sample_trip
+    trip_id = store.save_trip(employees_data, additional_costs)
+
+    loaded_employees, loaded_costs = store.load_trip(trip_id)
+    assert loaded_employees == employees_data
+    assert loaded_costs == additional_costs
+    assert store.load_trip(trip_id + 1) is None
+
+
+def test_save_trip_without_employees_is_rejected(store):
+    with pytest.raises(ValueError):
+        store.save_trip([], [])
+
+
+def test_old_schema_is_migrated_and_rebuilt(tmp_path, sample_trip):
+    path = str(tmp_path / 'old.db')
+    employees_data, additional_costs = sample_trip
+    TripStore(path).save_trip(employees_data, additional_costs)
+
+    # 추가비용 열이 없던 이전 스키마로 되돌림
+    conn = sqlite3.connect(path)
+    conn.executescript("""
+        DROP TABLE employee_month_totals;
+        CREATE TABLE employee_month_totals (
+            employee_name TEXT NOT NULL,
+            month TEXT NOT NULL,
+            trip_count INTEGER NOT NULL DEFAULT 0,
+            daily_allowance_total INTEGER NOT NULL DEFAULT 0,
+            meal_cost_total INTEGER NOT NULL DEFAULT 0,
+            PRIMARY KEY (employee_name, month)
+        );
+        PRAGMA user_version = 0;
+    """)
+    conn.close()
+
+    store = TripStore(path)
+    assert store.get_employee_month_total('이영희', '2026-03')['additional_total'] == 77501
+    assert store.connect().execute("PRAGMA user_version").fetchone()[0] >= 2
@@ -0,0 +1,53 @@
+import io
+from datetime import date
+
+import pytest
+
+from batch_generator import write_reports_workbook
+from conftest import assert_same_workbook, make_application_data, make_employee, make_report_trip
+from excel_generator import create_advanced_business_trip_report_bytes, create_business_trip_application_bytes
+from xlsx_writer import create_advanced_business_trip_report_direct, create_business_trip_application_direct
+
+
+def make_report_input(travelers, cost_items, special=False):
+    employees_data = [
+        make_employee(f"직원{i + 1:03d}", date(2026, 3, 2 + i % 5), date(2026, 3, 3 + i % 5),
+                      special_work=special, special_days=1 if special else 0)
+        for i in range(travelers)
+    ]
+    additional_costs = [
+        {'item': f"비용{i + 1}", 'payment_method': '법인카드', 'amount': 10000 + i * 1000}
+        for i in range(cost_items)
+    ]
+    return employees_data, additional_costs
+
+
+@pytest.mark.parametrize('travelers, cost_items, special', [
+    (1, 0, False),
+    (3, 2, True),
+    (40, 12, False),  # 지급신청 표가 여러 페이지에 걸침 (인쇄 제목 행 반복)
+])
+def test_report_direct_matches_openpyxl(travelers, cost_items, special):
+    employees_data, additional_costs = make_report_input(travelers, cost_items, special)
+    expected = create_advanced_business_trip_report_bytes(employees_data, additional_costs)
+    actual = create_advanced_business_trip_report_direct(employees_data, additional_costs)
+    assert_same_workbook(io.BytesIO(expected), io.BytesIO(actual))
+
+
+@pytest.mark.parametrize('travelers', [1, 8, 30])
+def test_application_direct_matches_openpyxl(travelers):
+    application_data = make_application_data(travelers)
+    expected = create_business_trip_application_bytes(application_data)
+    actual = create_business_trip_application_direct(application_data)
+    assert_same_workbook(io.BytesIO(expected), io.BytesIO(actual))
+
+
+def test_multi_sheet_workbook_direct_matches_openpyxl(tmp_path):
+    jobs = [
+        {'type': 'report', 'trip': make_report_trip('부산'), 'index': 0},
+        {'type': 'report', 'trip': make_report_trip('부산'), 'index': 1},  # 같은 시트 이름
+        {'type': 'report', 'trip': make_report_trip('제주', employee_names=[f"직원{i}" for i in range(30)]), 'index': 2},
+    ]
+    write_reports_workbook(jobs, str(tmp_path / 'code.xlsx'), engine='code')
+    write_reports_workbook(jobs, str(tmp_path / 'direct.xlsx'), engine='direct')
+    assert_same_workbook(str(tmp_path / 'code.xlsx'), str(tmp_path / 'direct.xlsx'))
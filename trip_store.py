@@ -0,0 +1,535 @@
+import threading
+from datetime import date, datetime, time, timedelta
+
+from storage_backend import connect_sqlite
+
+# 출장 기록 데이터베이스 파일 경로
+TRIP_DB_FILE = "trip_records.db"
+
+# 출장 단위로 저장하는 공통 정보 (첫 번째 출장자 기준, 복명서 헤더와 동일)
+TRIP_FIELDS = ['project_manager', 'project_name', 'destination', 'trip_purpose']
+
+# 출장자별로 저장하는 필드 (main.py의 employees_list 항목 형식)
+EMPLOYEE_TEXT_FIELDS = [
+    'employee_name', 'position', 'project_manager', 'project_name', 'destination', 'trip_purpose'
+]
+EMPLOYEE_INT_FIELDS = [
+    'trip_days', 'daily_allowance_per_day', 'meal_cost_per_day',
+    'daily_allowance_total', 'meal_cost_total',
+    'holiday_days', 'special_days', 'dangerous_days'
+]
+EMPLOYEE_BOOL_FIELDS = ['holiday_work', 'special_work', 'dangerous_work']
+
+# 집계 방식 버전 (PRAGMA user_version, 바뀌면 기존 데이터베이스의 집계를 한 번 재계산)
+AGGREGATE_VERSION = 2
+
+SCHEMA = """
+    CREATE TABLE IF NOT EXISTS trips (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        project_manager TEXT,
+        project_name TEXT,
+        destination TEXT,
+        trip_purpose TEXT,
+        start_date TEXT NOT NULL,
+        end_date TEXT NOT NULL,
+        employee_total INTEGER NOT NULL DEFAULT 0,
+        additional_total INTEGER NOT NULL DEFAULT 0,
+        created_at TEXT NOT NULL
+    );
+    CREATE TABLE IF NOT EXISTS trip_employees (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        trip_id INTEGER NOT NULL REFERENCES trips(id) ON DELETE CASCADE,
+        seq INTEGER NOT NULL,
+        employee_name TEXT NOT NULL,
+        position TEXT,
+        project_manager TEXT,
+        project_name TEXT,
+        destination TEXT,
+        trip_purpose TEXT,
+        start_date TEXT NOT NULL,
+        start_time TEXT NOT NULL,
+        end_date TEXT NOT NULL,
+        end_time TEXT NOT NULL,
+        trip_days INTEGER NOT NULL,
+        daily_allowance_per_day INTEGER NOT NULL,
+        meal_cost_per_day INTEGER NOT NULL,
+        daily_allowance_total INTEGER NOT NULL,
+        meal_cost_total INTEGER NOT NULL,
+        holiday_work INTEGER NOT NULL DEFAULT 0,
+        holiday_days INTEGER NOT NULL DEFAULT 0,
+        special_work INTEGER NOT NULL DEFAULT 0,
+        special_days INTEGER NOT NULL DEFAULT 0,
+        dangerous_work INTEGER NOT NULL DEFAULT 0,
+        dangerous_days INTEGER NOT NULL DEFAULT 0
+    );
+    CREATE TABLE IF NOT EXISTS trip_costs (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        trip_id INTEGER NOT NULL REFERENCES trips(id) ON DELETE CASCADE,
+        seq INTEGER NOT NULL,
+        item TEXT NOT NULL,
+        payment_method TEXT,
+        amount INTEGER NOT NULL
+    );
+    CREATE TABLE IF NOT EXISTS project_totals (
+        project_name TEXT PRIMARY KEY,
+        trip_count INTEGER NOT NULL DEFAULT 0,
+        employee_total INTEGER NOT NULL DEFAULT 0,
+        additional_total INTEGER NOT NULL DEFAULT 0
+    );
+    CREATE TABLE IF NOT EXISTS employee_month_totals (
+        employee_name TEXT NOT NULL,
+        month TEXT NOT NULL,
+        trip_count INTEGER NOT NULL DEFAULT 0,
+        daily_allowance_total INTEGER NOT NULL DEFAULT 0,
+        meal_cost_total INTEGER NOT NULL DEFAULT 0,
+        additional_total INTEGER NOT NULL DEFAULT 0,
+        PRIMARY KEY (employee_name, month)
+    );
+    CREATE INDEX IF NOT EXISTS idx_trips_project_name ON trips(project_name);
+    CREATE INDEX IF NOT EXISTS idx_trips_destination ON trips(destination);
+    CREATE INDEX IF NOT EXISTS idx_trips_dates ON trips(start_date, end_date);
+    CREATE INDEX IF NOT EXISTS idx_trip_employees_name ON trip_employees(employee_name, trip_id);
+    CREATE INDEX IF NOT EXISTS idx_trip_employees_trip ON trip_employees(trip_id, seq);
+    CREATE INDEX IF NOT EXISTS idx_trip_costs_trip ON trip_costs(trip_id, seq);
+"""
+
+def to_iso(value):
+    """date/time 객체를 ISO 문자열로 변환 (문자열은 그대로)"""
+    return value.isoformat() if hasattr(value, 'isoformat') else str(value)
+
+def to_date(value):
+    """date 객체 또는 ISO 날짜 문자열을 date로 변환"""
+    return date.fromisoformat(to_iso(value)[:10])
+
+def get_month_days(start_date, end_date):
+    """
+    출장 기간의 월별 일수
+
+    Returns:
+        list: [('YYYY-MM', 일수), ...] (기간 순서)
+    """
+    start_date, end_date = to_date(start_date), max(to_date(start_date), to_date(end_date))
+    month_days = []
+    current = start_date
+    while current <= end_date:
+        next_month = (current.replace(day=28) + timedelta(days=4)).replace(day=1)
+        last_day = min(end_date, next_month - timedelta(days=1))
+        month_days.append((current.isoformat()[:7], (last_day - current).days + 1))
+        current = next_month
+    return month_days
+
+def split_amount(amount, weights):
+    """
+    금액을 가중치 비율로 나눔
+
+    누적 비율로 원 단위 내림하여 나누므로 나눈 금액의 합이 항상 원래 금액과 같다.
+    """
+    total_weight = sum(weights)
+    shares = []
+    allocated = 0
+    cumulative = 0
+    for weight in weights:
+        cumulative += weight
+        allocated_until = amount * cumulative // total_weight
+        shares.append(allocated_until - allocated)
+        allocated = allocated_until
+    return shares
+
+def get_employee_month_shares(employees_data, additional_total):
+    """
+    출장 1건의 직원-월별 사용액
+
+    일비/식비는 출장자별 출장 기간의 월별 일수 비율로 나누고, 추가 비용은 출장자 수로
+    균등하게 나눈 뒤(원 단위 나머지는 뒤 순번 출장자에게) 같은 방식으로 월별로 나눈다.
+
+    Returns:
+        list: (employee_name, month, daily_allowance, meal_cost, additional) 튜플 리스트
+    """
+    additional_shares = split_amount(int(additional_total), [1] * len(employees_data))
+    shares = []
+    for emp, additional_share in zip(employees_data, additional_shares):
+        month_days = get_month_days(emp['start_date'], emp['end_date'])
+        days = [day_count for _, day_count in month_days]
+        for (month, _), daily_allowance, meal_cost, additional in zip(
+            month_days,
+            split_amount(int(emp['daily_allowance_total']), days),
+            split_amount(int(emp['meal_cost_total']), days),
+            split_amount(additional_share, days)
+        ):
+            shares.append((emp['employee_name'], month, daily_allowance, meal_cost, additional))
+    return shares
+
+class TripStore:
+    """
+    출장복명서 입력 데이터(출장자, 추가 비용)를 영구 저장하는 SQLite 저장소
+
+    저장한 출장은 main.py 세션과 같은 형식으로 다시 불러와 복명서를 재생성할 수 있다.
+    """
+
+    def __init__(self, path=TRIP_DB_FILE):
+        self.path = path
+        self.local = threading.local()
+        conn = self.connect()
+        conn.executescript(SCHEMA)
+
+        # 집계 테이블이 없거나 이전 방식으로 집계된 데이터베이스는 한 번 재계산
+        if conn.execute("PRAGMA user_version").fetchone()[0] < AGGREGATE_VERSION:
+            columns = {row[1] for row in conn.execute("PRAGMA table_info(employee_month_totals)")}
+            if 'additional_total' not in columns:
+                conn.execute(
+                    "ALTER TABLE employee_month_totals ADD COLUMN additional_total INTEGER NOT NULL DEFAULT 0"
+                )
+            self.rebuild_aggregates()
+            conn.execute(f"PRAGMA user_version = {AGGREGATE_VERSION}")
+
+    def connect(self):
+        """스레드별 연결 반환"""
+        conn = getattr(self.local, 'conn', None)
+        if conn is None:
+            conn = connect_sqlite(self.path)
+            conn.execute("PRAGMA foreign_keys=ON")
+            self.local.conn = conn
+        return conn
+
+    def save_trip(self, employees_data, additional_costs):
+        """
+        출장 1건 저장
+
+        Args:
+            employees_data: 직원별 출장 데이터 리스트 (create_advanced_business_trip_report 입력 형식)
+            additional_costs: 추가 비용 데이터 리스트
+
+        Returns:
+            int: 저장된 출장 ID
+        """
+        if not employees_data:
+            raise ValueError("저장할 출장자가 없습니다.")
+
+        first_emp = employees_data[0]
+        employee_total = sum(emp['daily_allowance_total'] + emp['meal_cost_total'] for emp in employees_data)
+        additional_total = sum(cost['amount'] for cost in additional_costs)
+
+        conn = self.connect()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            cursor = conn.execute(
+                """INSERT INTO trips (project_manager, project_name, destination, trip_purpose,
+                                      start_date, end_date, employee_total, additional_total, created_at)
+                   VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+                [first_emp.get(field, '') for field in TRIP_FIELDS] + [
+                    to_iso(min(emp['start_date'] for emp in employees_data)),
+                    to_iso(max(emp['end_date'] for emp in employees_data)),
+                    int(employee_total),
+                    int(additional_total),
+                    datetime.now().isoformat(timespec='seconds')
+                ]
+            )
+            trip_id = cursor.lastrowid
+            self._insert_children(conn, trip_id, employees_data, additional_costs)
+            self._apply_aggregates(conn, first_emp.get('project_name', ''), employees_data,
+                                   employee_total, additional_total, sign=1)
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+
+        return trip_id
+
+    def _insert_children(self, conn, trip_id, employees_data, additional_costs):
+        """출장자/추가 비용 행 저장"""
+        columns = (EMPLOYEE_TEXT_FIELDS + ['start_date', 'start_time', 'end_date', 'end_time']
+                   + EMPLOYEE_INT_FIELDS + EMPLOYEE_BOOL_FIELDS)
+        placeholders = ', '.join('?' * (len(columns) + 2))
+
+        conn.executemany(
+            f"INSERT INTO trip_employees (trip_id, seq, {', '.join(columns)}) VALUES ({placeholders})",
+            [
+                [trip_id, seq]
+                + [emp.get(field, '') for field in EMPLOYEE_TEXT_FIELDS]
+                + [to_iso(emp['start_date']), to_iso(emp['start_time']), to_iso(emp['end_date']), to_iso(emp['end_time'])]
+                + [int(emp.get(field, 0) or 0) for field in EMPLOYEE_INT_FIELDS]
+                + [1 if emp.get(field) else 0 for field in EMPLOYEE_BOOL_FIELDS]
+                for seq, emp in enumerate(employees_data)
+            ]
+        )
+        conn.executemany(
+            "INSERT INTO trip_costs (trip_id, seq, item, payment_method, amount) VALUES (?, ?, ?, ?, ?)",
+            [
+                (trip_id, seq, cost['item'], cost.get('payment_method', ''), int(cost['amount']))
+                for seq, cost in enumerate(additional_costs)
+            ]
+        )
+
+    def _apply_aggregates(self, conn, project_name, employees_data, employee_total, additional_total, sign):
+        """
+        과제별/직원-월별 누적 합계에 출장 1건을 더하거나(sign=1) 뺌(sign=-1)
+
+        출장 저장/삭제와 같은 트랜잭션에서 호출되어 집계가 항상 출장 기록과 일치한다.
+        직원-월별 합계는 get_employee_month_shares 기준 (월을 넘는 출장은 일수 비율로 나눔).
+        """
+        conn.execute(
+            """INSERT INTO project_totals (project_name, trip_count, employee_total, additional_total)
+               VALUES (?, ?, ?, ?)
+               ON CONFLICT(project_name) DO UPDATE SET
+                   trip_count = trip_count + excluded.trip_count,
+                   employee_total = employee_total + excluded.employee_total,
+                   additional_total = additional_total + excluded.additional_total""",
+            (project_name, sign, sign * int(employee_total), sign * int(additional_total))
+        )
+        self._add_employee_month_totals(conn, [
+            (employee_name, month, sign, sign * daily_allowance, sign * meal_cost, sign * additional)
+            for employee_name, month, daily_allowance, meal_cost, additional
+            in get_employee_month_shares(employees_data, additional_total)
+        ])
+
+        # 마지막 출장이 빠진 행은 지워서 rebuild_aggregates 결과와 같게 유지
+        if sign < 0:
+            conn.execute("DELETE FROM project_totals WHERE trip_count <= 0")
+            conn.execute("DELETE FROM employee_month_totals WHERE trip_count <= 0")
+
+    def _add_employee_month_totals(self, conn, rows):
+        """직원-월별 합계에 (employee_name, month, trip_count, 일비, 식비, 추가비용) 행 누적"""
+        conn.executemany(
+            """INSERT INTO employee_month_totals
+                   (employee_name, month, trip_count, daily_allowance_total, meal_cost_total, additional_total)
+               VALUES (?, ?, ?, ?, ?, ?)
+               ON CONFLICT(employee_name, month) DO UPDATE SET
+                   trip_count = trip_count + excluded.trip_count,
+                   daily_allowance_total = daily_allowance_total + excluded.daily_allowance_total,
+                   meal_cost_total = meal_cost_total + excluded.meal_cost_total,
+                   additional_total = additional_total + excluded.additional_total""",
+            rows
+        )
+
+    def rebuild_aggregates(self):
+        """저장된 출장 기록 전체로 누적 합계 테이블 재계산"""
+        conn = self.connect()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            conn.execute("DELETE FROM project_totals")
+            conn.execute("DELETE FROM employee_month_totals")
+            conn.execute(
+                """INSERT INTO project_totals (project_name, trip_count, employee_total, additional_total)
+                   SELECT project_name, COUNT(*), SUM(employee_total), SUM(additional_total)
+                   FROM trips GROUP BY project_name"""
+            )
+
+            # 직원-월별 합계는 저장/삭제와 같은 분배 규칙(get_employee_month_shares)으로 계산
+            trips = {}
+            for trip_id, additional_total, employee_name, start_date, end_date, daily_allowance_total, meal_cost_total in conn.execute(
+                """SELECT t.id, t.additional_total, e.employee_name, e.start_date, e.end_date,
+                          e.daily_allowance_total, e.meal_cost_total
+                   FROM trips t JOIN trip_employees e ON e.trip_id = t.id
+                   ORDER BY t.id, e.seq"""
+            ):
+                trip = trips.setdefault(trip_id, (additional_total, []))
+                trip[1].append({
+                    'employee_name': employee_name,
+                    'start_date': start_date,
+                    'end_date': end_date,
+                    'daily_allowance_total': daily_allowance_total,
+                    'meal_cost_total': meal_cost_total
+                })
+            self._add_employee_month_totals(conn, [
+                (employee_name, month, 1, daily_allowance, meal_cost, additional)
+                for additional_total, employees_data in trips.values()
+                for employee_name, month, daily_allowance, meal_cost, additional
+                in get_employee_month_shares(employees_data, additional_total)
+            ])
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+
+    def get_project_total(self, project_name):
+        """
+        연구과제별 누적 사용액 조회 (기본키 조회, 출장 수와 무관하게 일정 시간)
+
+        Returns:
+            dict: trip_count, employee_total (일비+식비), additional_total, total_cost
+        """
+        row = self.connect().execute(
+            "SELECT trip_count, employee_total, additional_total FROM project_totals WHERE project_name = ?",
+            (project_name,)
+        ).fetchone()
+        trip_count, employee_total, additional_total = row if row else (0, 0, 0)
+        return {
+            'project_name': project_name,
+            'trip_count': trip_count,
+            'employee_total': employee_total,
+            'additional_total': additional_total,
+            'total_cost': employee_total + additional_total
+        }
+
+    def get_employee_month_total(self, employee_name, month):
+        """
+        직원의 월별 누적 사용액 조회 (일비+식비+추가비용 분담액)
+
+        월을 넘는 출장은 일수 비율로 각 월에 나누어 집계되고, trip_count는 그 달에 걸친 출장 수이다.
+
+        Args:
+            month: 'YYYY-MM' 문자열 또는 date 객체
+        """
+        month = to_iso(month)[:7]
+        row = self.connect().execute(
+            """SELECT trip_count, daily_allowance_total, meal_cost_total, additional_total
+               FROM employee_month_totals WHERE employee_name = ? AND month = ?""",
+            (employee_name, month)
+        ).fetchone()
+        trip_count, daily_allowance_total, meal_cost_total, additional_total = row if row else (0, 0, 0, 0)
+        return {
+            'employee_name': employee_name,
+            'month': month,
+            'trip_count': trip_count,
+            'daily_allowance_total': daily_allowance_total,
+            'meal_cost_total': meal_cost_total,
+            'additional_total': additional_total,
+            'total_cost': daily_allowance_total + meal_cost_total + additional_total
+        }
+
+    def get_project_totals(self):
+        """전체 연구과제별 누적 사용액 목록 (사용액 큰 순)"""
+        cursor = self.connect().execute(
+            """SELECT project_name, trip_count, employee_total, additional_total
+               FROM project_totals WHERE trip_count > 0
+               ORDER BY employee_total + additional_total DESC"""
+        )
+        return [
+            {
+                'project_name': project_name,
+                'trip_count': trip_count,
+                'employee_total': employee_total,
+                'additional_total': additional_total,
+                'total_cost': employee_total + additional_total
+            }
+            for project_name, trip_count, employee_total, additional_total in cursor
+        ]
+
+    def load_trip(self, trip_id):
+        """
+        저장된 출장을 main.py 세션 형식으로 불러오기
+
+        Returns:
+            tuple: (employees_data, additional_costs), 없으면 None
+        """
+        conn = self.connect()
+        if conn.execute("SELECT 1 FROM trips WHERE id = ?", (trip_id,)).fetchone() is None:
+            return None
+
+        cursor = conn.execute("SELECT * FROM trip_employees WHERE trip_id = ? ORDER BY seq", (trip_id,))
+        names = [column[0] for column in cursor.description]
+        employees_data = []
+        for row in cursor:
+            record = dict(zip(names, row))
+            emp = {field: record[field] for field in EMPLOYEE_TEXT_FIELDS}
+            emp['start_date'] = date.fromisoformat(record['start_date'])
+            emp['start_time'] = time.fromisoformat(record['start_time'])
+            emp['end_date'] = date.fromisoformat(record['end_date'])
+            emp['end_time'] = time.fromisoformat(record['end_time'])
+            for field in EMPLOYEE_INT_FIELDS:
+                emp[field] = record[field]
+            for field in EMPLOYEE_BOOL_FIELDS:
+                emp[field] = bool(record[field])
+            employees_data.append(emp)
+
+        additional_costs = [
+            {'item': item, 'payment_method': payment_method, 'amount': amount}
+            for item, payment_method, amount in conn.execute(
+                "SELECT item, payment_method, amount FROM trip_costs WHERE trip_id = ? ORDER BY seq", (trip_id,)
+            )
+        ]
+
+        return employees_data, additional_costs
+
+    def find_trips(self, employee_name=None, project_name=None, destination=None,
+                   start_date=None, end_date=None, limit=100):
+        """
+        조건에 맞는 출장 목록 조회 (최근 출장부터)
+
+        start_date/end_date는 해당 기간과 겹치는 출장을 찾는다.
+
+        Returns:
+            list: 출장 요약 딕셔너리 리스트
+        """
+        conditions = []
+        params = []
+
+        if employee_name:
+            conditions.append("id IN (SELECT trip_id FROM trip_employees WHERE employee_name = ?)")
+            params.append(employee_name)
+        if project_name:
+            conditions.append("project_name = ?")
+            params.append(project_name)
+        if destination:
+            conditions.append("destination = ?")
+            params.append(destination)
+        if start_date:
+            conditions.append("end_date >= ?")
+            params.append(to_iso(start_date))
+        if end_date:
+            conditions.append("start_date <= ?")
+            params.append(to_iso(end_date))
+
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+        cursor = self.connect().execute(
+            f"""SELECT id, project_manager, project_name, destination, trip_purpose,
+                       start_date, end_date, employee_total, additional_total, created_at,
+                       (SELECT group_concat(employee_name, ', ') FROM trip_employees e WHERE e.trip_id = trips.id)
+                FROM trips {where}
+                ORDER BY start_date DESC, id DESC
+                LIMIT ?""",
+            params + [limit]
+        )
+
+        trips = []
+        for row in cursor:
+            trips.append({
+                'id': row[0],
+                'project_manager': row[1],
+                'project_name': row[2],
+                'destination': row[3],
+                'trip_purpose': row[4],
+                'start_date': row[5],
+                'end_date': row[6],
+                'employee_total': row[7],
+                'additional_total': row[8],
+                'total_cost': row[7] + row[8],
+                'created_at': row[9],
+                'employees': row[10] or ''
+            })
+        return trips
+
+    def delete_trip(self, trip_id):
+        """출장 기록 삭제 (출장자/추가 비용 포함, 누적 합계에서도 차감)"""
+        saved_trip = self.load_trip(trip_id)
+        if saved_trip is None:
+            return False
+        employees_data, _ = saved_trip
+
+        conn = self.connect()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            row = conn.execute(
+                "SELECT project_name, employee_total, additional_total FROM trips WHERE id = ?", (trip_id,)
+            ).fetchone()
+            if row is None:
+                conn.execute("ROLLBACK")
+                return False
+            project_name, employee_total, additional_total = row
+            conn.execute("DELETE FROM trips WHERE id = ?", (trip_id,))
+            self._apply_aggregates(conn, project_name, employees_data, employee_total, additional_total, sign=-1)
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        return True
+
+# 전역 인스턴스 (처음 사용할 때 생성)
+_trip_store = None
+
+def get_trip_store():
+    """기본 경로의 TripStore 반환"""
+    global _trip_store
+    if _trip_store is None:
+        _trip_store = TripStore()
+    return _trip_store
@@ -0,0 +1,489 @@
+import io
+import zipfile
+from datetime import datetime, timezone
+from functools import lru_cache
+from xml.sax.saxutils import escape, quoteattr
+
+from openpyxl.utils import get_column_letter, quote_sheetname, absolute_coordinate
+from openpyxl.utils.cell import coordinate_from_string, column_index_from_string, range_boundaries
+from openpyxl.utils.indexed_list import IndexedList
+from openpyxl.worksheet.page import PageMargins, PrintOptions, PrintPageSetup
+from openpyxl.worksheet.pagebreak import RowBreak
+from openpyxl.worksheet.properties import PageSetupProperties, WorksheetProperties
+from openpyxl.worksheet.views import SheetViewList
+from openpyxl.writer.theme import theme_xml
+from openpyxl.xml.functions import tostring
+
+from excel_generator import fill_advanced_business_trip_report, fill_business_trip_application
+from instrumentation import stage
+
+SHEET_MAIN_NS = "http://schemas.openxmlformats.org/spreadsheetml/2006/main"
+REL_NS = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+
+# 패키지 고정 파트 ({sheets}에 시트별 항목을 넣음)
+CONTENT_TYPES_XML = (
+    '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+    '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+    '<Default Extension="xml" ContentType="application/xml"/>'
+    '<Override PartName="/xl/workbook.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+    '{sheets}'
+    '<Override PartName="/xl/styles.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.styles+xml"/>'
+    '<Override PartName="/xl/theme/theme1.xml" ContentType="application/vnd.openxmlformats-officedocument.theme+xml"/>'
+    '<Override PartName="/docProps/core.xml" ContentType="application/vnd.openxmlformats-package.core-properties+xml"/>'
+    '<Override PartName="/docProps/app.xml" ContentType="application/vnd.openxmlformats-officedocument.extended-properties+xml"/>'
+    '</Types>'
+)
+
+ROOT_RELS_XML = (
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" Target="xl/workbook.xml"/>'
+    '<Relationship Id="rId2" Type="http://schemas.openxmlformats.org/package/2006/relationships/metadata/core-properties" Target="docProps/core.xml"/>'
+    '<Relationship Id="rId3" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/extended-properties" Target="docProps/app.xml"/>'
+    '</Relationships>'
+)
+
+SHEET_CONTENT_TYPE_XML = (
+    '<Override PartName="/xl/worksheets/sheet{number}.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
+)
+
+# 시트 관계는 rId1..rIdN, 스타일/테마는 그 뒤 번호
+WORKBOOK_RELS_XML = (
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '{sheets}'
+    '<Relationship Id="rId{styles_id}" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/styles" Target="styles.xml"/>'
+    '<Relationship Id="rId{theme_id}" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/theme" Target="theme/theme1.xml"/>'
+    '</Relationships>'
+)
+
+SHEET_RELATIONSHIP_XML = (
+    '<Relationship Id="rId{number}" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/worksheet" '
+    'Target="/xl/worksheets/sheet{number}.xml"/>'
+)
+
+APP_XML = (
+    '<Properties xmlns="http://schemas.openxmlformats.org/officeDocument/2006/extended-properties">'
+    '<Application>Microsoft Excel</Application></Properties>'
+)
+
+CORE_XML_TEMPLATE = (
+    '<cp:coreProperties xmlns:cp="http://schemas.openxmlformats.org/package/2006/metadata/core-properties" '
+    'xmlns:dc="http://purl.org/dc/elements/1.1/" xmlns:dcterms="http://purl.org/dc/terms/" '
+    'xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance">'
+    '<dc:creator>openpyxl</dc:creator>'
+    '<dcterms:created xsi:type="dcterms:W3CDTF">{now}</dcterms:created>'
+    '<dcterms:modified xsi:type="dcterms:W3CDTF">{now}</dcterms:modified>'
+    '</cp:coreProperties>'
+)
+
+# openpyxl 기본 워크북과 같은 기본 글꼴/채우기/테두리 (스타일 번호 0)
+DEFAULT_FONT_XML = '<font><name val="Calibri"/><family val="2"/><color theme="1"/><sz val="11"/><scheme val="minor"/></font>'
+DEFAULT_FILLS_XML = '<fills count="2"><fill><patternFill/></fill><fill><patternFill patternType="gray125"/></fill></fills>'
+DEFAULT_BORDER_XML = '<border><left/><right/><top/><bottom/><diagonal/></border>'
+
+class GridCell:
+    """값과 글꼴/테두리/정렬 객체 참조만 가진 가벼운 셀 (openpyxl Cell 대체)"""
+
+    __slots__ = ('parent', 'row', 'column', 'value', 'font', 'border', 'alignment', 'styled')
+
+    def __init__(self, parent, row, column):
+        self.parent = parent
+        self.row = row
+        self.column = column
+        self.value = None
+        self.font = None
+        self.border = None
+        self.alignment = None
+        self.styled = False
+
+    def __setattr__(self, name, value):
+        object.__setattr__(self, name, value)
+        # border=None도 openpyxl에서는 스타일 지정으로 취급됨
+        if name == 'border' or (name in ('font', 'alignment') and value is not None):
+            object.__setattr__(self, 'styled', True)
+
+    @property
+    def coordinate(self):
+        return f"{get_column_letter(self.column)}{self.row}"
+
+    @property
+    def _style(self):
+        raise AttributeError("GridCell은 StyleArray를 보관하지 않습니다.")
+
+    @_style.setter
+    def _style(self, style_array):
+        """register_cell_styles로 등록한 StyleArray를 글꼴/테두리/정렬 객체로 변환"""
+        workbook = self.parent.parent
+        self.font = workbook._fonts[style_array.fontId]
+        self.border = workbook._borders[style_array.borderId]
+        self.alignment = workbook._alignments[style_array.alignmentId]
+
+class GridDimension:
+    __slots__ = ('height', 'width')
+
+    def __init__(self):
+        self.height = None
+        self.width = None
+
+class GridDimensionHolder(dict):
+    def __missing__(self, key):
+        dimension = self[key] = GridDimension()
+        return dimension
+
+class GridWorkbook:
+    """
+    GridWorksheet 목록과 register_cell_styles용 스타일 테이블을 가진 워크북
+
+    여러 시트를 만들어도 스타일은 워크북 전체에서 한 번만 등록되고 write_xlsx로 한 번에 저장된다.
+    """
+
+    def __init__(self, title=None):
+        self._fonts = IndexedList()
+        self._borders = IndexedList()
+        self._alignments = IndexedList()
+        self.worksheets = []
+        if title is not None:
+            self.create_sheet(title)
+
+    @property
+    def active(self):
+        return self.worksheets[0]
+
+    def create_sheet(self, title, index=None):
+        ws = GridWorksheet(self, title)
+        if index is None:
+            self.worksheets.append(ws)
+        else:
+            self.worksheets.insert(index, ws)
+        return ws
+
+    def remove(self, ws):
+        self.worksheets.remove(ws)
+
+class GridWorksheet:
+    """
+    excel_generator의 fill_*/apply_*_styles/setup_* 함수가 사용하는 Worksheet API 부분집합
+
+    셀마다 openpyxl 객체를 만들거나 스타일을 중복 제거하지 않고 참조만 기록하며,
+    write_xlsx에서 SpreadsheetML로 직접 직렬화한다.
+    """
+
+    ORIENTATION_PORTRAIT = 'portrait'
+    ORIENTATION_LANDSCAPE = 'landscape'
+    PAPERSIZE_A4 = '9'
+
+    def __init__(self, parent, title):
+        self.parent = parent
+        self.title = title
+        self._cells = {}
+        self.merged_ranges = []
+        self.merged_cells = set()
+        self.row_dimensions = GridDimensionHolder()
+        self.column_dimensions = GridDimensionHolder()
+        self.sheet_properties = WorksheetProperties(pageSetUpPr=PageSetupProperties())
+        self.page_setup = PrintPageSetup(worksheet=self)
+        self.page_margins = PageMargins()
+        self.print_options = PrintOptions()
+        self.views = SheetViewList()
+        self.row_breaks = RowBreak()
+        self.print_area = None
+        self.print_title_rows = None
+
+    @property
+    def sheet_view(self):
+        return self.views.sheetView[0]
+
+    def cell(self, row, column, value=None):
+        cell = self._cells.get((row, column))
+        if cell is None:
+            cell = self._cells[(row, column)] = GridCell(self, row, column)
+        if value is not None:
+            if (row, column) in self.merged_cells:
+                raise AttributeError(f"병합된 셀에는 값을 입력할 수 없습니다: {cell.coordinate}")
+            cell.value = value
+        return cell
+
+    def __getitem__(self, coordinate):
+        column_letter, row = coordinate_from_string(coordinate)
+        return self.cell(row, column_index_from_string(column_letter))
+
+    def __setitem__(self, coordinate, value):
+        self[coordinate].value = value
+
+    def merge_cells(self, range_string=None, start_row=None, start_column=None, end_row=None, end_column=None):
+        if range_string is not None:
+            start_column, start_row, end_column, end_row = range_boundaries(range_string)
+        self.merged_ranges.append((start_row, start_column, end_row, end_column))
+
+        # openpyxl과 같이 병합 범위의 첫 셀 외 값은 지움
+        for row in range(start_row, end_row + 1):
+            for col in range(start_column, end_column + 1):
+                if (row, col) == (start_row, start_column):
+                    continue
+                self.merged_cells.add((row, col))
+                cell = self._cells.get((row, col))
+                if cell is not None:
+                    cell.value = None
+
+def format_number(value):
+    """openpyxl safe_string과 같은 숫자 표기"""
+    if isinstance(value, float):
+        return "%.16g" % value
+    return str(value)
+
+def cell_xml(cell, style_id):
+    """셀 하나의 <c> 요소"""
+    coordinate = f"{get_column_letter(cell.column)}{cell.row}"
+    style = f' s="{style_id}"' if style_id else ''
+    value = cell.value
+
+    if value is None:
+        return f'<c r="{coordinate}"{style} t="n"/>'
+    if isinstance(value, str):
+        if value.startswith('=') and len(value) > 1:
+            return f'<c r="{coordinate}"{style}><f>{escape(value[1:])}</f><v/></c>'
+        if value == '':
+            return f'<c r="{coordinate}"{style} t="inlineStr"/>'
+        space = ' xml:space="preserve"' if value.strip() != value else ''
+        return f'<c r="{coordinate}"{style} t="inlineStr"><is><t{space}>{escape(value)}</t></is></c>'
+    if isinstance(value, bool):
+        return f'<c r="{coordinate}"{style} t="b"><v>{int(value)}</v></c>'
+    if isinstance(value, (int, float)):
+        return f'<c r="{coordinate}"{style} t="n"><v>{format_number(value)}</v></c>'
+    return f'<c r="{coordinate}"{style} t="inlineStr"><is><t>{escape(str(value))}</t></is></c>'
+
+@lru_cache(maxsize=256)
+def style_element_xml(style_object):
+    """글꼴/테두리/정렬 객체의 XML 조각 (같은 값이면 캐시 재사용)"""
+    if style_object is None:
+        return None
+    return tostring(style_object.to_tree()).decode('utf-8')
+
+class StyleRegistry:
+    """셀 스타일 조합(글꼴, 테두리, 정렬)을 cellXfs 번호로 등록"""
+
+    def __init__(self):
+        self.fonts = [DEFAULT_FONT_XML]
+        self.borders = [DEFAULT_BORDER_XML]
+        self.font_ids = {}
+        self.border_ids = {}
+        self.xfs = []
+        self.xf_ids = {}
+        self.object_xf_ids = {}
+
+    def _font_id(self, font):
+        if font is None:
+            return 0
+        xml = style_element_xml(font)
+        if xml not in self.font_ids:
+            self.font_ids[xml] = len(self.fonts)
+            self.fonts.append(xml)
+        return self.font_ids[xml]
+
+    def _border_id(self, border, styled):
+        if border is None:
+            # openpyxl은 border=None 지정 셀에 빈 <border/>를 등록함
+            xml = '<border/>' if styled else DEFAULT_BORDER_XML
+        else:
+            xml = style_element_xml(border)
+        if xml == DEFAULT_BORDER_XML:
+            return 0
+        if xml not in self.border_ids:
+            self.border_ids[xml] = len(self.borders)
+            self.borders.append(xml)
+        return self.border_ids[xml]
+
+    def get_xf_id(self, cell):
+        """셀의 cellXfs 번호 (스타일이 없으면 0)"""
+        if not cell.styled:
+            return 0
+
+        # 같은 객체 조합은 해시 계산 없이 바로 찾음
+        object_key = (id(cell.font), id(cell.border), id(cell.alignment))
+        xf_id = self.object_xf_ids.get(object_key)
+        if xf_id is not None:
+            return xf_id
+
+        alignment_xml = style_element_xml(cell.alignment)
+        key = (self._font_id(cell.font), self._border_id(cell.border, True), alignment_xml)
+        if key not in self.xf_ids:
+            self.xf_ids[key] = len(self.xfs) + 1
+            self.xfs.append(key)
+        xf_id = self.xf_ids[key]
+        self.object_xf_ids[object_key] = xf_id
+        return xf_id
+
+    def to_xml(self):
+        xfs = ['<xf numFmtId="0" fontId="0" fillId="0" borderId="0" xfId="0"/>']
+        for font_id, border_id, alignment_xml in self.xfs:
+            if alignment_xml:
+                xfs.append(f'<xf numFmtId="0" fontId="{font_id}" fillId="0" borderId="{border_id}" '
+                           f'applyAlignment="1" xfId="0">{alignment_xml}</xf>')
+            else:
+                xfs.append(f'<xf numFmtId="0" fontId="{font_id}" fillId="0" borderId="{border_id}" xfId="0"/>')
+
+        return (
+            f'<styleSheet xmlns="{SHEET_MAIN_NS}">'
+            f'<fonts count="{len(self.fonts)}">{"".join(self.fonts)}</fonts>'
+            f'{DEFAULT_FILLS_XML}'
+            f'<borders count="{len(self.borders)}">{"".join(self.borders)}</borders>'
+            '<cellStyleXfs count="1"><xf numFmtId="0" fontId="0" fillId="0" borderId="0"/></cellStyleXfs>'
+            f'<cellXfs count="{len(xfs)}">{"".join(xfs)}</cellXfs>'
+            '<cellStyles count="1"><cellStyle name="Normal" xfId="0" builtinId="0"/></cellStyles>'
+            '</styleSheet>'
+        )
+
+def iter_sheet_xml(ws, styles):
+    """워크시트 XML 조각 생성 (sheetData는 행 단위로 내보내 문서 전체를 메모리에 모으지 않음)"""
+    parts = [f'<worksheet xmlns="{SHEET_MAIN_NS}" xmlns:r="{REL_NS}">']
+    parts.append(tostring(ws.sheet_properties.to_tree()).decode('utf-8'))
+
+    if ws._cells:
+        rows = [row for row, _ in ws._cells]
+        cols = [col for _, col in ws._cells]
+        parts.append(f'<dimension ref="{get_column_letter(min(cols))}{min(rows)}:'
+                     f'{get_column_letter(max(cols))}{max(rows)}"/>')
+
+    parts.append(tostring(ws.views.to_tree()).decode('utf-8'))
+    parts.append('<sheetFormatPr baseColWidth="8" defaultRowHeight="15"/>')
+
+    widths = sorted(
+        (column_index_from_string(letter), dimension.width)
+        for letter, dimension in ws.column_dimensions.items() if dimension.width is not None
+    )
+    if widths:
+        parts.append('<cols>')
+        parts.extend(f'<col min="{col}" max="{col}" width="{format_number(width)}" customWidth="1"/>'
+                     for col, width in widths)
+        parts.append('</cols>')
+
+    # 행 단위로 셀 모으기
+    rows = {}
+    for (row, col), cell in ws._cells.items():
+        rows.setdefault(row, []).append((col, cell))
+    for row, dimension in ws.row_dimensions.items():
+        if dimension.height is not None:
+            rows.setdefault(row, [])
+
+    parts.append('<sheetData>')
+    yield ''.join(parts)
+
+    for row in sorted(rows):
+        height = ws.row_dimensions[row].height if row in ws.row_dimensions else None
+        row_attrs = f' ht="{format_number(height)}" customHeight="1"' if height is not None else ''
+        cells = sorted(rows[row], key=lambda item: item[0])
+        if cells:
+            yield (f'<row r="{row}"{row_attrs}>'
+                   + ''.join(cell_xml(cell, styles.get_xf_id(cell)) for _, cell in cells)
+                   + '</row>')
+        else:
+            yield f'<row r="{row}"{row_attrs}/>'
+
+    parts = ['</sheetData>']
+
+    if ws.merged_ranges:
+        parts.append(f'<mergeCells count="{len(ws.merged_ranges)}">')
+        parts.extend(
+            f'<mergeCell ref="{get_column_letter(c1)}{r1}:{get_column_letter(c2)}{r2}"/>'
+            for r1, c1, r2, c2 in ws.merged_ranges
+        )
+        parts.append('</mergeCells>')
+
+    parts.append(tostring(ws.print_options.to_tree()).decode('utf-8'))
+    parts.append(tostring(ws.page_margins.to_tree()).decode('utf-8'))
+    if ws.page_setup:
+        parts.append(tostring(ws.page_setup.to_tree()).decode('utf-8'))
+    if len(ws.row_breaks):
+        parts.append(tostring(ws.row_breaks.to_tree()).decode('utf-8'))
+
+    parts.append('</worksheet>')
+    yield ''.join(parts)
+
+def defined_names_xml(ws, sheet_index):
+    """시트의 인쇄 제목/인쇄 영역 정의"""
+    defined_names = []
+    sheet_ref = quote_sheetname(ws.title)
+    if ws.print_title_rows:
+        start, end = ws.print_title_rows.split(':')
+        defined_names.append(
+            f'<definedName name="_xlnm.Print_Titles" localSheetId="{sheet_index}">'
+            f'{escape(f"{sheet_ref}!${start}:${end}")}</definedName>'
+        )
+    if ws.print_area:
+        defined_names.append(
+            f'<definedName name="_xlnm.Print_Area" localSheetId="{sheet_index}">'
+            f'{escape(f"{sheet_ref}!{absolute_coordinate(ws.print_area)}")}</definedName>'
+        )
+    return defined_names
+
+def workbook_xml(worksheets):
+    """workbook.xml (시트 목록, 시트별 인쇄 영역/인쇄 제목 정의 포함)"""
+    sheets = ''.join(
+        f'<sheet name={quoteattr(ws.title)} sheetId="{index + 1}" state="visible" r:id="rId{index + 1}"/>'
+        for index, ws in enumerate(worksheets)
+    )
+    defined_names = [name for index, ws in enumerate(worksheets) for name in defined_names_xml(ws, index)]
+
+    return (
+        f'<workbook xmlns="{SHEET_MAIN_NS}" xmlns:r="{REL_NS}">'
+        '<workbookPr/><bookViews><workbookView activeTab="0"/></bookViews>'
+        f'<sheets>{sheets}</sheets>'
+        + (f'<definedNames>{"".join(defined_names)}</definedNames>' if defined_names else '')
+        + '<calcPr calcId="124519" fullCalcOnLoad="1"/></workbook>'
+    )
+
+def write_xlsx(workbook):
+    """
+    GridWorkbook을 xlsx 바이트로 저장
+
+    모든 시트가 하나의 StyleRegistry를 공유하므로 같은 스타일 조합은 styles.xml에 한 번만 들어간다.
+    """
+    worksheets = workbook.worksheets
+    styles = StyleRegistry()
+    sheet_count = len(worksheets)
+
+    with stage('save'):
+        now = datetime.now(timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ')
+        content_types = CONTENT_TYPES_XML.format(sheets=''.join(
+            SHEET_CONTENT_TYPE_XML.format(number=number) for number in range(1, sheet_count + 1)
+        ))
+        workbook_rels = WORKBOOK_RELS_XML.format(
+            sheets=''.join(SHEET_RELATIONSHIP_XML.format(number=number) for number in range(1, sheet_count + 1)),
+            styles_id=sheet_count + 1,
+            theme_id=sheet_count + 2
+        )
+
+        buffer = io.BytesIO()
+        with zipfile.ZipFile(buffer, 'w', zipfile.ZIP_DEFLATED) as archive:
+            archive.writestr('[Content_Types].xml', content_types)
+            archive.writestr('_rels/.rels', ROOT_RELS_XML)
+            archive.writestr('docProps/app.xml', APP_XML)
+            archive.writestr('docProps/core.xml', CORE_XML_TEMPLATE.format(now=now))
+            archive.writestr('xl/workbook.xml', workbook_xml(worksheets))
+            archive.writestr('xl/_rels/workbook.xml.rels', workbook_rels)
+            # 시트를 먼저 써야 사용된 스타일 조합이 모두 등록됨
+            for number, ws in enumerate(worksheets, start=1):
+                with archive.open(f'xl/worksheets/sheet{number}.xml', 'w') as sheet_file:
+                    for chunk in iter_sheet_xml(ws, styles):
+                        sheet_file.write(chunk.encode('utf-8'))
+            archive.writestr('xl/styles.xml', styles.to_xml())
+            archive.writestr('xl/theme/theme1.xml', theme_xml)
+        return buffer.getvalue()
+
+def create_advanced_business_trip_report_direct(employees_data, additional_costs):
+    """
+    출장복명서를 openpyxl 워크북 없이 직접 xlsx 바이트로 생성
+
+    create_advanced_business_trip_report_bytes와 같은 레이아웃 함수를 사용하므로 결과 배치는 동일하다.
+    """
+    wb = GridWorkbook("출장복명서")
+    with stage('populate'):
+        fill_advanced_business_trip_report(wb.active, employees_data, additional_costs)
+    return write_xlsx(wb)
+
+def create_business_trip_application_direct(application_data):
+    """출장신청서를 openpyxl 워크북 없이 직접 xlsx 바이트로 생성"""
+    wb = GridWorkbook("출장신청서")
+    with stage('populate'):
+        fill_business_trip_application(wb.active, application_data)
+    return write_xlsx(wb)